@@ -0,0 +1,239 @@
+import threading
+
+from PyQt5.QtCore import QElapsedTimer, QObject, QThread, QTimer, pyqtSignal
+from PyQt5.QtGui import QImage
+
+
+# Clip windows decoded ahead of the one playing
+PREFETCH_CLIPS = 4
+
+# Prefetched frames are downscaled to at most this width and kept as JPEG bytes
+_MAX_FRAME_WIDTH = 960
+_JPEG_QUALITY = 80
+
+# Upper bound on prefetched JPEG data; the clip being played is always decoded
+CLIP_CACHE_MAX_BYTES = 192 * 1024 * 1024
+
+# Display tick; frames are picked by elapsed wall time, so this only bounds jitter
+_TICK_MS = 10
+
+
+class ClipPrefetchThread(QThread):
+	"""Decodes upcoming clip windows into memory (JPEG frames) ahead of playback.
+
+	Always works on the lowest-numbered missing clip in [current, current + PREFETCH_CLIPS),
+	re-checking after each clip so jumps re-prioritise immediately. Clips ahead
+	of the current one are only decoded while the stored frames fit in
+	`max_bytes` (long merged spans can be minutes of video).
+	"""
+	clip_ready = pyqtSignal(int)
+
+	def __init__(self, video_path, clips, position_to_frame, max_bytes=CLIP_CACHE_MAX_BYTES):
+		super().__init__()
+		self.video_path = video_path
+		self.clips = clips
+		self.position_to_frame = position_to_frame
+		self.max_bytes = max_bytes
+		self._frames = {}
+		self._sizes = {}
+		self._bytes = 0
+		self._budget_full = False   # a clip ahead was abandoned for lack of room
+		self._current = 0
+		self._stopping = False
+		self._cond = threading.Condition()
+
+	def frames(self, index):
+		with self._cond:
+			return self._frames.get(index)
+
+	def set_current(self, index):
+		with self._cond:
+			self._current = index
+			# Drop clips outside the look-ahead window
+			keep = range(index, index + PREFETCH_CLIPS)
+			for stale in [i for i in self._frames if i not in keep]:
+				del self._frames[stale]
+				self._bytes -= self._sizes.pop(stale)
+			self._budget_full = False
+			self._cond.notify()
+
+	def stop(self):
+		with self._cond:
+			self._stopping = True
+			self._cond.notify()
+		self.wait()
+
+	def _next_missing(self):
+		with self._cond:
+			while not self._stopping:
+				for i in range(self._current, min(len(self.clips), self._current + PREFETCH_CLIPS)):
+					if i not in self._frames:
+						if i == self._current or not self._budget_full:
+							return i
+						break
+				self._cond.wait()
+			return None
+
+	def _wanted(self, index, pending_bytes=0):
+		with self._cond:
+			if self._stopping or not self._current <= index < self._current + PREFETCH_CLIPS:
+				return False
+			if index != self._current and self._bytes + pending_bytes > self.max_bytes:
+				# Waits for set_current to free the clips behind
+				self._budget_full = True
+				return False
+			return True
+
+	def run(self):
+		import cv2
+
+		cap = cv2.VideoCapture(self.video_path)
+		if not cap.isOpened():
+			return
+
+		while True:
+			index = self._next_missing()
+			if index is None:
+				break
+			clip = self.clips[index]
+			cap.set(cv2.CAP_PROP_POS_FRAMES, self.position_to_frame(clip["start"]))
+
+			frames = []
+			clip_bytes = 0
+			complete = False
+			while self._wanted(index, clip_bytes):
+				ok, frame = cap.read()
+				if not ok:
+					complete = True
+					break
+				pos = int(cap.get(cv2.CAP_PROP_POS_MSEC))
+				if pos >= clip["end"]:
+					complete = True
+					break
+				height, width = frame.shape[:2]
+				if width > _MAX_FRAME_WIDTH:
+					size = (_MAX_FRAME_WIDTH, int(round(height * _MAX_FRAME_WIDTH / width)))
+					frame = cv2.resize(frame, size, interpolation=cv2.INTER_AREA)
+				ok, data = cv2.imencode(".jpg", frame, [cv2.IMWRITE_JPEG_QUALITY, _JPEG_QUALITY])
+				if ok:
+					frames.append((pos, data.tobytes()))
+					clip_bytes += len(frames[-1][1])
+
+			with self._cond:
+				if self._stopping:
+					break
+				if not complete:
+					# Left the window or over budget; decoded again once it is wanted
+					continue
+				if self._current <= index < self._current + PREFETCH_CLIPS:
+					# An empty list still marks the clip as done (past the end of the video)
+					self._frames[index] = frames
+					self._sizes[index] = clip_bytes
+					self._bytes += clip_bytes
+			self.clip_ready.emit(index)
+
+		cap.release()
+
+
+class ClipReviewPlayer(QObject):
+	"""Plays prefetched clip windows from memory on the media player's frame overlay.
+
+	The real player stays paused; frames and positions are pushed through
+	MediaPlayer.show_external_frame so the overlay, PBP and event info follow.
+	"""
+	clip_finished = pyqtSignal(int)
+	position_shown = pyqtSignal(int)
+
+	def __init__(self, media_player, parent=None):
+		super().__init__(parent)
+		self.media_player = media_player
+		self._thread = None
+		self._index = None
+		self._frames = None
+		self._frame_pos = 0
+		self._last_shown = None
+		self._clock = QElapsedTimer()
+		self._timer = QTimer(self)
+		self._timer.setInterval(_TICK_MS)
+		self._timer.timeout.connect(self._tick)
+
+	def load(self, clips):
+		"""Start prefetching `clips` (dicts with start/end in ms) for a new review session."""
+		self.unload()
+		mp = self.media_player
+		# Decode whatever the player is showing (original or proxy)
+		path = mp.playback_path()
+		if not path or not clips:
+			return
+		self._thread = ClipPrefetchThread(path, clips, mp.main_window.position_to_frame)
+		self._thread.start()
+
+	def unload(self):
+		self.stop()
+		if self._thread is not None:
+			self._thread.stop()
+			self._thread = None
+
+	def is_playing(self):
+		return self._timer.isActive()
+
+	def play(self, index, start_at=None):
+		"""Play clip `index` from memory (from `start_at` ms if given).
+
+		Returns False (caller falls back to the player) if the clip is not prefetched.
+		"""
+		self.stop(release=False)
+		if self._thread is None:
+			return False
+		self._thread.set_current(index)
+		frames = self._thread.frames(index)
+		if start_at is not None and frames:
+			frames = [f for f in frames if f[0] >= start_at] or frames[-1:]
+		if not frames:
+			return False
+
+		self._index = index
+		self._frames = frames
+		self._frame_pos = -1
+		self._last_shown = None
+		self._clock.start()
+		self._tick()
+		self._timer.start()
+		return True
+
+	def stop(self, release=True):
+		was_playing = self._timer.isActive() or self._last_shown is not None
+		self._timer.stop()
+		self._index = None
+		self._frames = None
+		if release and was_playing:
+			# Seek the real player to where memory playback stopped
+			self.media_player.release_external_frame()
+		self._last_shown = None
+
+	def _tick(self):
+		mp = self.media_player
+		if self._last_shown is not None and mp.current_position() != self._last_shown:
+			# Someone else moved the player (seek, play, step): give up the overlay
+			self.stop(release=False)
+			return
+
+		rate = mp.media_player.playbackRate() or 1.0
+		target = self._frames[0][0] + self._clock.elapsed() * rate
+		pos = self._frame_pos
+		while pos + 1 < len(self._frames) and self._frames[pos + 1][0] <= target:
+			pos += 1
+		if pos != self._frame_pos:
+			self._frame_pos = pos
+			position, data = self._frames[pos]
+			image = QImage.fromData(data, "JPG")
+			self._last_shown = position
+			mp.show_external_frame(image, position)
+			self.position_shown.emit(position)
+
+		# Hold the last frame for one frame duration before reporting the clip done
+		frame_ms = mp.main_window.frame_duration_ms or mp.main_window.default_frame_duration_ms
+		if self._frame_pos >= len(self._frames) - 1 and target >= self._frames[-1][0] + frame_ms:
+			index = self._index
+			self._timer.stop()
+			self.clip_finished.emit(index)
@@ -7,6 +7,7 @@ from PyQt5.QtGui import QPalette
 from PyQt5.QtCore import Qt
 
 from utils.event_class import Event, ms_to_time
+from utils.edit_history import ADD, DELETE
 
 
 class Step(IntEnum):
@@ -236,13 +237,18 @@ class EventSelectionWindow(QMainWindow):
 				return
 
 			fourth_label = item.text()
-			position = self.main_window.media_player.media_player.position()
+			position = self.main_window.media_player.current_position()
 
+			# One undo step: the edited event's move and removal, then the new event
+			history_ops = []
 			if self.main_window.editing_event and self.main_window.edit_event_obj:
-				self.main_window.list_manager.delete_event(self.main_window.edit_event_obj)
+				old_event = self.main_window.edit_event_obj
+				history_ops.append(self.main_window._edit_move_op())
+				if self.main_window.list_manager.delete_event(old_event):
+					history_ops.append((DELETE, old_event))
 
 			note_text = self.note_input.text().strip() or None
-			self.main_window.list_manager.add_event(Event(
+			new_event = Event(
 				self.first_label,
 				self.main_window.half,
 				ms_to_time(position),
@@ -251,7 +257,10 @@ class EventSelectionWindow(QMainWindow):
 				fourth_label,
 				self.main_window.position_to_frame(position),
 				note=note_text,
-			))
+			)
+			self.main_window.list_manager.add_event(new_event)
+			history_ops.append((ADD, new_event))
+			self.main_window.list_manager.history.record(*history_ops)
 
 			self.main_window.list_display.display_list()
 
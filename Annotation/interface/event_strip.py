@@ -0,0 +1,187 @@
+import zlib
+from collections import OrderedDict
+
+from PyQt5.QtCore import Qt, QTimer
+from PyQt5.QtGui import QColor, QImage, QPainter, QPixmap
+from PyQt5.QtWidgets import QWidget
+
+STRIP_HEIGHT = 18
+_TICK_ROWS = 4          # top rows: colour of the most common label in each column
+_SLIDER_INSET = 6       # about half the slider handle, so the strip lines up with the groove
+_MIN_SPAN_MS = 2000     # deepest zoom
+_MAX_CACHED = 6         # rendered pixmaps kept for recent zoom levels / sizes
+_REDRAW_DELAY_MS = 50   # coalesce bursts of list edits into one re-render
+
+_BACKGROUND = (40, 40, 40, 255)
+_BAR_COLOR = (90, 160, 230, 255)
+
+
+def _label_color(label):
+	"""Stable, well-separated colour per label name."""
+	hue = zlib.crc32(str(label).encode("utf-8")) % 360
+	color = QColor.fromHsv(hue, 200, 235)
+	return color.red(), color.green(), color.blue()
+
+
+class EventDensityStrip(QWidget):
+	"""Per-label event ticks and a density histogram under the seek slider.
+
+	Counts live in an EventDensity that list edits update one event at a time;
+	a paint only blits a cached pixmap, re-rendered with NumPy when the counts,
+	zoom or size change. Wheel zooms around the cursor, double-click shows the
+	whole video again, click or drag seeks.
+	"""
+
+	def __init__(self, media_player):
+		super().__init__(media_player)
+		self.media_player = media_player
+		# numpy comes in with the density table, when the window is built rather than at import
+		from utils.event_density import EventDensity
+		self.density = EventDensity()
+		self.duration = 0
+		self._view = None           # (start_ms, end_ms) while zoomed in
+		self._position = 0
+		self._playhead_x = None
+		self._cache = OrderedDict()
+		self._palette = None
+		self._palette_version = None
+
+		self.setFixedHeight(STRIP_HEIGHT)
+		self.setContentsMargins(_SLIDER_INSET, 0, _SLIDER_INSET, 0)
+		self.setToolTip("Event density: click to seek, wheel to zoom, double-click to show the whole video")
+
+		self._redraw_timer = QTimer(self)
+		self._redraw_timer.setSingleShot(True)
+		self._redraw_timer.setInterval(_REDRAW_DELAY_MS)
+		self._redraw_timer.timeout.connect(self.update)
+
+	def set_duration(self, duration):
+		self.duration = max(0, int(duration))
+		self.density.set_duration(self.duration)
+		self._view = None
+		self.update()
+
+	def event_list_changed(self, kind, event):
+		"""ListManager listener: recount one event, or everything after a reload."""
+		if kind == "reset":
+			self.density.reset(self.media_player.main_window.list_manager.event_list, self.duration)
+			self._view = None
+		else:
+			self.density.update(event, 1 if kind == "add" else -1)
+		if not self._redraw_timer.isActive():
+			self._redraw_timer.start()
+
+	def set_position(self, position, frame=None):
+		"""Position-tick subscriber: repaint only when the playhead moves to another column."""
+		self._position = position
+		x = self._x_for(position)
+		if x != self._playhead_x:
+			self._playhead_x = x
+			self.update()
+
+	def _full_range(self):
+		return 0, max(self.duration, len(self.density) * self.density.bin_ms)
+
+	def _view_range(self):
+		return self._view if self._view is not None else self._full_range()
+
+	def _x_for(self, position):
+		start, end = self._view_range()
+		rect = self.contentsRect()
+		if end <= start or not start <= position <= end:
+			return None
+		return rect.x() + int((position - start) * rect.width() / (end - start))
+
+	def _position_at(self, x):
+		start, end = self._view_range()
+		rect = self.contentsRect()
+		frac = min(1.0, max(0.0, (x - rect.x()) / max(1, rect.width())))
+		return int(start + frac * (end - start))
+
+	def _palette_for_rows(self):
+		import numpy as np
+
+		if self._palette_version != len(self.density.labels):
+			colors = [_label_color(label) for label in self.density.labels]
+			self._palette = np.array(colors, dtype=np.uint8).reshape(-1, 3)
+			self._palette_version = len(self.density.labels)
+		return self._palette
+
+	def _render(self, start, end, width, height):
+		import numpy as np
+
+		image = np.empty((height, width, 4), dtype=np.uint8)
+		image[:] = _BACKGROUND
+		columns = self.density.columns(start, end, width)
+		total = columns.sum(axis=0) if columns.size else np.zeros(width)
+		peak = total.max() if total.size else 0
+		if peak > 0:
+			# Square-root scale so sparse stretches stay visible next to busy ones
+			bar_height = height - _TICK_ROWS
+			heights = np.ceil(np.sqrt(total / peak) * bar_height)
+			from_bottom = np.arange(bar_height)[::-1, None]
+			image[_TICK_ROWS:][from_bottom < heights[None, :]] = _BAR_COLOR
+
+			has_events = total > 0
+			dominant = columns.argmax(axis=0)
+			image[:_TICK_ROWS, has_events, :3] = self._palette_for_rows()[dominant[has_events]]
+
+		qimage = QImage(image.data, width, height, width * 4, QImage.Format_RGBA8888)
+		return QPixmap.fromImage(qimage.copy())
+
+	def _pixmap(self, start, end, width, height):
+		key = (self.density.version, start, end, width, height)
+		pixmap = self._cache.get(key)
+		if pixmap is not None:
+			self._cache.move_to_end(key)
+			return pixmap
+		# Pixmaps of older counts are stale
+		for stale in [k for k in self._cache if k[0] != self.density.version]:
+			del self._cache[stale]
+		pixmap = self._cache[key] = self._render(start, end, width, height)
+		while len(self._cache) > _MAX_CACHED:
+			self._cache.popitem(last=False)
+		return pixmap
+
+	def paintEvent(self, event):
+		painter = QPainter(self)
+		painter.fillRect(self.rect(), QColor(*_BACKGROUND))
+		rect = self.contentsRect()
+		start, end = self._view_range()
+		if end <= start or rect.width() <= 0 or rect.height() <= _TICK_ROWS:
+			return
+		painter.drawPixmap(rect.topLeft(), self._pixmap(start, end, rect.width(), rect.height()))
+		x = self._x_for(self._position)
+		if x is not None:
+			painter.setPen(QColor(255, 80, 80))
+			painter.drawLine(x, rect.top(), x, rect.bottom())
+
+	def mousePressEvent(self, event):
+		if event.button() == Qt.LeftButton and self.duration:
+			self.media_player.set_position(min(self.duration, self._position_at(event.pos().x())))
+
+	def mouseMoveEvent(self, event):
+		if event.buttons() & Qt.LeftButton and self.duration:
+			self.media_player.set_position(min(self.duration, self._position_at(event.pos().x())))
+
+	def mouseDoubleClickEvent(self, event):
+		self._view = None
+		self.update()
+
+	def wheelEvent(self, event):
+		notches = event.angleDelta().y() / 120.0
+		full_start, full_end = self._full_range()
+		full_span = full_end - full_start
+		if not notches or full_span <= 0:
+			return
+		start, end = self._view_range()
+		anchor = self._position_at(event.pos().x())
+		frac = (anchor - start) / max(1, end - start)
+		span = min(full_span, max(_MIN_SPAN_MS, int((end - start) / (2.0 ** notches))))
+		if span >= full_span:
+			self._view = None
+		else:
+			new_start = min(max(0, int(anchor - frac * span)), full_end - span)
+			self._view = (new_start, new_start + span)
+		self.update()
+		event.accept()
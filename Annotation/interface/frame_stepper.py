@@ -0,0 +1,186 @@
+import threading
+from collections import OrderedDict
+
+from PyQt5.QtCore import QObject, QThread, pyqtSignal
+from PyQt5.QtGui import QImage
+
+
+# Frames kept decoded around the paused position (before / after it)
+_WINDOW_BEHIND = 40
+_WINDOW_AHEAD = 60
+
+# Decoded frames are downscaled to at most this width before caching
+_MAX_FRAME_WIDTH = 960
+
+# Upper bound on cached pixel data (RGB888)
+FRAME_CACHE_MAX_BYTES = 192 * 1024 * 1024
+
+
+class FrameRingBuffer:
+	"""Decoded frames keyed by frame number, bounded by total bytes.
+
+	When full, the frames farthest from the current centre are evicted first,
+	so the buffer always holds a contiguous-ish window around the paused frame.
+	Thread-safe: filled by the decoder thread, read by the GUI thread.
+	"""
+
+	def __init__(self, max_bytes=FRAME_CACHE_MAX_BYTES):
+		self.max_bytes = max_bytes
+		self._frames = OrderedDict()
+		self._bytes = 0
+		self._center = 0
+		self._lock = threading.Lock()
+
+	def __contains__(self, frame):
+		with self._lock:
+			return frame in self._frames
+
+	def get(self, frame):
+		with self._lock:
+			return self._frames.get(frame)
+
+	def set_center(self, frame):
+		with self._lock:
+			self._center = frame
+
+	def put(self, frame, image):
+		with self._lock:
+			if frame in self._frames:
+				return
+			self._frames[frame] = image
+			self._bytes += image.sizeInBytes()
+			while self._bytes > self.max_bytes and len(self._frames) > 1:
+				farthest = max(self._frames, key=lambda f: abs(f - self._center))
+				self._bytes -= self._frames.pop(farthest).sizeInBytes()
+
+	def clear(self):
+		with self._lock:
+			self._frames.clear()
+			self._bytes = 0
+
+
+class FrameDecodeThread(QThread):
+	"""Background OpenCV decoder that fills a FrameRingBuffer around a requested frame.
+
+	Each request decodes forward from the centre first (the common stepping
+	direction), then the frames behind it, with one seek per pass.
+	"""
+	frame_ready = pyqtSignal(int)
+
+	def __init__(self, video_path, ring_buffer):
+		super().__init__()
+		self.video_path = video_path
+		self.ring_buffer = ring_buffer
+		self._request = None
+		self._stopping = False
+		self._cond = threading.Condition()
+
+	def request(self, center_frame):
+		with self._cond:
+			self._request = center_frame
+			self._cond.notify()
+
+	def stop(self):
+		with self._cond:
+			self._stopping = True
+			self._cond.notify()
+		self.wait()
+
+	def _next_request(self):
+		with self._cond:
+			while self._request is None and not self._stopping:
+				self._cond.wait()
+			center, self._request = self._request, None
+			return center
+
+	def _superseded(self, low, high):
+		# A newer request outside the window being decoded cancels the current pass
+		with self._cond:
+			return self._stopping or (
+				self._request is not None and not low <= self._request <= high
+			)
+
+	def run(self):
+		import cv2
+
+		cap = cv2.VideoCapture(self.video_path)
+		if not cap.isOpened():
+			return
+		next_index = None
+
+		while True:
+			center = self._next_request()
+			if center is None:
+				break
+
+			low = max(0, center - _WINDOW_BEHIND)
+			high = center + _WINDOW_AHEAD
+			for start, end in ((center, high), (low, center - 1)):
+				missing = [f for f in range(start, end + 1) if f not in self.ring_buffer]
+				if not missing:
+					continue
+
+				if next_index != missing[0]:
+					cap.set(cv2.CAP_PROP_POS_FRAMES, missing[0])
+				frame_no = missing[0]
+				while frame_no <= missing[-1]:
+					if self._superseded(low, high):
+						break
+					ok, frame = cap.read()
+					if not ok:
+						break
+					if frame_no not in self.ring_buffer:
+						self.ring_buffer.put(frame_no, self._to_image(cv2, frame))
+						self.frame_ready.emit(frame_no)
+					frame_no += 1
+				next_index = frame_no
+
+				if self._superseded(low, high):
+					break
+
+			if self._stopping:
+				break
+
+		cap.release()
+
+	def _to_image(self, cv2, frame):
+		height, width = frame.shape[:2]
+		if width > _MAX_FRAME_WIDTH:
+			height = int(round(height * _MAX_FRAME_WIDTH / width))
+			width = _MAX_FRAME_WIDTH
+			frame = cv2.resize(frame, (width, height), interpolation=cv2.INTER_AREA)
+		rgb = cv2.cvtColor(frame, cv2.COLOR_BGR2RGB)
+		return QImage(rgb.data, width, height, 3 * width, QImage.Format_RGB888).copy()
+
+
+class FrameStepper(QObject):
+	"""Serves paused frame steps from a decoded ring buffer instead of player seeks."""
+
+	def __init__(self, parent=None):
+		super().__init__(parent)
+		self.ring_buffer = FrameRingBuffer()
+		self._thread = None
+
+	def attach(self, video_path):
+		self.detach()
+		self._thread = FrameDecodeThread(video_path, self.ring_buffer)
+		self._thread.start()
+
+	def detach(self):
+		if self._thread is not None:
+			self._thread.stop()
+			self._thread = None
+		self.ring_buffer.clear()
+
+	def prefetch(self, frame):
+		"""Recentre the decode window on `frame` without showing anything."""
+		if self._thread is None:
+			return
+		self.ring_buffer.set_center(frame)
+		self._thread.request(frame)
+
+	def frame(self, frame):
+		"""Return the cached QImage for `frame` (or None) and recentre the window on it."""
+		image = self.ring_buffer.get(frame)
+		self.prefetch(frame)
+		return image
@@ -7,6 +7,10 @@ from PyQt5.QtCore import Qt, QStringListModel, QEvent, QTimer
 from PyQt5.QtMultimedia import QMediaPlayer
 from PyQt5.QtGui import QFont
 
+from interface.clip_review import ClipReviewPlayer
+from utils import perf
+from utils.clip_planner import plan_clip_spans, row_at
+
 
 class EventTable(QTableWidget):
 	"""QTableWidget with a setCurrentRow helper that matches QListWidget's API."""
@@ -32,6 +36,8 @@ class ListDisplay(QWidget):
 		self._typed_text = ""
 		self._committed_action = ""
 		self._visible_events = []
+		# List filter the media player's pause queue was last built for
+		self._pause_queue_filter = None
 
 		# Help dialog refs/state (for expand/shrink)
 		self._help_dialog = None
@@ -42,6 +48,8 @@ class ListDisplay(QWidget):
 		self._help_hotkeys_search = None
 		self._help_expanded = None
 		self._help_hotkeys_target_rows = 5
+		# Help HTML per mode, built the first time the help dialog is opened in that mode
+		self._help_html_cache = {}
 
 		# Completer model (action types only)
 		self._actions_model = QStringListModel()
@@ -155,9 +163,21 @@ class ListDisplay(QWidget):
 		self._clip_pause_timer = QTimer(self)
 		self._clip_pause_timer.setSingleShot(True)
 		self._clip_pause_timer.timeout.connect(self._play_next_clip)
+		# Pause between clips (ms); 0 plays them back-to-back
+		self.clip_gap_ms = 0
+
+		# Upcoming clips are pre-decoded and played from memory when ready
+		self.clip_player = ClipReviewPlayer(self.main_window.media_player, self)
+		self.clip_player.clip_finished.connect(self._on_memory_clip_finished)
+		self.clip_player.position_shown.connect(self._sync_clip_highlight)
+		self._clip_highlight_row = None
 		self.list_widget.itemDoubleClicked.connect(self._on_event_double_clicked)
 
-		self.main_window.media_player.media_player.positionChanged.connect(self._handle_position_update)
+		position_ticks = self.main_window.media_player.position_ticks
+		position_ticks.subscribe(self._handle_position_update)
+		# Row highlights follow the playing clip, so clips need the fast tick rate
+		position_ticks.add_fast_condition(lambda: self._playing_clips)
+		self.main_window.media_player.stop_scheduler.add_source(self._next_clip_stop)
 
 	def _on_event_clicked(self, model_index):
 		row = model_index.row()
@@ -191,6 +211,7 @@ class ListDisplay(QWidget):
 		self.main_window.media_player.set_position(event.position)
 		self.main_window.setFocus()
 
+	@perf.timed("display_list")
 	def display_list(self, events=None):
 		self._stop_clip_sequence()
 		if events is None:
@@ -218,7 +239,10 @@ class ListDisplay(QWidget):
 			self.list_widget.setItem(idx, 0, frame_item)
 			self.list_widget.setItem(idx, 1, action_item)
 
-		self.main_window.media_player.refresh_event_pause_queue(events=list(self._visible_events))
+		if self._pause_queue_filter != self._committed_action:
+			# The pause queue follows the list filter; adds, deletes and moves reach it incrementally
+			self._pause_queue_filter = self._committed_action
+			self.main_window.media_player.rebuild_event_pause_queue()
 
 	def highlight_event_by_frame(self, frame):
 		for idx, event in enumerate(self._visible_events):
@@ -318,31 +342,21 @@ class ListDisplay(QWidget):
 
 		self._playing_clips = True
 		self._current_clip_index = 0
+		self.main_window.media_player.position_ticks.update_interval()
 		self.play_clips_button.setText("Stop Viewing Clips")
 		self._update_clip_nav_buttons()
+		self.clip_player.load(self._clip_sequence)
 		self._play_next_clip()
 
 	def _build_clip_sequence(self, events):
+		# Overlapping windows become one span; rows switch inside it (see _sync_clip_highlight)
 		if not events:
 			return []
 		duration = self.main_window.media_player.media_player.duration()
-		indexed = [
-			(idx, event)
-			for idx, event in enumerate(events)
-			if getattr(event, "position", None) is not None
-		]
-		indexed.sort(key=lambda pair: getattr(pair[1], "position", 0))
-		sequence = []
-		for idx, event in indexed:
-			position = int(getattr(event, "position"))
-			start = max(0, position - 2000)
-			end = position + 4000
-			if duration and end > duration:
-				end = duration
-			if end <= start:
-				continue
-			sequence.append({"row": idx, "start": start, "end": end})
-		return sequence
+		return plan_clip_spans(
+			((idx, getattr(event, "position", None)) for idx, event in enumerate(events)),
+			duration=duration,
+		)
 
 	def _step_clip(self, delta):
 		if not self._playing_clips or not self._clip_sequence:
@@ -354,31 +368,71 @@ class ListDisplay(QWidget):
 		self._current_clip_index = target
 		self._play_next_clip()
 
-	def _play_next_clip(self):
+	def _play_next_clip(self, start_at=None):
 		self._clip_pause_timer.stop()
 		if not self._playing_clips or self._current_clip_index >= len(self._clip_sequence):
 			self._stop_clip_sequence()
 			return
 
 		clip = self._clip_sequence[self._current_clip_index]
-		self.list_widget.setCurrentRow(clip["row"])
 		start, end = clip["start"], clip["end"]
-		self.main_window.media_player.set_position(start)
+		if start_at is not None:
+			start = max(start, min(start_at, end - 1))
+
+		self._clip_highlight_row = None
+		self._sync_clip_highlight(start)
 
-		self._current_clip_end = end
-		event = self._visible_events[clip["row"]]
-		self._update_event_info(event)
 		player = self.main_window.media_player.media_player
-		player.play()
+		if self.clip_player.play(self._current_clip_index, start_at=start):
+			# Served from memory; the real player stays paused
+			player.pause()
+			self._current_clip_end = None
+		else:
+			self.main_window.media_player.set_position(start)
+			self._current_clip_end = end
+			player.play()
+
 		self.main_window.setFocus()
 		self._update_clip_nav_buttons()
 
+	def _sync_clip_highlight(self, position):
+		"""Select the event whose window `position` is in, within the current span."""
+		if not self._playing_clips or self._current_clip_index >= len(self._clip_sequence):
+			return
+		row = row_at(self._clip_sequence[self._current_clip_index], position)
+		if row == self._clip_highlight_row or row >= len(self._visible_events):
+			return
+		self._clip_highlight_row = row
+		self.list_widget.setCurrentRow(row)
+		self._update_event_info(self._visible_events[row])
+
+	def _advance_after_clip(self):
+		if not self._clip_loop_enabled:
+			self._current_clip_index += 1
+		self._current_clip_end = None
+
+		if self._current_clip_index >= len(self._clip_sequence):
+			self._stop_clip_sequence()
+			return
+
+		if self.clip_gap_ms > 0:
+			self._clip_pause_timer.start(self.clip_gap_ms)
+		else:
+			self._play_next_clip()
+
+	def _on_memory_clip_finished(self, index):
+		if not self._playing_clips or index != self._current_clip_index:
+			return
+		self._advance_after_clip()
+
 	def _stop_clip_sequence(self):
 		self._clip_pause_timer.stop()
+		self.clip_player.unload()
 		self._match_stop_state()
 
 	def _match_stop_state(self):
 		self._playing_clips = False
+		self.main_window.media_player.position_ticks.update_interval()
 		self._clip_sequence = []
 		self._current_clip_index = 0
 		self._current_clip_end = None
@@ -402,7 +456,8 @@ class ListDisplay(QWidget):
 	def _update_event_info(self, event):
 		self.main_window.media_player.display_event_info(event)
 
-	def _handle_position_update(self, position):
+	@perf.timed("list_position_update")
+	def _handle_position_update(self, position, frame=None):
 		if not self._playing_clips or self._current_clip_end is None:
 			return
 
@@ -410,17 +465,18 @@ class ListDisplay(QWidget):
 		if player.state() != QMediaPlayer.PlayingState:
 			return
 
+		self._sync_clip_highlight(position)
 		if position >= self._current_clip_end:
-			player.pause()
-			if not self._clip_loop_enabled:
-				self._current_clip_index += 1
-			self._current_clip_end = None
+			self._stop_at_clip_end()
 
-			if self._current_clip_index >= len(self._clip_sequence):
-				self._stop_clip_sequence()
-				return
+	def _next_clip_stop(self):
+		if not self._playing_clips or self._current_clip_end is None:
+			return None
+		return self._current_clip_end, self._stop_at_clip_end
 
-			self._clip_pause_timer.start(1000)
+	def _stop_at_clip_end(self, target=None):
+		self.main_window.media_player.media_player.pause()
+		self._advance_after_clip()
 
 	def _jump_to_clip_for_row(self, row):
 		target = self._find_clip_index_for_row(row)
@@ -428,15 +484,19 @@ class ListDisplay(QWidget):
 			return
 
 		self._clip_pause_timer.stop()
+		self.clip_player.stop(release=False)
 		player = self.main_window.media_player.media_player
 		player.pause()
 		self._current_clip_end = None
 		self._current_clip_index = target
-		self._play_next_clip()
+		# Start at the clicked event's own window, even mid-span
+		clip = self._clip_sequence[target]
+		start_at = clip["row_starts"][row]
+		self._play_next_clip(start_at=start_at)
 
 	def _find_clip_index_for_row(self, row):
 		for idx, clip in enumerate(self._clip_sequence):
-			if clip["row"] == row:
+			if row in clip["rows"]:
 				return idx
 		return None
 
@@ -447,6 +507,12 @@ class ListDisplay(QWidget):
 		target = self._committed_action.strip().lower()
 		return [e for e in events if str(getattr(e, "label", None)).strip().lower() == target]
 
+	def passes_filter(self, event):
+		"""Whether `event` is shown under the current action filter (see _filter_events)."""
+		if not self._committed_action:
+			return True
+		return str(getattr(event, "label", None)).strip().lower() == self._committed_action.strip().lower()
+
 	def eventFilter(self, obj, event):
 		if obj is self.search_input and event.type() == QEvent.MouseButtonPress:
 			self.main_window._end_edit_event(keep_focus=True)
@@ -594,7 +660,7 @@ class ListDisplay(QWidget):
 						<li>Use Left/Right (with Shift/Command modifiers) to fine-tune the locked frame.</li>
 						<li>Press <b>Enter</b> to lock it in and return to normal playback.</li>
 						<li>Press <b>Command + Enter</b> to reopen Event Selection.</li>
-						<li>Press <b>Esc</b> to cancel editing and revert the previous annotation.</li>
+						<li>Press <b>Esc</b> (or <b>Command + Z</b>) to cancel editing and revert the previous annotation.</li>
 					</ul>
 				</div>
 			</div>
@@ -625,6 +691,11 @@ class ListDisplay(QWidget):
 					<li>Click <b>Open Video</b> to load <code>1.mov</code> with <code>Labels-v2.json</code> in the same folder.</li>
 					<li>Space toggles play/pause. Arrow keys step. Use modifiers for bigger jumps (Shift = 5 frames, Command = 10, Shift+Command = 50).</li>
 					<li>Playback speed: A = 1x speed, Z = 2x, E = 4x, S = 1/2x.</li>
+					<li>Fast scan: F5 = 8x, F6 = 16x, F7 = 32x. Only keyframes are shown; Pause at Tags still stops on the exact frame.</li>
+					<li><b>]</b> / <b>[</b> jump to the next / previous camera cut, <b>.</b> to the next high-motion stretch. <b>Command + M</b> skips low-motion stretches (timeouts, dead ball) while playing. The motion index is built in the background the first time a video is opened.</li>
+					<li>F9 toggles the performance HUD (hot-path latencies and dropped frames).</li>
+					<li>The strip under the seek slider shows where events are (top ticks: most common label). Click it to seek, scroll to zoom, double-click to zoom out.</li>
+					<li><b>Command + Z</b> undoes the last add, delete or move; <b>Command + Shift + Z</b> redoes it.</li>
 				</ul>
 			</div>
 		</div>
@@ -653,7 +724,7 @@ class ListDisplay(QWidget):
 			<div class="cardTitle">Bottom Bar Controls</div>
 			<div class="cardBody">
 				<ul>
-					<li>The playback speed can be set to 1x, 2x, 4x, or 1/2x using the buttons.</li>
+					<li>The playback speed can be set to 1/2x, 1x, 2x, 4x, or (keyframe scan) 8x, 16x, 32x using the speed menu.</li>
 					<li><b>Play/Pause</b> button toggles the video playback.</li>
 					<li><b>Pause at Tags</b> button pauses the video at the tags in the video.</li>
 					<li><b>Choose Pause Actions</b> button allows you to choose the actions to pause the video at when using the <b>Pause at Tags</b> button.</li>
@@ -712,7 +783,11 @@ class ListDisplay(QWidget):
 		body = QTextBrowser(card)
 		body.setOpenExternalLinks(True)
 		body.setObjectName("helpBody")
-		body.setHtml(self._build_static_help_html())
+		mode = self._help_subtitle()
+		html = self._help_html_cache.get(mode)
+		if html is None:
+			html = self._help_html_cache[mode] = self._build_static_help_html()
+		body.setHtml(html)
 		card_layout.addWidget(body, 1)
 
 		self._help_instructions_card = card
@@ -1,11 +1,10 @@
 from re import M
 from PyQt5.QtWidgets import (
 	QMainWindow, QWidget, QHBoxLayout, QMessageBox, QApplication, QStyle,
-	QDialog, QVBoxLayout, QRadioButton, QButtonGroup, QDialogButtonBox, QLabel, QFrame
+	QDialog, QVBoxLayout, QRadioButton, QButtonGroup, QDialogButtonBox, QLabel, QFrame, QCheckBox
 )
 from PyQt5.QtGui import QPalette, QIcon, QPixmap, QPainter, QColor
 from PyQt5.QtCore import Qt, QTimer
-from PyQt5.QtMultimedia import QMediaPlayer
 
 LIGHT_STYLESHEET = """
 QWidget {
@@ -280,7 +279,9 @@ try:
 except Exception:
 	PBPDisplay = None
 from utils.list_management import ListManager
-from utils.event_class import Event, ms_to_time
+from utils.edit_history import DELETE, move_op
+from utils.event_class import Event
+from utils import perf, startup_profile
 
 class MainWindow(QMainWindow):
 	QUICK_LABEL_COMBOS = {
@@ -432,6 +433,10 @@ class MainWindow(QMainWindow):
 		self.default_frame_duration_ms = 40.0
 		self.frame_duration_ms = self.default_frame_duration_ms
 		self.video_frame_rate = None
+		# Exact per-frame timestamps of the open video (None until indexed)
+		self.frame_timeline = None
+		# Input recorder for --record-session (see interface/session_recorder.py)
+		self.session_recorder = None
 
 		self.half = 1
 		self.dark_mode = False
@@ -443,6 +448,13 @@ class MainWindow(QMainWindow):
 		self._combo_timer.timeout.connect(self._clear_combo_prefix)
 		self._pending_combo = None
 
+		# Edit-mode nudges accumulated from auto-repeated arrow keys
+		self._pending_nudge_ms = 0
+		self._pending_nudge_step_ms = 0
+		self._nudge_timer = QTimer(self)
+		self._nudge_timer.setSingleShot(True)
+		self._nudge_timer.timeout.connect(self._flush_edit_nudge)
+
 		# Defining some variables of the window
 		self.title_main_window = "Event Annotator"
 
@@ -472,19 +484,26 @@ class MainWindow(QMainWindow):
 	def init_main_window(self):
 
 		# Add the media player
-		self.media_player = MediaPlayer(self)
+		with startup_profile.span("MediaPlayer()"):
+			self.media_player = MediaPlayer(self)
 		video_display = QWidget(self)
 		video_display.setLayout(self.media_player.layout)
 
 		# Create the list manager and corresponding display
 		self.list_manager = ListManager()
-		self.list_display = ListDisplay(self)
+		self.list_manager.frame_for_position = self.position_to_frame
+		self.list_manager.add_listener(self.media_player.event_list_changed)
+		self.list_manager.add_listener(self.media_player.event_strip.event_list_changed)
+		with startup_profile.span("ListDisplay()"):
+			self.list_display = ListDisplay(self)
 
 		# Create the PBP display (hidden until a video with pbp.csv is opened)
-		self.pbp_display = PBPDisplay(self) if PBPDisplay else None
+		with startup_profile.span("PBPDisplay()"):
+			self.pbp_display = PBPDisplay(self) if PBPDisplay else None
 
 		# Create the Event selection Window
-		self.event_window = EventSelectionWindow(self)
+		with startup_profile.span("EventSelectionWindow()"):
+			self.event_window = EventSelectionWindow(self)
 
 		self.list_display.display_list()
 
@@ -505,12 +524,36 @@ class MainWindow(QMainWindow):
 
 		central_display.setLayout(main_layout)
 
+	@perf.timed("keyPressEvent")
 	def keyPressEvent(self, event):
 		ctrl = False
+		perf.begin("key_to_repaint")
 
 		if self._handle_multi_key_combo(event):
 			return
 
+		if event.key() == Qt.Key_F9:
+			self.media_player.perf_hud.toggle()
+			return
+
+		# Undo / redo: Ctrl+Z, Ctrl+Shift+Z or Ctrl+Y (Command on macOS)
+		if event.modifiers() & Qt.ControlModifier and event.key() in (Qt.Key_Z, Qt.Key_Y):
+			self._undo_edit(redo=event.key() == Qt.Key_Y or bool(event.modifiers() & Qt.ShiftModifier))
+			return
+
+		# Motion index: ] / [ next / previous camera cut, . next high-motion stretch, Ctrl+M skip still stretches
+		if event.key() in (Qt.Key_BracketRight, Qt.Key_BracketLeft, Qt.Key_Period) and not self.editing_event:
+			if self.media_player.play_button.isEnabled():
+				if event.key() == Qt.Key_Period:
+					self.media_player.jump_to_high_motion()
+				else:
+					self.media_player.jump_to_cut(1 if event.key() == Qt.Key_BracketRight else -1)
+			self.setFocus()
+			return
+		if event.modifiers() & Qt.ControlModifier and event.key() == Qt.Key_M:
+			self.media_player.set_skip_low_motion(not self.media_player.skip_low_motion)
+			return
+
 
 		# Edit-mode: Left/Right moves the locked event timestamp
 		if self.editing_event and event.key() in (Qt.Key_Left, Qt.Key_Right):
@@ -524,51 +567,13 @@ class MainWindow(QMainWindow):
 			step_ms = self._frame_step_ms_with_modifiers(event)
 			delta = -step_ms if event.key() == Qt.Key_Left else step_ms
 
-			old_pos = int(self.edit_event_obj.position)
-			new_pos = max(0, old_pos + int(delta))
-
-			duration = self.media_player.media_player.duration()
-			if duration and duration > 0:
-				new_pos = min(new_pos, duration)
-
-			attempts = 0
-			while attempts < 1000:
-				new_frame = self.position_to_frame(new_pos)
-				if not self.list_manager.find_event_by_frame(new_frame, self.half, exclude=self.edit_event_obj):
-					break
-
-				if delta > 0:
-					if duration and new_pos >= duration:
-						new_pos = duration
-						break
-					new_pos = max(0, new_pos + step_ms)
-					if duration and new_pos > duration:
-						new_pos = duration
-						break
-				else:
-					if new_pos <= 0:
-						new_pos = 0
-						break
-					new_pos = max(0, new_pos - step_ms)
-
-				attempts += 1
-
-			# Update the object in-place, then resort list
-			self.edit_event_obj.position = new_pos
-			self.edit_event_obj.time = ms_to_time(new_pos)
-			self.edit_event_obj.frame = self.position_to_frame(new_pos)
-			self.list_manager.sort_list()
-
-			# Refresh UI + keep the edited event highlighted
-			self.list_display.display_list()
-			try:
-				new_row = self.list_manager.event_list.index(self.edit_event_obj)
-				self.list_display.list_widget.setCurrentRow(new_row)
-			except ValueError:
-				pass
-
-			# Seek video to new timestamp (feedback)
-			self.media_player.set_position(new_pos)
+			# Auto-repeat (held arrow): accumulate and apply once per frame interval
+			self._pending_nudge_ms += delta
+			self._pending_nudge_step_ms = step_ms
+			if not event.isAutoRepeat():
+				self._flush_edit_nudge()
+			elif not self._nudge_timer.isActive():
+				self._nudge_timer.start(max(1, int(round(self.frame_duration_ms or self.default_frame_duration_ms))))
 
 			self.setFocus()
 			return
@@ -583,7 +588,12 @@ class MainWindow(QMainWindow):
 				else:
 					target_event = self.list_manager.get_event(index)
 				if target_event:
+					# The edit in progress (of this or another event) becomes its own undo step first
+					if self.editing_event:
+						self._flush_edit_nudge()
+						self.list_manager.history.record(self._edit_move_op())
 					self.list_manager.delete_event(target_event)
+					self.list_manager.history.record((DELETE, target_event))
 					self.list_display.display_list()
 					path_label = self.media_player.get_last_label_file()
 					self.list_manager.save_file(path_label, self.half)
@@ -596,22 +606,22 @@ class MainWindow(QMainWindow):
 				self.media_player.play_video()
 				self.setFocus()
 
-		# Move one frame backwards in time
+		# Move one frame backwards in time (served from the decoded-frame cache when paused)
 		if event.key() == Qt.Key_Left:
 			if self.media_player.play_button.isEnabled():
-				position = self.media_player.media_player.position()
-				step = self._frame_step_ms_with_modifiers(event)
-				if position > step:
-					self.media_player.media_player.setPosition(position - step)
+				position = self.media_player.current_position()
+				target = self.shift_position_by_frames(position, -self._frame_step_with_modifiers(event))
+				if target > 0:
+					self.media_player.step_to(target)
 			self.setFocus()
 		
 		if event.key() == Qt.Key_Right:
 			if self.media_player.play_button.isEnabled():
-				position = self.media_player.media_player.position()
+				position = self.media_player.current_position()
 				duration = self.media_player.media_player.duration()
-				step = self._frame_step_ms_with_modifiers(event)
-				if position < duration - step:
-					self.media_player.media_player.setPosition(position + step)
+				target = self.shift_position_by_frames(position, self._frame_step_with_modifiers(event))
+				if target < duration:
+					self.media_player.step_to(target)
 			self.setFocus()
 
 		# Enter: when viewing clips, stop and start editing; otherwise lock timestamp, edit label, or open new annotation
@@ -629,6 +639,8 @@ class MainWindow(QMainWindow):
 
 			# Enter in edit mode: save and exit edit mode
 			if self.editing_event:
+				self._flush_edit_nudge()
+				self.list_manager.history.record(self._edit_move_op())
 				if self.media_player.play_button.isEnabled():
 					path_label = self.media_player.get_last_label_file()
 					self.list_manager.save_file(path_label, self.half)
@@ -636,7 +648,7 @@ class MainWindow(QMainWindow):
 				return
 
 			# Enter when not editing: open new annotation
-			if self.media_player.play_button.isEnabled() and not self.media_player.media_player.state() == QMediaPlayer.PlayingState:
+			if self.media_player.play_button.isEnabled() and not self.media_player.is_playing():
 				self._open_event_window_with_label(None)
 			return
 
@@ -661,6 +673,11 @@ class MainWindow(QMainWindow):
 			self.media_player.set_playback_rate(0.5)
 			self.setFocus()
 
+		# Keyframe scan at x8 / x16 / x32
+		if event.key() in (Qt.Key_F5, Qt.Key_F6, Qt.Key_F7):
+			self.media_player.set_playback_rate({Qt.Key_F5: 8.0, Qt.Key_F6: 16.0, Qt.Key_F7: 32.0}[event.key()])
+			self.setFocus()
+
 		if event.key() == Qt.Key_Escape:
 			if self.editing_event:
 				self._revert_edit_event()
@@ -679,6 +696,52 @@ class MainWindow(QMainWindow):
 				path_label = self.media_player.get_last_label_file()
 				self.list_manager.save_file(path_label, self.half)
 
+	def _flush_edit_nudge(self):
+		"""Apply the accumulated edit-mode nudge: one occupancy lookup, one list redraw, one seek."""
+		self._nudge_timer.stop()
+		delta = self._pending_nudge_ms
+		step_ms = self._pending_nudge_step_ms
+		self._pending_nudge_ms = 0
+		if not delta or not self.editing_event or not self.edit_event_obj:
+			return
+
+		old_pos = int(self.edit_event_obj.position)
+		new_pos = max(0, old_pos + int(delta))
+
+		duration = self.media_player.media_player.duration()
+		if duration and duration > 0:
+			new_pos = min(new_pos, duration)
+
+		# Skip over frames already holding another event, in the direction of travel
+		frame_duration_ms = self.frame_duration_ms or self.default_frame_duration_ms
+		new_frame = self.position_to_frame(new_pos)
+		free_frame = self.list_manager.next_free_frame(
+			new_frame,
+			1 if delta > 0 else -1,
+			self.half,
+			exclude=self.edit_event_obj,
+			stride=max(1, int(round(step_ms / frame_duration_ms))),
+			max_frame=self.position_to_frame(duration) if duration and duration > 0 else None,
+		)
+		if free_frame != new_frame:
+			new_pos = self.frame_to_position(free_frame)
+			if duration and duration > 0:
+				new_pos = min(new_pos, duration)
+
+		# Update the object in place and move it to its sorted slot
+		self.list_manager.move_event(self.edit_event_obj, new_pos, self.position_to_frame(new_pos))
+
+		# Refresh UI + keep the edited event highlighted
+		self.list_display.display_list()
+		try:
+			new_row = self.list_display._visible_events.index(self.edit_event_obj)
+			self.list_display.list_widget.setCurrentRow(new_row)
+		except ValueError:
+			pass
+
+		# Seek video to new timestamp (feedback)
+		self.media_player.step_to(new_pos)
+
 	def _handle_multi_key_combo(self, event):
 		if not (event.modifiers() & Qt.ShiftModifier):
 			self._clear_combo_prefix()
@@ -721,20 +784,41 @@ class MainWindow(QMainWindow):
 			self.video_frame_rate = None
 			self.frame_duration_ms = self.default_frame_duration_ms
 
-	def _frame_step_ms_with_modifiers(self, event):
+	def set_frame_timeline(self, frame_timeline):
+		self.frame_timeline = frame_timeline
+
+	def _frame_step_with_modifiers(self, event):
 		multiplier = 1
 		if event.modifiers() & Qt.ShiftModifier:
 			multiplier *= 5
 		if event.modifiers() & Qt.ControlModifier:
 			multiplier *= 10
+		return multiplier
+
+	def _frame_step_ms_with_modifiers(self, event):
 		frame_duration_ms = self.frame_duration_ms or self.default_frame_duration_ms
-		return max(1, int(round(frame_duration_ms * multiplier)))
+		return max(1, int(round(frame_duration_ms * self._frame_step_with_modifiers(event))))
 
 	def position_to_frame(self, position_ms):
+		if self.frame_timeline is not None:
+			return self.frame_timeline.position_to_frame(position_ms)
 		frame_duration_ms = self.frame_duration_ms if self.frame_duration_ms else self.default_frame_duration_ms
 		frame_duration_ms = max(frame_duration_ms, 0.001)
 		return max(0, int(round(position_ms / frame_duration_ms)))
 
+	def frame_to_position(self, frame):
+		if self.frame_timeline is not None:
+			return self.frame_timeline.frame_to_position(frame)
+		frame_duration_ms = self.frame_duration_ms if self.frame_duration_ms else self.default_frame_duration_ms
+		return max(0, int(round(frame * frame_duration_ms)))
+
+	def shift_position_by_frames(self, position_ms, frames):
+		"""Position `frames` frames away from `position_ms`, snapped to a frame timestamp when indexed."""
+		if self.frame_timeline is None:
+			frame_duration_ms = self.frame_duration_ms or self.default_frame_duration_ms
+			return position_ms + int(round(frame_duration_ms * frames))
+		return self.frame_to_position(self.position_to_frame(position_ms) + frames)
+
 	def _open_event_window_with_label(self, label: str):
 		if not self._show_event_window():
 			return
@@ -756,11 +840,11 @@ class MainWindow(QMainWindow):
 	def _show_event_window(self, for_edit=False):
 		if not self.media_player.play_button.isEnabled():
 			return False
-		if self.media_player.media_player.state() == QMediaPlayer.PlayingState:
+		if self.media_player.is_playing():
 			return False
 
 		if not for_edit:
-			frame = self.position_to_frame(self.media_player.media_player.position())
+			frame = self.position_to_frame(self.media_player.current_position())
 			if self.list_manager.find_event_by_frame(frame, self.half):
 				QMessageBox.warning(
 					self,
@@ -791,16 +875,40 @@ class MainWindow(QMainWindow):
 		# Update overlay to show editing mode
 		self.media_player.update_overlay()
 
+	def _edit_move_op(self):
+		"""History entry for the event being edited having moved since editing began (or None)."""
+		if not self.edit_event_obj or not self.edit_event_original:
+			return None
+		return move_op(self.edit_event_obj, self.edit_event_original["position"], self.edit_event_original["frame"])
+
+	def _undo_edit(self, redo=False):
+		if not self.media_player.play_button.isEnabled():
+			return
+		if self.editing_event:
+			# The edit in progress is not in the history yet: undo just drops it
+			if not redo:
+				self._revert_edit_event()
+			return
+
+		history = self.list_manager.history
+		event = history.redo(self.list_manager) if redo else history.undo(self.list_manager)
+		if event is None:
+			return
+		self.list_display.display_list()
+		self.media_player.set_position(event.position)
+		path_label = self.media_player.get_last_label_file()
+		self.list_manager.save_file(path_label, self.half)
+		self.setFocus()
+
 	def _revert_edit_event(self):
+		self._nudge_timer.stop()
+		self._pending_nudge_ms = 0
 		if not self.edit_event_obj or not self.edit_event_original:
 			self._end_edit_event()
 			return
 
-		self.edit_event_obj.position = self.edit_event_original["position"]
+		self.list_manager.move_event(self.edit_event_obj, self.edit_event_original["position"], self.edit_event_original["frame"])
 		self.edit_event_obj.time = self.edit_event_original["time"]
-		self.edit_event_obj.frame = self.edit_event_original["frame"]
-
-		self.list_manager.sort_list()
 		self.list_display.display_list()
 		
 		new_row = self.list_manager.event_list.index(self.edit_event_obj)
@@ -810,6 +918,8 @@ class MainWindow(QMainWindow):
 		self._end_edit_event()
 
 	def _end_edit_event(self, keep_focus=False):
+		self._nudge_timer.stop()
+		self._pending_nudge_ms = 0
 		self.editing_event = False
 		self.edit_event_obj = None
 		self.edit_event_original = None
@@ -837,14 +947,14 @@ class MainWindow(QMainWindow):
 		mp = self.media_player
 		ld = self.list_display
 		if self.dark_mode:
-			is_playing = mp.media_player.state() == QMediaPlayer.PlayingState
+			is_playing = mp.is_playing()
 			mp.play_button.setIcon(self._white_icon(QStyle.SP_MediaPause if is_playing else QStyle.SP_MediaPlay))
 			mp.volume_button.setIcon(self._white_icon(QStyle.SP_MediaVolume))
 			ld.prev_clip_button.setIcon(self._white_icon(QStyle.SP_MediaSeekBackward))
 			ld.next_clip_button.setIcon(self._white_icon(QStyle.SP_MediaSeekForward))
 			ld.loop_clip_button.setIcon(self._white_icon(QStyle.SP_BrowserReload))
 		else:
-			is_playing = mp.media_player.state() == QMediaPlayer.PlayingState
+			is_playing = mp.is_playing()
 			mp.play_button.setIcon(self.style().standardIcon(QStyle.SP_MediaPause if is_playing else QStyle.SP_MediaPlay))
 			mp.volume_button.setIcon(self.style().standardIcon(QStyle.SP_MediaVolume))
 			ld.prev_clip_button.setIcon(self.style().standardIcon(QStyle.SP_MediaSeekBackward))
@@ -901,6 +1011,27 @@ class MainWindow(QMainWindow):
 
 		outer.addWidget(self._rb_light)
 		outer.addWidget(self._rb_dark)
+
+		playback_section = QLabel("Playback", dialog)
+		playback_section.setFont(font)
+		outer.addWidget(playback_section)
+
+		playback_line = QFrame(dialog)
+		playback_line.setFrameShape(QFrame.HLine)
+		playback_line.setFrameShadow(QFrame.Sunken)
+		outer.addWidget(playback_line)
+
+		proxy_box = QCheckBox("Play from a low-res proxy (built in the background)", dialog)
+		proxy_box.setChecked(self.media_player.use_proxy)
+		outer.addWidget(proxy_box)
+
+		gap_box = QCheckBox("Pause 1 s between event clips", dialog)
+		gap_box.setChecked(self.list_display.clip_gap_ms > 0)
+		outer.addWidget(gap_box)
+
+		skip_box = QCheckBox("Skip low-motion stretches while playing (Ctrl+M)", dialog)
+		skip_box.setChecked(self.media_player.skip_low_motion)
+		outer.addWidget(skip_box)
 		outer.addStretch(1)
 
 		# Save / Cancel
@@ -914,8 +1045,15 @@ class MainWindow(QMainWindow):
 
 		if dialog.exec_() == QDialog.Accepted:
 			self._apply_theme(self._rb_dark.isChecked())
+			if proxy_box.isChecked() != self.media_player.use_proxy:
+				self.media_player.set_proxy_enabled(proxy_box.isChecked())
+			self.list_display.clip_gap_ms = 1000 if gap_box.isChecked() else 0
+			if skip_box.isChecked() != self.media_player.skip_low_motion:
+				self.media_player.set_skip_low_motion(skip_box.isChecked())
 
 	def closeEvent(self, event):
 		self.media_player.save_on_exit()
 		self.media_player.cleanup()
+		if self.session_recorder:
+			self.session_recorder.close()
 		event.accept()
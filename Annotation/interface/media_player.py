@@ -3,14 +3,30 @@ import os
 import shutil
 from bisect import bisect_left
 
-import cv2
-from interface.video_exporter import start_export
-from PyQt5.QtWidgets import QWidget, QPushButton, QStyle, QSlider, QHBoxLayout, QVBoxLayout, QFileDialog, QLabel, QGraphicsView, QGraphicsScene, QMessageBox, QDialog, QListWidget, QListWidgetItem, QDialogButtonBox, QSizePolicy, QMenu
-from PyQt5.QtMultimedia import QMediaPlayer, QMediaContent, QMediaMetaData
+from PyQt5.QtWidgets import QWidget, QPushButton, QStyle, QSlider, QHBoxLayout, QVBoxLayout, QFileDialog, QLabel, QGraphicsView, QGraphicsScene, QGraphicsPixmapItem, QMessageBox, QDialog, QListWidget, QListWidgetItem, QDialogButtonBox, QSizePolicy, QMenu, QToolTip
+from PyQt5.QtMultimedia import QMediaPlayer
 from PyQt5.QtMultimediaWidgets import QGraphicsVideoItem
-from PyQt5.QtCore import Qt, QUrl, QEvent, QSizeF, QSize
-
+from PyQt5.QtCore import Qt, QEvent, QPoint, QRect, QSizeF, QSize, QTimer
+from PyQt5.QtGui import QPixmap
+
+from interface.frame_stepper import FrameStepper
+from interface.perf_hud import PerfHud
+from interface.playback_backend import create_playback_backend
+from interface.event_strip import EventDensityStrip
+from interface.position_ticks import PositionTickDispatcher
+from interface.scan_player import MAX_PLAYER_RATE, SCAN_MIN_RATE, ScanPlayer
+from interface.stop_scheduler import StopScheduler
+from interface.seek_preview import PreviewSlider, ThumbnailAtlas
+from interface.video_index import MotionIndexer, ProxyBuilder, VideoIndexer
+from utils import perf
+from utils.event_badges import passing_event_entries
 from utils.event_class import ms_to_time
+from utils.playback_proxy import find_proxy, proxy_enabled_by_default
+from utils.video_cache import read_metadata, write_metadata
+
+# While frame-stepping from the decoded cache, the real player seek is deferred
+# until the keys have been idle this long
+STEP_SEEK_DELAY_MS = 350
 
 
 class MediaPlayer(QWidget):
@@ -22,14 +38,49 @@ class MediaPlayer(QWidget):
 
 		self.main_window = main_window
 
-		# Media Player
-		self.media_player = QMediaPlayer(None, QMediaPlayer.VideoSurface)
-		self.media_player.setNotifyInterval(33)
+		# Playback engine: QMediaPlayer or libmpv (ANNOTATOR_PLAYBACK_BACKEND), same API either way
+		self.media_player = create_playback_backend()
 
 		self.video_scene = QGraphicsScene(self)
 		self.video_item = QGraphicsVideoItem()
 		self.video_scene.addItem(self.video_item)
 
+		# Cached decoded frame drawn over the video while stepping while paused
+		self._frame_item = QGraphicsPixmapItem()
+		self._frame_item.setTransformationMode(Qt.SmoothTransformation)
+		self._frame_item.setZValue(1)
+		self._frame_item.hide()
+		self.video_scene.addItem(self._frame_item)
+
+		self.frame_stepper = FrameStepper(self)
+		# 8x and faster: keyframe-only scanning instead of decoding every frame
+		self.scan_player = ScanPlayer(self)
+		self.scan_player.active_changed.connect(self.mediastate_changed)
+		self.playback_rate = 1.0
+		# Keyframe index of the open video; None until the background build finishes
+		self.keyframe_index = None
+		self.video_indexer = VideoIndexer(self)
+		self.video_indexer.index_ready.connect(self._video_index_ready)
+
+		# Optional low-res proxy for playback/stepping; the original stays the
+		# reference for export, indexes and frame numbers
+		self.use_proxy = proxy_enabled_by_default()
+		self._playback_path = None
+		self.proxy_builder = ProxyBuilder(self)
+		self.proxy_builder.proxy_ready.connect(self._proxy_ready)
+
+		# Motion / shot-cut index for jump-to-action navigation; built on first use
+		self.motion_index = None
+		self._motion_index_wanted = False
+		self.skip_low_motion = False
+		self.motion_indexer = MotionIndexer(self)
+		self.motion_indexer.index_ready.connect(self._motion_index_ready)
+		self._stepped_position = None
+		self._step_seek_issued = False
+		self._step_seek_timer = QTimer(self)
+		self._step_seek_timer.setSingleShot(True)
+		self._step_seek_timer.timeout.connect(self._commit_stepped_position)
+
 		self.video_view = QGraphicsView(self.video_scene)
 		self.video_view.setFrameShape(QGraphicsView.NoFrame)
 		self.video_view.setHorizontalScrollBarPolicy(Qt.ScrollBarAlwaysOff)
@@ -49,6 +100,7 @@ class MediaPlayer(QWidget):
 
 		# Create overlay label for displaying position and editing mode
 		self.overlay_label = QLabel(self.video_container)
+		self._overlay_bg_color = None
 		self.overlay_label.setStyleSheet("""
 			QLabel {
 				background-color: rgba(0, 0, 0, 180);
@@ -104,16 +156,20 @@ class MediaPlayer(QWidget):
 		self._pass_label_layout = pass_layout
 
 		self.pause_at_events = False
+		# Sorted distinct frames to pause at, with how many queued events sit on each
 		self.pause_at_event_frames = []
+		self._pause_frame_counts = {}
 		self._pause_action_filter = None
 		self._pass_event_display_filter = None
 		self.display_events = False
 		self._next_pause_index = 0
 		self._last_position_frame = 0
-		self._pause_event_source = None
 
 		self.video_container.installEventFilter(self)
 
+		# Latency/dropped-frame HUD (F9); instrumentation itself is always collecting
+		self.perf_hud = PerfHud(self)
+
 		# Button to open a new file
 		self._current_video_path = None
 
@@ -136,7 +192,7 @@ class MediaPlayer(QWidget):
 		self.play_button.setFocusPolicy(Qt.NoFocus)
 		self.play_button.setSizePolicy(QSizePolicy.Maximum, QSizePolicy.Preferred)
 
-		self._speed_options = [("1/2x", 0.5), ("1x", 1.0), ("2x", 2.0), ("4x", 4.0), ("8x", 8.0), ("16x", 16.0)]
+		self._speed_options = [("1/2x", 0.5), ("1x", 1.0), ("2x", 2.0), ("4x", 4.0), ("8x", 8.0), ("16x", 16.0), ("32x", 32.0)]
 		self.speed_button = QPushButton("1x")
 		self.speed_button.setFocusPolicy(Qt.NoFocus)
 		self.speed_button.setSizePolicy(QSizePolicy.Maximum, QSizePolicy.Preferred)
@@ -175,12 +231,17 @@ class MediaPlayer(QWidget):
 		self.set_playback_rate(1.0)
 
 		# Button for the slider
-		self.slider = QSlider(Qt.Horizontal)
+		# Hover and drag previews come from the thumbnail atlas; a drag only seeks on release
+		self.thumbnail_atlas = ThumbnailAtlas(self)
+		self.slider = PreviewSlider(Qt.Horizontal)
+		self.slider.atlas = self.thumbnail_atlas
 		self.slider.setRange(0, 0)
-		self.slider.sliderMoved.connect(self.set_position)
+		self.slider.sliderMoved.connect(self._slider_moved)
 		self.slider.sliderReleased.connect(self._slider_released)
 		self.slider.setFocusPolicy(Qt.NoFocus)
 
+		# Where the events are: per-label ticks and density under the slider (click seeks)
+		self.event_strip = EventDensityStrip(self)
 		# Volume slider
 		self.volume_button = QPushButton()
 		self.volume_button.setIcon(self.style().standardIcon(QStyle.SP_MediaVolume))
@@ -298,6 +359,7 @@ class MediaPlayer(QWidget):
 		self.layout = QVBoxLayout()
 		self.layout.addWidget(self.video_container, 1)
 		self.layout.addWidget(self.slider)
+		self.layout.addWidget(self.event_strip)
 		self.layout.addLayout(control_row)
 
 		# route video into QGraphicsVideoItem (not QVideoWidget)
@@ -305,10 +367,22 @@ class MediaPlayer(QWidget):
 
 		# Media player signals
 		self.media_player.stateChanged.connect(self.mediastate_changed)
-		self.media_player.positionChanged.connect(self.position_changed)
 		self.media_player.durationChanged.connect(self.duration_changed)
 		self.media_player.metaDataChanged.connect(self._update_video_metadata)
 
+		# All position consumers hang off one dispatcher (frame computed once per tick, adaptive rate)
+		self.position_ticks = PositionTickDispatcher(self.media_player, self.main_window.position_to_frame, self)
+		# Frames shown without the player call position_changed themselves (see _position_shown)
+		self.position_ticks.subscribe(self._player_position_changed, player_only=True)
+		self.position_ticks.subscribe(self.event_strip.set_position)
+		self.position_ticks.add_fast_condition(lambda: self.display_events)
+
+		# Pause-at-event and clip-end stops on a precise timer (sources added here and in ListDisplay)
+		self.stop_scheduler = StopScheduler(self.media_player, self)
+		self.stop_scheduler.add_source(self.next_pause_stop)
+		self.stop_scheduler.add_source(self._next_motion_skip)
+		self.position_ticks.subscribe(self.stop_scheduler.reschedule)
+
 		self.path_label = None
 
 	def open_file(self):
@@ -333,56 +407,207 @@ class MediaPlayer(QWidget):
 		filename, _ = QFileDialog.getOpenFileName(self, "Open Video", default_dir)
 
 		if filename != '':
-			self._current_video_path = filename
-			self.media_player.setMedia(QMediaContent(QUrl.fromLocalFile(filename)))
-			self.play_button.setEnabled(True)
-			self.save_events_button.setEnabled(True)
+			self.load_video(filename)
+
+	def load_video(self, filename):
+		"""Open `filename` and its annotations without any dialog."""
+		from utils.frame_timeline import load_frame_timeline
+		from utils.keyframe_index import load_keyframe_index
+		from utils.motion_index import load_motion_index
+
+		self._current_video_path = filename
+		self._cancel_stepping()
+		# Seek indexes load instantly once cached; the first open builds them in the background
+		self.keyframe_index = load_keyframe_index(filename)
+		frame_timeline = load_frame_timeline(filename)
+		self.main_window.set_frame_timeline(frame_timeline)
+		if self.keyframe_index is None or frame_timeline is None:
+			self.video_indexer.start(filename)
+		self.motion_indexer.cancel()
+		self.motion_index = load_motion_index(filename)
+		self._motion_index_wanted = False
+
+		self.proxy_builder.cancel()
+		proxy_path = find_proxy(filename) if self.use_proxy else None
+		self._set_playback_source(proxy_path or filename)
+		if self.use_proxy and not proxy_path:
+			self.proxy_builder.start(filename)
+		self.thumbnail_atlas.attach(filename)
+		self.play_button.setEnabled(True)
+		self.save_events_button.setEnabled(True)
+
+		fps = self._read_video_frame_rate(filename)
+		if fps:
+			self.main_window.set_frame_rate(fps)
+
+		self.overlay_label.show()
+		self.update_overlay()
+
+		filpath = os.path.basename(filename)
+		try:
+			self.main_window.half = int(filpath[0])
+		except (ValueError, IndexError):
+			self.main_window.half = 1
+
+		# Store the video source dir for GCS saves
+		self.video_source_dir = os.path.dirname(filename)
+		video_stem = os.path.splitext(filpath)[0]
+		tagger = os.environ.get("TAGGER_NAME", "nick")
+		self.gcs_filename = f"{video_stem}_{tagger}.json"
+
+		# Use a local temp file for session saves (fast)
+		self.path_label = f"/tmp/{self.gcs_filename}"
+		if os.path.isfile(self.path_label):
+			os.remove(self.path_label)
+
+		# Load existing annotations from GCS if they exist
+		gcs_annotations_dir = self.video_source_dir + "/annotations"
+		gcs_path = gcs_annotations_dir + "/" + self.gcs_filename
+		if os.path.isfile(gcs_path):
+			shutil.copy2(gcs_path, self.path_label)
+			self.annotations_save_path = gcs_path
+		else:
+			# Fall back to Labels-v2.json in the video directory
+			labels_v2_path = self.video_source_dir + "/Labels-v2.json"
+			if os.path.isfile(labels_v2_path):
+				shutil.copy2(labels_v2_path, self.path_label)
+				self.annotations_save_path = labels_v2_path
+			else:
+				self.annotations_save_path = gcs_path
 
-			fps = self._read_video_frame_rate(filename)
-			if fps:
-				self.main_window.set_frame_rate(fps)
+		self.main_window.list_manager.create_list_from_json(self.path_label, self.main_window.half)
+		self.main_window.list_display.display_list()
 
-			self.overlay_label.show()
-			self.update_overlay()
+		recorder = self.main_window.session_recorder
+		if recorder:
+			recorder.video_loaded(filename, self.path_label)
 
-			filpath = os.path.basename(filename)
-			try:
-				self.main_window.half = int(filpath[0])
-			except (ValueError, IndexError):
-				self.main_window.half = 1
+		# pbp.csv parsing pulls in pandas; let the video show first
+		pbp = getattr(self.main_window, "pbp_display", None)
+		if pbp:
+			QTimer.singleShot(0, lambda: pbp.load_pbp(filename))
 
-			# Store the video source dir for GCS saves
-			self.video_source_dir = os.path.dirname(filename)
-			video_stem = os.path.splitext(filpath)[0]
-			tagger = os.environ.get("TAGGER_NAME", "nick")
-			self.gcs_filename = f"{video_stem}_{tagger}.json"
+	def _video_index_ready(self, video_path, keyframe_index, frame_timeline):
+		if video_path != self._current_video_path:
+			return
+		self.keyframe_index = keyframe_index
+		self.main_window.set_frame_timeline(frame_timeline)
+		self.update_overlay()
 
-			# Use a local temp file for session saves (fast)
-			self.path_label = f"/tmp/{self.gcs_filename}"
-			if os.path.isfile(self.path_label):
-				os.remove(self.path_label)
+	def _motion_index_ready(self, video_path, motion_index):
+		if video_path != self._current_video_path:
+			return
+		self.motion_index = motion_index
+		self.stop_scheduler.reschedule()
 
-			# Load existing annotations from GCS if they exist
-			gcs_annotations_dir = self.video_source_dir + "/annotations"
-			gcs_path = gcs_annotations_dir + "/" + self.gcs_filename
-			if os.path.isfile(gcs_path):
-				shutil.copy2(gcs_path, self.path_label)
-				self.annotations_save_path = gcs_path
-			else:
-				# Fall back to Labels-v2.json in the video directory
-				labels_v2_path = self.video_source_dir + "/Labels-v2.json"
-				if os.path.isfile(labels_v2_path):
-					shutil.copy2(labels_v2_path, self.path_label)
-					self.annotations_save_path = labels_v2_path
-				else:
-					self.annotations_save_path = gcs_path
+	def _show_hint(self, text):
+		QToolTip.showText(self.video_container.mapToGlobal(QPoint(16, 16)), text, self.video_container, QRect(), 2000)
 
-			self.main_window.list_manager.create_list_from_json(self.path_label, self.main_window.half)
-			self.main_window.list_display.display_list()
+	def _motion_index_or_hint(self):
+		"""The motion index, or None after starting its build (and saying so)."""
+		if self.motion_index is None and self._current_video_path:
+			self._show_hint("Motion index is still being built")
+			self._start_motion_index()
+		return self.motion_index
 
-			pbp = getattr(self.main_window, "pbp_display", None)
-			if pbp:
-				pbp.load_pbp(filename)
+	def _start_motion_index(self):
+		if self.motion_indexer.is_running():
+			return
+		# A proxy being transcoded is the cheaper source; build from it once it is ready
+		if self.use_proxy and self.proxy_builder.is_running():
+			self._motion_index_wanted = True
+			return
+		self._motion_index_wanted = False
+		self.motion_indexer.start(self._current_video_path)
+
+	def jump_to_cut(self, direction):
+		"""Seek to the next (direction > 0) or previous camera cut."""
+		index = self._motion_index_or_hint()
+		if index is None:
+			return
+		frame = self.main_window.position_to_frame(self.current_position())
+		target = index.next_cut(frame) if direction > 0 else index.previous_cut(frame)
+		if target is not None:
+			self.set_position(self.main_window.frame_to_position(target))
+
+	def jump_to_high_motion(self):
+		"""Seek to the start of the next high-motion stretch."""
+		index = self._motion_index_or_hint()
+		if index is None:
+			return
+		target = index.next_high_motion(self.main_window.position_to_frame(self.current_position()))
+		if target is not None:
+			self.set_position(self.main_window.frame_to_position(target))
+
+	def set_skip_low_motion(self, enabled):
+		self.skip_low_motion = bool(enabled)
+		self.stop_scheduler.reschedule()
+		self._show_hint("Skipping low-motion stretches" if self.skip_low_motion else "Playing low-motion stretches")
+		if self.skip_low_motion:
+			self._motion_index_or_hint()
+
+	def _next_motion_skip(self):
+		"""StopScheduler source: jump over still stretches (timeouts, dead ball) while skip-low-motion is on."""
+		if not self.skip_low_motion or self.motion_index is None:
+			return None
+		list_display = getattr(self.main_window, "list_display", None)
+		if list_display and list_display._playing_clips:
+			return None
+		frame = self.main_window.position_to_frame(self.media_player.position())
+		run = self.motion_index.low_motion_run(frame + 1)
+		if run is None:
+			return None
+		start, end = run
+		# Never skip past a pending pause-at-event stop; land on it instead
+		if self.pause_at_events and self._next_pause_index < len(self.pause_at_event_frames):
+			pause_frame = self.pause_at_event_frames[self._next_pause_index]
+			if start <= pause_frame < end:
+				end = pause_frame
+		if end <= frame + 1:
+			return None
+		return self.main_window.frame_to_position(start), lambda _target: self.set_position(self.main_window.frame_to_position(end))
+
+	def _set_playback_source(self, path, position=None, resume=False):
+		"""Point the player and the frame stepper at `path` (the original or its proxy)."""
+		self.scan_player.stop(release=False)
+		self._cancel_stepping()
+		self._playback_path = path
+		self.media_player.load(path)
+		self.frame_stepper.attach(path)
+		if position:
+			self.media_player.setPosition(position)
+		if resume:
+			self.media_player.play()
+
+	def _switch_playback_source(self, path):
+		if not self._current_video_path or path == self._playback_path:
+			return
+		# Proxy timestamps match the source, so the ms position carries over
+		position = self.current_position()
+		playing = self.media_player.state() == QMediaPlayer.PlayingState
+		self._set_playback_source(path, position, playing)
+
+	def _proxy_ready(self, video_path, proxy_path):
+		if video_path == self._current_video_path and self.use_proxy:
+			self._switch_playback_source(proxy_path)
+			if self._motion_index_wanted:
+				self._start_motion_index()
+
+	def set_proxy_enabled(self, enabled):
+		self.use_proxy = bool(enabled)
+		if not self._current_video_path:
+			return
+		if not self.use_proxy:
+			self.proxy_builder.cancel()
+			self._switch_playback_source(self._current_video_path)
+			if self._motion_index_wanted:
+				self._start_motion_index()
+			return
+		proxy_path = find_proxy(self._current_video_path)
+		if proxy_path:
+			self._switch_playback_source(proxy_path)
+		else:
+			self.proxy_builder.start(self._current_video_path)
 
 	def get_last_label_file(self):
 		return self.path_label
@@ -393,15 +618,29 @@ class MediaPlayer(QWidget):
 		layout = QVBoxLayout(dialog)
 
 		export_btn = QPushButton("Export Annotated Video")
-		export_btn.clicked.connect(lambda: (dialog.accept(), start_export(self)))
+		export_btn.clicked.connect(lambda: (dialog.accept(), self._start_export()))
 		layout.addWidget(export_btn)
 
+		reel_btn = QPushButton("Export Event Reel")
+		reel_btn.setToolTip("Clips around the listed events (label filter applied)")
+		reel_btn.clicked.connect(lambda: (dialog.accept(), self._start_reel_export()))
+		layout.addWidget(reel_btn)
+
 		gcs_btn = QPushButton("Save Annotations to GCS")
 		gcs_btn.clicked.connect(lambda: (dialog.accept(), self.save_to_gcs()))
 		layout.addWidget(gcs_btn)
 
 		dialog.exec_()
 
+	def _start_export(self):
+		# OpenCV and the export dialogs are only loaded when an export is requested
+		from interface.video_exporter import start_export
+		start_export(self)
+
+	def _start_reel_export(self):
+		from interface.video_exporter import start_reel_export
+		start_reel_export(self)
+
 	def save_to_gcs(self):
 		if not hasattr(self, 'video_source_dir') or not hasattr(self, 'gcs_filename'):
 			QMessageBox.warning(self, "No video", "Open a video first.")
@@ -421,12 +660,22 @@ class MediaPlayer(QWidget):
 			QMessageBox.critical(self, "Save Error", f"Failed to save to GCS:\n{str(e)}")
 
 	def play_video(self):
-		if self.media_player.state() == QMediaPlayer.PlayingState:
+		if self.scan_player.is_active():
+			self.scan_player.stop()
+		elif self.media_player.state() == QMediaPlayer.PlayingState:
 			self.media_player.pause()
 		else:
+			self._commit_stepped_position()
 			if getattr(self.main_window, "list_display", None):
 				self.main_window.list_display.list_widget.setCurrentRow(-1)
-			self.media_player.play()
+			if self.playback_rate >= SCAN_MIN_RATE:
+				self.scan_player.start(self.playback_rate)
+			else:
+				self.media_player.play()
+
+	def is_playing(self):
+		"""True while the player plays or a keyframe scan runs."""
+		return self.scan_player.is_active() or self.media_player.state() == QMediaPlayer.PlayingState
 
 	def _show_help_dialog(self):
 		list_display = getattr(self.main_window, "list_display", None)
@@ -434,8 +683,8 @@ class MediaPlayer(QWidget):
 			list_display._show_help()
 
 	def rewind(self, seconds):
-		new_pos = max(0, self.media_player.position() - seconds * 1000)
-		self.media_player.setPosition(new_pos)
+		new_pos = max(0, self.current_position() - seconds * 1000)
+		self.set_position(new_pos)
 
 	def _open_speed_menu(self):
 		menu = QMenu(self)
@@ -446,9 +695,27 @@ class MediaPlayer(QWidget):
 		menu.exec_(self.speed_button.mapToGlobal(self.speed_button.rect().bottomLeft()))
 
 	def set_playback_rate(self, rate):
-		position = self.media_player.position()
-		self.media_player.setPlaybackRate(rate)
-		self.media_player.setPosition(position)
+		"""Set the speed; from SCAN_MIN_RATE up playback becomes a keyframe scan (see ScanPlayer)."""
+		self.playback_rate = rate
+		if rate >= SCAN_MIN_RATE:
+			# The player stays at its fastest decoded rate (also used by clip review)
+			playing = self.media_player.state() == QMediaPlayer.PlayingState
+			if playing:
+				self.media_player.pause()
+			self.media_player.setPlaybackRate(MAX_PLAYER_RATE)
+			if self.scan_player.is_active():
+				self.scan_player.set_rate(rate)
+			elif playing:
+				self.scan_player.start(rate)
+		else:
+			scanning = self.scan_player.is_active()
+			self.scan_player.stop(release=False)
+			position = self.current_position()
+			self._cancel_stepping()
+			self.media_player.setPlaybackRate(rate)
+			self.media_player.setPosition(position)
+			if scanning:
+				self.media_player.play()
 
 		for label, r in self._speed_options:
 			if r == rate:
@@ -458,17 +725,19 @@ class MediaPlayer(QWidget):
 	def _set_volume(self, value):
 		self.media_player.setVolume(value)
 
-	def mediastate_changed(self, state):
-		is_playing = self.media_player.state() == QMediaPlayer.PlayingState
+	def mediastate_changed(self, *_):
+		is_playing = self.is_playing()
 		sp = QStyle.SP_MediaPause if is_playing else QStyle.SP_MediaPlay
 		if getattr(self.main_window, 'dark_mode', False):
 			self.play_button.setIcon(self.main_window._white_icon(sp))
 		else:
 			self.play_button.setIcon(self.style().standardIcon(sp))
 
-	def position_changed(self, position):
-		self.slider.setValue(position)
-		frame_number = self.update_overlay()
+	@perf.timed("position_changed")
+	def position_changed(self, position, frame=None):
+		if not self.slider.isSliderDown():
+			self.slider.setValue(position)
+		frame_number = self.update_overlay(frame)
 
 		pbp = getattr(self.main_window, "pbp_display", None)
 		if pbp:
@@ -476,18 +745,123 @@ class MediaPlayer(QWidget):
 
 		if self.pause_at_events:
 			if frame_number < self._last_position_frame:
-				self._refresh_pause_queue(current_frame=frame_number)
+				self._sync_pause_index(frame_number, reset=True)
 			self._maybe_pause_for_event(frame_number)
 
 		self._last_position_frame = frame_number
+		return frame_number
 
 	def duration_changed(self, duration):
 		self.slider.setRange(0, duration)
+		self.event_strip.set_duration(duration)
 
 	def set_position(self, position):
+		perf.begin("seek_to_frame")
+		self._cancel_stepping()
 		self.media_player.setPosition(position)
 
+	def video_path(self):
+		"""The open video (the original, never its proxy), or None."""
+		return self._current_video_path
+
+	def playback_path(self):
+		"""The file the player is showing: the proxy when one is in use, otherwise the original."""
+		return self._playback_path or self._current_video_path
+
+	def current_position(self):
+		"""Playback position in ms, including a frame step not yet committed to the player."""
+		if self._stepped_position is not None:
+			return self._stepped_position
+		return self.media_player.position()
+
+	def step_to(self, position):
+		"""Move to `position` while paused, drawing the frame from the decoded cache when possible.
+
+		The real player seek is deferred until stepping stops; falls back to the
+		backend's step/seek when playing or when the frame is not decoded yet.
+		"""
+		position = max(0, int(position))
+		frame = self.main_window.position_to_frame(position)
+		image = None
+		if self.media_player.state() != QMediaPlayer.PlayingState:
+			image = self.frame_stepper.frame(frame)
+		if image is None:
+			# Let the backend step by one frame when the player itself sits next to the target
+			frames = 0
+			if self._stepped_position is None:
+				frames = frame - self.main_window.position_to_frame(self.media_player.position())
+			perf.begin("seek_to_frame")
+			self._cancel_stepping()
+			self.media_player.step(frames, position)
+			return
+
+		perf.begin("step_to_frame")
+		self._show_cached_frame(image)
+		self._stepped_position = position
+		self._step_seek_issued = False
+		self._step_seek_timer.start(STEP_SEEK_DELAY_MS)
+		self._position_shown(position)
+
+	def _show_cached_frame(self, image):
+		# Fit the frame inside the video item the same way the video is (keep aspect, centred)
+		rect = self.video_item.boundingRect()
+		pixmap = QPixmap.fromImage(image).scaled(
+			int(rect.width()), int(rect.height()), Qt.KeepAspectRatio, Qt.FastTransformation
+		)
+		self._frame_item.setPixmap(pixmap)
+		self._frame_item.setPos(
+			self.video_item.pos().x() + (rect.width() - pixmap.width()) / 2,
+			self.video_item.pos().y() + (rect.height() - pixmap.height()) / 2,
+		)
+		self._frame_item.show()
+
+	def show_external_frame(self, image, position):
+		"""Show a frame decoded elsewhere (clip review) as the current position without seeking the player."""
+		self._step_seek_timer.stop()
+		self._show_cached_frame(image)
+		self._stepped_position = position
+		self._step_seek_issued = False
+		self._position_shown(position)
+
+	def _position_shown(self, position):
+		frame = self.position_changed(position)
+		self.position_ticks.dispatch_shown(position, frame)
+
+	def release_external_frame(self):
+		"""Hand display back to the player at the last externally shown position."""
+		self._commit_stepped_position()
+
+	def _commit_stepped_position(self):
+		self._step_seek_timer.stop()
+		if self._stepped_position is None or self._step_seek_issued:
+			return
+		self._step_seek_issued = True
+		self.media_player.setPosition(self._stepped_position)
+
+	def _cancel_stepping(self):
+		self._step_seek_timer.stop()
+		self._stepped_position = None
+		self._step_seek_issued = False
+		self._frame_item.hide()
+
+	def _player_position_changed(self, position, frame):
+		if self._stepped_position is not None:
+			if not self._step_seek_issued:
+				# Stale notification from before the step; the cached frame is authoritative
+				return
+			# The deferred seek landed: hand display back to the player
+			self._cancel_stepping()
+		self.position_changed(position, frame)
+		if self.media_player.state() != QMediaPlayer.PlayingState:
+			self.frame_stepper.prefetch(frame)
+
+	def _slider_moved(self, position):
+		# Without a thumbnail for this spot yet, fall back to live seeking
+		if not self.slider.show_preview(position, self.slider.handle_x()):
+			self.set_position(position)
+
 	def _slider_released(self):
+		self.slider.hide_preview()
 		self.set_position(self.slider.value())
 
 	def _video_rect_points_in_container(self):
@@ -519,12 +893,11 @@ class MediaPlayer(QWidget):
 		self.overlay_label.move(tl.x() + margin, tl.y() + margin)
 		self.overlay_label.raise_()
 
-	def update_overlay(self):
+	def update_overlay(self, frame_number=None):
 		"""Update the overlay label with current position and editing mode"""
-		position = self.media_player.position()
-
-		# Convert milliseconds to frame number
-		frame_number = int(round(position / self.main_window.frame_duration_ms))
+		if frame_number is None:
+			# Convert milliseconds to frame number
+			frame_number = self.main_window.position_to_frame(self.current_position())
 		frame_str = f"Frame: {frame_number}"
 
 		# Check if we're in editing mode
@@ -536,16 +909,19 @@ class MediaPlayer(QWidget):
 			overlay_text = frame_str
 			bg_color = "rgba(0, 0, 0, 180)"  # black
 
-		self.overlay_label.setStyleSheet(f"""
-			QLabel {{
-				background-color: {bg_color};
-				color: white;
-				padding: 8px 12px;
-				font-size: 16px;
-				font-weight: bold;
-				border-radius: 4px;
-			}}
-		""")
+		# Re-parsing the style sheet on every tick is costly; only restyle on a mode change
+		if bg_color != self._overlay_bg_color:
+			self._overlay_bg_color = bg_color
+			self.overlay_label.setStyleSheet(f"""
+				QLabel {{
+					background-color: {bg_color};
+					color: white;
+					padding: 8px 12px;
+					font-size: 16px;
+					font-weight: bold;
+					border-radius: 4px;
+				}}
+			""")
 		self.overlay_label.setText(overlay_text)
 
 		self.overlay_label.adjustSize()
@@ -586,6 +962,7 @@ class MediaPlayer(QWidget):
 		self._position_pass_label()
 		return frame_number
 
+	@perf.timed("update_passing_events")
 	def _update_passing_events(self, current_frame):
 		if self.main_window.editing_event or (
 			getattr(self.main_window, "list_display", None)
@@ -604,20 +981,13 @@ class MediaPlayer(QWidget):
 		frames_visible = max(1, int(round(2000.0 / frame_duration)))
 
 		event_entries = []
-		for event in sorted(self.main_window.list_manager.event_list, key=lambda e: getattr(e, "frame", float("inf"))):
-			event_frame = getattr(event, "frame", None)
-			if event_frame is None:
-				continue
-
-			if self.display_events and current_frame >= event_frame and current_frame < event_frame + frames_visible:
-				if not self._pass_event_display_filter or self._passes_display_filter(event):
-					label = event.label or "Event"
-					subtype = getattr(event, "subType", None)
-					if subtype and subtype != "None":
-						text = f"{label} ({subtype})"
-					else:
-						text = label
-					event_entries.append((text, event_frame))
+		if self.display_events:
+			event_entries = passing_event_entries(
+				self.main_window.list_manager.event_list,
+				current_frame,
+				frames_visible,
+				accept=self._passes_display_filter if self._pass_event_display_filter else None,
+			)
 
 		if not event_entries:
 			self._clear_pass_badges()
@@ -687,35 +1057,75 @@ class MediaPlayer(QWidget):
 		):
 			return
 
+		if current_frame >= self.pause_at_event_frames[self._next_pause_index]:
+			self._pause_at_next_event()
+
+	def next_pause_stop(self):
+		"""Next pause-at-event stop as (target_ms, action), or None; a StopScheduler source."""
+		if not self.pause_at_events or self._next_pause_index >= len(self.pause_at_event_frames):
+			return None
+		frame = self.pause_at_event_frames[self._next_pause_index]
+		return self.main_window.frame_to_position(frame), self._pause_at_next_event
+
+	def _pause_at_next_event(self, target=None):
 		next_frame = self.pause_at_event_frames[self._next_pause_index]
-		if current_frame >= next_frame:
-			self.media_player.pause()
-			if getattr(self.main_window, "list_display", None):
-				self.main_window.list_display.highlight_event_by_frame(next_frame)
-			self._next_pause_index += 1
-
-	def _refresh_pause_queue(self, current_frame=None, events=None):
-		if events is not None:
-			self._pause_event_source = list(events)
-
-		event_source = self._pause_event_source
-		if event_source is None:
-			manager = getattr(self.main_window, "list_manager", None)
-			event_source = manager.event_list if manager else []
-
-		self.pause_at_event_frames = sorted(
-			{
-				getattr(event, "frame", None)
-				for event in (event_source or [])
-				if getattr(event, "frame", None) is not None and self._event_allowed_for_pause(event)
-			}
-		)
+		self.media_player.pause()
+		# Land on the event's own frame even if playback ran past it; not a backward seek for the queue
+		self._last_position_frame = next_frame
+		self.set_position(self.main_window.frame_to_position(next_frame))
+		if getattr(self.main_window, "list_display", None):
+			self.main_window.list_display.highlight_event_by_frame(next_frame)
+		self._next_pause_index += 1
+
+	def _queues_for_pause(self, event):
+		if getattr(event, "frame", None) is None or not self._event_allowed_for_pause(event):
+			return False
+		list_display = getattr(self.main_window, "list_display", None)
+		return list_display is None or list_display.passes_filter(event)
+
+	def rebuild_event_pause_queue(self, current_frame=None):
+		"""Rebuild the queue from scratch; only needed when a filter changes or the list is reloaded."""
+		counts = {}
+		manager = getattr(self.main_window, "list_manager", None)
+		for event in (manager.event_list if manager else []):
+			if self._queues_for_pause(event):
+				counts[event.frame] = counts.get(event.frame, 0) + 1
+		self._pause_frame_counts = counts
+		self.pause_at_event_frames = sorted(counts)
 
 		if current_frame is None:
-			current_frame = self.main_window.position_to_frame(self.media_player.position())
+			current_frame = self.main_window.position_to_frame(self.current_position())
 
 		self._sync_pause_index(current_frame, reset=True)
 
+	def event_list_changed(self, kind, event):
+		"""ListManager listener: keep the pause queue in step with single-event changes."""
+		if kind == "reset":
+			self.rebuild_event_pause_queue()
+			return
+		if not self._queues_for_pause(event):
+			return
+
+		frame = event.frame
+		frames = self.pause_at_event_frames
+		count = self._pause_frame_counts.get(frame, 0)
+		if kind == "add":
+			self._pause_frame_counts[frame] = count + 1
+			if count == 0:
+				index = bisect_left(frames, frame)
+				frames.insert(index, frame)
+				if index < self._next_pause_index:
+					self._next_pause_index += 1
+		elif count:
+			if count > 1:
+				self._pause_frame_counts[frame] = count - 1
+				return
+			del self._pause_frame_counts[frame]
+			index = bisect_left(frames, frame)
+			del frames[index]
+			if index < self._next_pause_index:
+				self._next_pause_index -= 1
+
 	def _sync_pause_index(self, frame, reset=False):
 		if not self.pause_at_event_frames:
 			self._next_pause_index = 0
@@ -727,16 +1137,10 @@ class MediaPlayer(QWidget):
 		else:
 			self._next_pause_index = max(self._next_pause_index, target)
 
-	def refresh_event_pause_queue(self, events=None):
-		self._refresh_pause_queue(events=events)
-
 	def _set_pause_at_events(self, enable):
 		self.pause_at_events = enable
 		if enable:
-			current_frame = self.main_window.position_to_frame(self.media_player.position())
-			list_display = getattr(self.main_window, "list_display", None)
-			filtered_events = getattr(list_display, "_visible_events", None)
-			self._refresh_pause_queue(current_frame=current_frame, events=filtered_events)
+			self.rebuild_event_pause_queue()
 		else:
 			self._next_pause_index = 0
 	
@@ -817,7 +1221,7 @@ class MediaPlayer(QWidget):
 
 		def _apply(new_filter):
 			self._pause_action_filter = new_filter
-			self._refresh_pause_queue()
+			self.rebuild_event_pause_queue()
 
 		self._open_multi_select_filter_dialog(
 			title="Pause At Actions",
@@ -830,6 +1234,7 @@ class MediaPlayer(QWidget):
 
 	def _set_display_events(self, enable):
 		self.display_events = enable
+		self.position_ticks.update_interval()
 		self.update_overlay()
 
 	def _open_event_display_filter(self):
@@ -929,24 +1334,35 @@ class MediaPlayer(QWidget):
 			pass
 
 	def cleanup(self):
+		perf.dump_to_log()
 		# clean up media player resources to prevent segfaults
-		self.media_player.stop()
-		self.media_player.setMedia(QMediaContent())
+		self.scan_player.stop(release=False)
+		self.frame_stepper.detach()
+		self.thumbnail_atlas.detach()
+		self.proxy_builder.cancel()
+		self.motion_indexer.cancel()
+		self.slider.hide_preview()
+		self.media_player.release()
 		self.media_player.stateChanged.disconnect()
 		self.media_player.positionChanged.disconnect()
 		self.media_player.durationChanged.disconnect()
 
 	def _update_video_metadata(self):
-		frame_rate = self.media_player.metaData(QMediaMetaData.VideoFrameRate)
+		frame_rate = self.media_player.frame_rate()
 		self.main_window.set_frame_rate(frame_rate)
 		self.update_overlay()
 
 	def _read_video_frame_rate(self, filename):
+		fps = read_metadata(filename).get("fps")
+		if fps:
+			return fps
+		import cv2
 		cap = cv2.VideoCapture(filename)
 		if not cap.isOpened():
 			return None
 		fps = cap.get(cv2.CAP_PROP_FPS)
 		cap.release()
 		if fps and fps > 0:
+			write_metadata(filename, fps=fps)
 			return fps
 		return None
\ No newline at end of file
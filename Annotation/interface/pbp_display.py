@@ -141,6 +141,5 @@ class PBPDisplay(QWidget):
 		if frame_id < 0:
 			return
 
-		frame_duration = self.main_window.frame_duration_ms or 40.0
-		self.main_window.media_player.set_position(int(frame_id * frame_duration))
+		self.main_window.media_player.set_position(self.main_window.frame_to_position(frame_id))
 		self.main_window.setFocus()
@@ -0,0 +1,120 @@
+from PyQt5.QtCore import QEvent, QObject, Qt, QTimer
+from PyQt5.QtMultimedia import QMediaPlayer, QVideoProbe
+from PyQt5.QtWidgets import QLabel
+
+from utils import perf
+
+_HUD_REFRESH_MS = 500
+_LOG_INTERVAL_MS = 60 * 1000
+
+# Cross-callback latencies older than this are discarded (nothing visible changed)
+_MAX_PENDING_S = 2.0
+
+
+class FrameDropMonitor(QObject):
+	"""Counts frames reaching the video surface and gaps in their timestamps.
+
+	A gap longer than 1.5 frame durations while playing counts the missing
+	frames as dropped; timestamps are media time, so the playback rate does
+	not change the expected gap. Also closes the seek-to-frame latency.
+	"""
+
+	def __init__(self, media_player):
+		super().__init__(media_player)
+		self.media_player = media_player
+		self._last_start_us = None
+		player = media_player.media_player
+		if isinstance(player, QMediaPlayer):
+			self.probe = QVideoProbe(self)
+			self.available = self.probe.setSource(player)
+			self.probe.videoFrameProbed.connect(self._frame_probed)
+		else:
+			# Non-Qt backends report drawn frames themselves
+			self.available = True
+			player.frameShown.connect(self._frame_shown)
+		player.stateChanged.connect(self._reset)
+
+	def _reset(self, *_):
+		self._last_start_us = None
+
+	def _frame_probed(self, frame):
+		self._frame_shown(frame.startTime())
+
+	def _frame_shown(self, start_us):
+		perf.finish("seek_to_frame", max_seconds=_MAX_PENDING_S)
+		perf.count("frames_probed")
+		player = self.media_player.media_player
+		if start_us < 0 or player.state() != QMediaPlayer.PlayingState:
+			self._last_start_us = None
+			return
+		if self._last_start_us is not None:
+			mw = self.media_player.main_window
+			expected_us = (mw.frame_duration_ms or mw.default_frame_duration_ms) * 1000.0
+			delta = start_us - self._last_start_us
+			if 0 < expected_us and delta > 1.5 * expected_us:
+				perf.count("dropped_frames", int(round(delta / expected_us)) - 1)
+		self._last_start_us = start_us
+
+
+class PerfHud(QLabel):
+	"""Toggleable latency table drawn over the video (F9)."""
+
+	def __init__(self, media_player):
+		super().__init__(media_player.video_container)
+		self.media_player = media_player
+		self.setStyleSheet("""
+			QLabel {
+				background-color: rgba(0, 0, 0, 170);
+				color: #7CFC00;
+				padding: 6px 8px;
+				font-family: monospace;
+				font-size: 11px;
+				border-radius: 4px;
+			}
+		""")
+		self.setAlignment(Qt.AlignLeft | Qt.AlignTop)
+		self.setAttribute(Qt.WA_TransparentForMouseEvents, True)
+		self.hide()
+
+		self.drop_monitor = FrameDropMonitor(media_player)
+
+		self._refresh_timer = QTimer(self)
+		self._refresh_timer.setInterval(_HUD_REFRESH_MS)
+		self._refresh_timer.timeout.connect(self.refresh)
+
+		self._log_timer = QTimer(self)
+		self._log_timer.setInterval(_LOG_INTERVAL_MS)
+		self._log_timer.timeout.connect(perf.dump_to_log)
+		if perf.enabled():
+			self._log_timer.start()
+
+		# Key-press / step latencies end on the next paint of the video viewport
+		media_player.video_view.viewport().installEventFilter(self)
+
+	def eventFilter(self, obj, event):
+		if event.type() == QEvent.Paint:
+			for name in ("key_to_repaint", "step_to_frame"):
+				if perf.pending(name):
+					perf.finish(name, max_seconds=_MAX_PENDING_S)
+		return False
+
+	def toggle(self):
+		if self.isVisible():
+			self._refresh_timer.stop()
+			self.hide()
+			return
+		self.refresh()
+		self.show()
+		self.raise_()
+		self._refresh_timer.start()
+
+	def refresh(self):
+		text = perf.format_table()
+		if not self.drop_monitor.available:
+			text += "\n(video probe unavailable: no drop counts)"
+		if not perf.enabled():
+			text = "Instrumentation disabled (ANNOTATOR_PERF=0)"
+		self.setText(text)
+		self.adjustSize()
+		container = self.media_player.video_container
+		self.move(10, max(0, container.height() - self.height() - 10))
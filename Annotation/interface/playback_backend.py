@@ -0,0 +1,288 @@
+import os
+
+from PyQt5.QtCore import QObject, QSize, Qt, QTimer, QUrl, pyqtSignal
+from PyQt5.QtGui import QImage, QPixmap
+from PyQt5.QtMultimedia import QMediaContent, QMediaMetaData, QMediaPlayer
+from PyQt5.QtWidgets import QGraphicsPixmapItem
+
+# Playback engines behind MediaPlayer. A backend speaks the subset of the
+# QMediaPlayer API the app uses (state/position/duration/playbackRate/volume/
+# notifyInterval, play/pause/stop/setPosition, setVideoOutput, and the
+# positionChanged/durationChanged/stateChanged/playbackRateChanged/
+# metaDataChanged signals, with QMediaPlayer.State values), plus:
+#   load(path)              open a file, stopped at the start
+#   release()               drop the file and free the engine (on exit)
+#   step(frames, position)  move `frames` frames to `position` ms while paused
+#   frame_rate()            fps of the open file, or None
+#
+# ANNOTATOR_PLAYBACK_BACKEND selects the engine: "qt" (QMediaPlayer, the
+# default) or "mpv" (libmpv via python-mpv: exact seeks, decoder-level frame
+# steps, per-frame position). An unavailable engine falls back to QMediaPlayer.
+
+BACKEND_ENV = "ANNOTATOR_PLAYBACK_BACKEND"
+
+
+def playback_backend_name():
+	return os.environ.get(BACKEND_ENV, "").strip().lower() or "qt"
+
+
+def create_playback_backend(parent=None):
+	"""The configured backend, or QMediaPlayer when it cannot be started."""
+	name = playback_backend_name()
+	if name == "mpv":
+		try:
+			return MpvPlaybackBackend(parent)
+		except Exception as e:
+			print(f"mpv playback backend unavailable ({e}); using QMediaPlayer")
+	elif name not in ("qt", "qmediaplayer"):
+		print(f"Unknown {BACKEND_ENV}={name!r}; using QMediaPlayer")
+	return QtPlaybackBackend(parent)
+
+
+class QtPlaybackBackend(QMediaPlayer):
+	"""QMediaPlayer (GStreamer on Linux); always available."""
+
+	name = "qt"
+
+	def __init__(self, parent=None):
+		super().__init__(parent, QMediaPlayer.VideoSurface)
+
+	def load(self, path):
+		self.setMedia(QMediaContent(QUrl.fromLocalFile(path)))
+
+	def release(self):
+		self.stop()
+		self.setMedia(QMediaContent())
+
+	def step(self, frames, position):
+		self.setPosition(position)
+
+	def frame_rate(self):
+		return self.metaData(QMediaMetaData.VideoFrameRate)
+
+
+class MpvPlaybackBackend(QObject):
+	"""libmpv with its software renderer drawing into the video scene.
+
+	Seeks are always exact (hr-seek) and single-frame steps use mpv's own
+	frame-step, so neither waits for a keyframe re-decode. mpv reports every
+	frame's position on its event thread; it is forwarded to the Qt thread and
+	re-emitted while playing at the notify interval, like QMediaPlayer.
+	"""
+
+	name = "mpv"
+
+	positionChanged = pyqtSignal("qint64")
+	durationChanged = pyqtSignal("qint64")
+	stateChanged = pyqtSignal(int)
+	playbackRateChanged = pyqtSignal(float)
+	metaDataChanged = pyqtSignal()
+	# Presentation time (us) of each drawn frame; FrameDropMonitor's source when there is no QVideoProbe
+	frameShown = pyqtSignal("qint64")
+
+	# mpv callbacks run on its own threads; these hop to the Qt thread
+	_property_changed = pyqtSignal(str, object)
+	_frame_ready = pyqtSignal()
+
+	_OBSERVED = ("time-pos", "duration", "pause", "speed", "idle-active", "container-fps")
+
+	def __init__(self, parent=None):
+		super().__init__(parent)
+		import mpv
+
+		self._mpv = mpv.MPV(
+			vo="libmpv", hr_seek="yes", keep_open="yes", idle="yes", pause=True,
+			osc=False, input_default_bindings=False, input_vo_keyboard=False,
+		)
+		self._render = mpv.MpvRenderContext(self._mpv, "sw")
+
+		self._state = QMediaPlayer.StoppedState
+		self._loaded = False
+		self._position = 0
+		self._emitted_position = None
+		self._pending_seek = None
+		self._duration = 0
+		self._rate = 1.0
+		self._volume = 100
+		self._fps = None
+		self._video_item = None
+		self._frame_item = None
+		self._image = None
+
+		self._notify_timer = QTimer(self)
+		self._notify_timer.setInterval(1000)
+		self._notify_timer.timeout.connect(self._notify_position)
+
+		self._property_changed.connect(self._apply_property, Qt.QueuedConnection)
+		self._frame_ready.connect(self._draw_frame, Qt.QueuedConnection)
+		for name in self._OBSERVED:
+			self._mpv.observe_property(name, self._property_changed.emit)
+		self._render.update_cb = self._frame_ready.emit
+
+	# QMediaPlayer-compatible surface
+
+	def state(self):
+		return self._state
+
+	def position(self):
+		return self._position
+
+	def duration(self):
+		return self._duration
+
+	def playbackRate(self):
+		return self._rate
+
+	def volume(self):
+		return self._volume
+
+	def notifyInterval(self):
+		return self._notify_timer.interval()
+
+	def setNotifyInterval(self, interval):
+		self._notify_timer.setInterval(interval)
+
+	def play(self):
+		if not self._loaded:
+			return
+		self._mpv.pause = False
+		self._set_state(QMediaPlayer.PlayingState)
+
+	def pause(self):
+		if not self._loaded:
+			return
+		self._mpv.pause = True
+		self._set_state(QMediaPlayer.PausedState)
+
+	def stop(self):
+		if not self._loaded:
+			return
+		self._mpv.pause = True
+		self.setPosition(0)
+		self._set_state(QMediaPlayer.StoppedState)
+
+	def setPosition(self, position):
+		position = max(0, int(position))
+		self._position = position
+		if not self._loaded:
+			return
+		try:
+			self._mpv.seek(position / 1000.0, "absolute", "exact")
+		except Exception:
+			# Still opening; applied once the duration is known
+			self._pending_seek = position
+
+	def setPlaybackRate(self, rate):
+		rate = float(rate or 1.0)
+		self._mpv.speed = rate
+		if rate != self._rate:
+			self._rate = rate
+			self.playbackRateChanged.emit(rate)
+
+	def setVolume(self, volume):
+		self._volume = int(volume)
+		self._mpv.volume = self._volume
+
+	def setVideoOutput(self, video_item):
+		"""Draw frames on a pixmap item laid over `video_item`, which itself stays empty."""
+		self._video_item = video_item
+		self._frame_item = QGraphicsPixmapItem()
+		# Above the (empty) video item, below MediaPlayer's cached-step frame
+		self._frame_item.setZValue(0.5)
+		video_item.scene().addItem(self._frame_item)
+
+	# Backend extras
+
+	def load(self, path):
+		self._loaded = True
+		self._position = 0
+		self._emitted_position = None
+		self._pending_seek = None
+		self._duration = 0
+		self._mpv.pause = True
+		self._mpv.loadfile(path)
+		self._set_state(QMediaPlayer.StoppedState)
+
+	def release(self):
+		self._notify_timer.stop()
+		self._loaded = False
+		self._set_state(QMediaPlayer.StoppedState)
+		self._render.free()
+		self._mpv.terminate()
+
+	def step(self, frames, position):
+		if not self._loaded:
+			return
+		if frames in (1, -1) and self._state != QMediaPlayer.PlayingState:
+			# Decoder-level step: no seek, the next (or cached previous) frame is shown directly
+			self._mpv.command("frame-step" if frames > 0 else "frame-back-step")
+			self._position = max(0, int(position))
+		else:
+			self.setPosition(position)
+
+	def frame_rate(self):
+		return self._fps
+
+	# mpv -> Qt
+
+	def _set_state(self, state):
+		if state == self._state:
+			return
+		self._state = state
+		if state == QMediaPlayer.PlayingState:
+			self._notify_timer.start()
+		else:
+			self._notify_timer.stop()
+		self.stateChanged.emit(state)
+
+	def _apply_property(self, name, value):
+		if name == "time-pos":
+			if value is None:
+				return
+			self._position = int(round(value * 1000))
+			# Seeks while paused report at once; playback goes out at the notify interval
+			if self._state != QMediaPlayer.PlayingState:
+				self._notify_position()
+		elif name == "duration":
+			self._duration = int(round((value or 0) * 1000))
+			self.durationChanged.emit(self._duration)
+			if value and self._pending_seek is not None:
+				position, self._pending_seek = self._pending_seek, None
+				self.setPosition(position)
+		elif name == "pause":
+			# keep-open pauses by itself at the end of the file
+			if value and self._state == QMediaPlayer.PlayingState:
+				self._set_state(QMediaPlayer.PausedState)
+		elif name == "idle-active":
+			if value:
+				self._set_state(QMediaPlayer.StoppedState)
+		elif name == "speed":
+			if value and value != self._rate:
+				self._rate = value
+				self.playbackRateChanged.emit(value)
+		elif name == "container-fps":
+			self._fps = value
+			self.metaDataChanged.emit()
+
+	def _notify_position(self):
+		if self._position != self._emitted_position:
+			self._emitted_position = self._position
+			self.positionChanged.emit(self._position)
+
+	def _draw_frame(self):
+		if self._video_item is None or not self._render.update():
+			return
+		rect = self._video_item.boundingRect()
+		size = QSize(max(2, int(rect.width())), max(2, int(rect.height())))
+		if self._image is None or self._image.size() != size:
+			self._image = QImage(size, QImage.Format_RGB32)
+		# RGB32 is B, G, R, X in memory on little-endian machines, mpv's "bgr0"
+		self._render.render(
+			sw_size=(size.width(), size.height()), sw_format="bgr0",
+			sw_stride=self._image.bytesPerLine(), sw_pointer=int(self._image.bits()),
+		)
+		self._frame_item.setPixmap(QPixmap.fromImage(self._image))
+		self._frame_item.setPos(self._video_item.pos())
+
+		pts = self._mpv.time_pos
+		self.frameShown.emit(int(pts * 1000000) if pts is not None else -1)
@@ -0,0 +1,66 @@
+from PyQt5.QtCore import QObject
+from PyQt5.QtMultimedia import QMediaPlayer
+
+# QMediaPlayer notify intervals (ms)
+FAST_INTERVAL_MS = 33      # playing with a per-frame consumer (passing-event badges, clip highlights)
+NORMAL_INTERVAL_MS = 100   # playing: only the slider, frame counter and PBP follow the clock
+IDLE_INTERVAL_MS = 1000    # paused: seeks still notify straight away
+
+
+class PositionTickDispatcher(QObject):
+	"""The one positionChanged slot: maps each tick to a frame once and fans out (position, frame).
+
+	Frames shown without the player (cached steps, clip review, scan) go out
+	through dispatch_shown, so the event strip and other subscribers follow
+	them too.
+
+	Also sets the player's notify interval from what currently needs ticks:
+	the fast rate only while playing with a fast condition true (see
+	add_fast_condition), a slower rate otherwise, and near-idle while paused.
+	Call update_interval() when a condition changes. Stops no longer depend
+	on the tick rate (see StopScheduler).
+	"""
+
+	def __init__(self, player, position_to_frame, parent=None):
+		super().__init__(parent)
+		self.player = player
+		self.position_to_frame = position_to_frame
+		self._subscribers = []     # (callback, player_only)
+		self._fast_conditions = []
+		player.positionChanged.connect(self.dispatch)
+		player.stateChanged.connect(self.update_interval)
+		self.update_interval()
+
+	def subscribe(self, callback, player_only=False):
+		"""Call `callback(position_ms, frame)` on every tick, in subscription order.
+
+		`player_only` callbacks only get the player's own ticks, not dispatch_shown.
+		"""
+		self._subscribers.append((callback, player_only))
+
+	def add_fast_condition(self, condition):
+		self._fast_conditions.append(condition)
+		self.update_interval()
+
+	def dispatch(self, position):
+		frame = self.position_to_frame(position)
+		for callback, _ in self._subscribers:
+			callback(position, frame)
+
+	def dispatch_shown(self, position, frame=None):
+		"""Fan out a frame shown without the player to the subscribers that are not player_only."""
+		if frame is None:
+			frame = self.position_to_frame(position)
+		for callback, player_only in self._subscribers:
+			if not player_only:
+				callback(position, frame)
+
+	def update_interval(self, *_):
+		if self.player.state() != QMediaPlayer.PlayingState:
+			interval = IDLE_INTERVAL_MS
+		elif any(condition() for condition in self._fast_conditions):
+			interval = FAST_INTERVAL_MS
+		else:
+			interval = NORMAL_INTERVAL_MS
+		if interval != self.player.notifyInterval():
+			self.player.setNotifyInterval(interval)
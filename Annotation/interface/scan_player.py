@@ -0,0 +1,227 @@
+import threading
+from collections import deque
+
+from PyQt5.QtCore import QElapsedTimer, QObject, QThread, QTimer, pyqtSignal
+from PyQt5.QtGui import QImage
+
+
+# Rates at or above this are scanned (keyframes only) instead of played by the player
+SCAN_MIN_RATE = 8.0
+# Fastest rate handed to the player itself
+MAX_PLAYER_RATE = 4.0
+
+# Without a keyframe index (proxy), aim for about this many images per second
+_SCAN_IMAGES_PER_S = 8
+
+# Decoded frames buffered ahead of the scan position
+_AHEAD = 16
+
+_MAX_FRAME_WIDTH = 960
+
+_TICK_MS = 15
+
+
+class ScanDecodeThread(QThread):
+	"""Decodes only the frames a scan shows: keyframes with an index, otherwise every `stride`-th frame.
+
+	Each frame is one seek plus one decode. Frames the scan clock has already
+	passed (see set_target) are skipped instead of decoded late.
+	"""
+
+	def __init__(self, video_path, start_frame, frame_to_position, keyframe_index=None, stride=1):
+		super().__init__()
+		self.video_path = video_path
+		self.start_frame = start_frame
+		self.frame_to_position = frame_to_position
+		self.keyframe_index = keyframe_index
+		self.stride = max(1, int(stride))
+		self._frames = deque()      # (position_ms, QImage) in scan order
+		self._target = start_frame
+		self._stopping = False
+		self._cond = threading.Condition()
+
+	def set_target(self, frame):
+		with self._cond:
+			self._target = frame
+
+	def set_stride(self, stride):
+		with self._cond:
+			self.stride = max(1, int(stride))
+
+	def take_until(self, position):
+		"""Pop the buffered frames up to `position` ms; returns the last one as (position_ms, image), or None."""
+		with self._cond:
+			latest = None
+			while self._frames and self._frames[0][0] <= position:
+				latest = self._frames.popleft()
+			self._cond.notify()
+			return latest
+
+	def pending(self):
+		with self._cond:
+			return len(self._frames)
+
+	def stop(self):
+		with self._cond:
+			self._stopping = True
+			self._cond.notify()
+		self.wait()
+
+	def _next_frame(self, last):
+		"""First frame to show after `last`: (frame, position_ms), or None past the end."""
+		with self._cond:
+			while not self._stopping and len(self._frames) >= _AHEAD:
+				self._cond.wait()
+			if self._stopping:
+				return None
+			wanted = max(last + self.stride, self._target)
+		if self.keyframe_index is None:
+			return wanted, self.frame_to_position(wanted)
+		after = self.keyframe_index.keyframe_after(wanted - 1)
+		if after is None:
+			return None
+		return after[0], int(round(after[1]))
+
+	def run(self):
+		import cv2
+
+		cap = cv2.VideoCapture(self.video_path)
+		if not cap.isOpened():
+			return
+
+		frame = self.start_frame
+		while True:
+			nxt = self._next_frame(frame)
+			if nxt is None:
+				break
+			frame, position = nxt
+			# Frame seek: exact on VFR files too, where a time seek is rounded through the nominal fps
+			cap.set(cv2.CAP_PROP_POS_FRAMES, frame)
+			ok, image = cap.read()
+			if not ok:
+				break
+			image = self._to_image(cv2, image)
+			with self._cond:
+				if self._stopping:
+					break
+				self._frames.append((position, image))
+
+		cap.release()
+
+	def _to_image(self, cv2, frame):
+		height, width = frame.shape[:2]
+		if width > _MAX_FRAME_WIDTH:
+			height = int(round(height * _MAX_FRAME_WIDTH / width))
+			width = _MAX_FRAME_WIDTH
+			frame = cv2.resize(frame, (width, height), interpolation=cv2.INTER_AREA)
+		rgb = cv2.cvtColor(frame, cv2.COLOR_BGR2RGB)
+		return QImage(rgb.data, width, height, 3 * width, QImage.Format_RGB888).copy()
+
+
+class ScanPlayer(QObject):
+	"""High-speed shuttle (8x and up) that decodes keyframes instead of every frame.
+
+	Like clip review, the real player stays paused and frames go through
+	MediaPlayer.show_external_frame, so the slider, frame overlay and PBP
+	follow. The scan position is wall-clock time times the rate; each decoded
+	frame is shown once the clock reaches it. Pause-at-events uses the same
+	stop source as normal playback and lands on the event's exact frame.
+	"""
+	active_changed = pyqtSignal(bool)
+
+	def __init__(self, media_player, parent=None):
+		super().__init__(parent)
+		self.media_player = media_player
+		self.rate = SCAN_MIN_RATE
+		self._thread = None
+		self._origin = 0
+		self._last_shown = None
+		self._clock = QElapsedTimer()
+		self._timer = QTimer(self)
+		self._timer.setInterval(_TICK_MS)
+		self._timer.timeout.connect(self._tick)
+
+	def is_active(self):
+		return self._timer.isActive()
+
+	def start(self, rate):
+		"""Scan forward from the current position; returns False when there is no video to scan."""
+		self.stop(release=False)
+		mp = self.media_player
+		# Decode whatever the player is showing (original or proxy); the keyframe index only fits the original
+		path = mp.playback_path()
+		if not path:
+			return False
+		keyframe_index = mp.keyframe_index if path == mp.video_path() else None
+
+		self.rate = rate
+		self._origin = mp.current_position()
+		mw = mp.main_window
+		self._thread = ScanDecodeThread(
+			path, mw.position_to_frame(self._origin), mw.frame_to_position, keyframe_index, self._stride(),
+		)
+		self._thread.start()
+		self._last_shown = None
+		self._clock.start()
+		self._timer.start()
+		self.active_changed.emit(True)
+		return True
+
+	def set_rate(self, rate):
+		if not self.is_active():
+			self.rate = rate
+			return
+		# Re-base the clock so the scan continues from where it is
+		self._origin = self._scan_position()
+		self._clock.restart()
+		self.rate = rate
+		self._thread.set_stride(self._stride())
+
+	def stop(self, release=True):
+		"""End the scan; with `release`, the player is seeked to the last frame shown."""
+		was_active = self._timer.isActive()
+		self._timer.stop()
+		if self._thread is not None:
+			self._thread.stop()
+			self._thread = None
+		if release and self._last_shown is not None:
+			self.media_player.release_external_frame()
+		self._last_shown = None
+		if was_active:
+			self.active_changed.emit(False)
+
+	def _stride(self):
+		mw = self.media_player.main_window
+		frame_ms = mw.frame_duration_ms or mw.default_frame_duration_ms
+		return max(1, int(round(self.rate * 1000.0 / frame_ms / _SCAN_IMAGES_PER_S)))
+
+	def _scan_position(self):
+		return int(self._origin + self._clock.elapsed() * self.rate)
+
+	def _tick(self):
+		mp = self.media_player
+		if self._last_shown is not None and mp.current_position() != self._last_shown:
+			# Someone else moved the player (seek, step, clip): give up the overlay
+			self.stop(release=False)
+			return
+
+		duration = mp.media_player.duration()
+		position = self._scan_position()
+		if duration:
+			position = min(position, duration)
+
+		stop = mp.next_pause_stop()
+		if stop is not None and stop[0] <= position:
+			self.stop(release=False)
+			stop[1](stop[0])
+			return
+
+		self._thread.set_target(mp.main_window.position_to_frame(position))
+		shown = self._thread.take_until(position)
+		if shown is not None:
+			self._last_shown = shown[0]
+			mp.show_external_frame(shown[1], shown[0])
+
+		at_end = duration and position >= duration
+		if at_end or (self._thread.isFinished() and not self._thread.pending()):
+			self.stop()
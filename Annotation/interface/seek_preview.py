@@ -0,0 +1,155 @@
+import multiprocessing
+import os
+
+from PyQt5.QtCore import QObject, QPoint, QRect, Qt, QTimer
+from PyQt5.QtGui import QPixmap
+from PyQt5.QtWidgets import QLabel, QSlider, QStyle, QStyleOptionSlider, QVBoxLayout, QWidget
+
+from utils.event_class import ms_to_time
+from utils.thumbnail_atlas import atlas_dir_for, generate_thumbnails, read_atlas_index, sheet_name, tile_for_position
+
+# How often the GUI picks up tiles written by the generator process
+_ATLAS_POLL_MS = 2000
+
+
+class ThumbnailAtlas(QObject):
+	"""GUI-side view of a video's thumbnail atlas, generated by a background process."""
+
+	def __init__(self, parent=None):
+		super().__init__(parent)
+		self.atlas_dir = None
+		self.index = None
+		self._sheets = {}
+		self._process = None
+		self._poll_timer = QTimer(self)
+		self._poll_timer.setInterval(_ATLAS_POLL_MS)
+		self._poll_timer.timeout.connect(self._poll)
+
+	def attach(self, video_path):
+		self.detach()
+		self.atlas_dir = atlas_dir_for(video_path)
+		self.index = read_atlas_index(self.atlas_dir)
+		if self.index and self.index.get("complete"):
+			return
+
+		# spawn: never fork a process that owns a QApplication
+		ctx = multiprocessing.get_context("spawn")
+		self._process = ctx.Process(
+			target=generate_thumbnails, args=(video_path, self.atlas_dir), daemon=True,
+		)
+		self._process.start()
+		self._poll_timer.start()
+
+	def detach(self):
+		self._poll_timer.stop()
+		if self._process is not None:
+			# Sheets and index are replaced atomically, so a kill leaves a resumable atlas
+			if self._process.is_alive():
+				self._process.terminate()
+			self._process.join(1)
+			self._process = None
+		self.atlas_dir = None
+		self.index = None
+		self._sheets.clear()
+
+	def _poll(self):
+		if self.atlas_dir is None:
+			self._poll_timer.stop()
+			return
+		index = read_atlas_index(self.atlas_dir)
+		if index:
+			# The sheet being filled changes between polls; reload it on next use
+			per_sheet = index["cols"] * index["rows"]
+			self._sheets.pop(max(0, index["count"] - 1) // per_sheet, None)
+			self.index = index
+		if (index and index.get("complete")) or self._process is None or not self._process.is_alive():
+			self._poll_timer.stop()
+
+	def thumbnail(self, position_ms):
+		"""Return a QPixmap preview for `position_ms`, or None if that tile is not generated yet."""
+		tile = tile_for_position(self.index, position_ms)
+		if tile is None:
+			return None
+		sheet, x, y = tile
+		pixmap = self._sheets.get(sheet)
+		if pixmap is None:
+			path = os.path.join(self.atlas_dir, sheet_name(sheet))
+			pixmap = QPixmap(path)
+			if pixmap.isNull():
+				return None
+			self._sheets[sheet] = pixmap
+		return pixmap.copy(QRect(x, y, self.index["width"], self.index["height"]))
+
+
+class _PreviewPopup(QWidget):
+
+	def __init__(self):
+		super().__init__(None, Qt.ToolTip | Qt.FramelessWindowHint)
+		self.setAttribute(Qt.WA_ShowWithoutActivating)
+		layout = QVBoxLayout(self)
+		layout.setContentsMargins(2, 2, 2, 2)
+		layout.setSpacing(1)
+		self.image_label = QLabel()
+		self.time_label = QLabel()
+		self.time_label.setAlignment(Qt.AlignCenter)
+		self.time_label.setStyleSheet("color: white; font-weight: bold;")
+		layout.addWidget(self.image_label)
+		layout.addWidget(self.time_label)
+		self.setStyleSheet("background-color: rgb(30, 30, 30);")
+
+
+class PreviewSlider(QSlider):
+	"""Seek slider that shows atlas thumbnails on hover and while dragging."""
+
+	def __init__(self, orientation, parent=None):
+		super().__init__(orientation, parent)
+		self.atlas = None
+		self.setMouseTracking(True)
+		self._popup = _PreviewPopup()
+
+	def value_at(self, x):
+		opt = QStyleOptionSlider()
+		self.initStyleOption(opt)
+		groove = self.style().subControlRect(QStyle.CC_Slider, opt, QStyle.SC_SliderGroove, self)
+		handle = self.style().subControlRect(QStyle.CC_Slider, opt, QStyle.SC_SliderHandle, self)
+		span = max(1, groove.width() - handle.width())
+		return QStyle.sliderValueFromPosition(
+			self.minimum(), self.maximum(), x - groove.x() - handle.width() // 2, span, opt.upsideDown,
+		)
+
+	def handle_x(self):
+		opt = QStyleOptionSlider()
+		self.initStyleOption(opt)
+		return self.style().subControlRect(QStyle.CC_Slider, opt, QStyle.SC_SliderHandle, self).center().x()
+
+	def show_preview(self, position_ms, x):
+		"""Show the thumbnail for `position_ms` above the slider at `x`; returns False if none is ready."""
+		pixmap = self.atlas.thumbnail(position_ms) if self.atlas is not None else None
+		if pixmap is None:
+			self._popup.hide()
+			return False
+		self._popup.image_label.setPixmap(pixmap)
+		self._popup.time_label.setText(ms_to_time(position_ms))
+		self._popup.adjustSize()
+		anchor = self.mapToGlobal(QPoint(x, 0))
+		self._popup.move(anchor.x() - self._popup.width() // 2, anchor.y() - self._popup.height() - 4)
+		self._popup.show()
+		return True
+
+	def hide_preview(self):
+		self._popup.hide()
+
+	def mouseMoveEvent(self, event):
+		super().mouseMoveEvent(event)
+		if not self.isSliderDown() and self.maximum() > 0:
+			self.show_preview(self.value_at(event.pos().x()), event.pos().x())
+
+	def leaveEvent(self, event):
+		if not self.isSliderDown():
+			self.hide_preview()
+		super().leaveEvent(event)
+
+	def mouseReleaseEvent(self, event):
+		super().mouseReleaseEvent(event)
+		if not self.underMouse():
+			self.hide_preview()
@@ -0,0 +1,115 @@
+import time
+
+from PyQt5.QtCore import QEvent, QObject
+from PyQt5.QtWidgets import QApplication, QWidget
+
+from utils import session_log
+
+# Player positions are logged at most this often (plus on every state change)
+_POSITION_INTERVAL_MS = 200
+
+_KEY_KINDS = {
+	QEvent.KeyPress: session_log.KEY_PRESS,
+	QEvent.KeyRelease: session_log.KEY_RELEASE,
+}
+_MOUSE_KINDS = {
+	QEvent.MouseButtonPress: session_log.MOUSE_PRESS,
+	QEvent.MouseButtonRelease: session_log.MOUSE_RELEASE,
+	QEvent.MouseButtonDblClick: session_log.MOUSE_DOUBLE_CLICK,
+}
+
+
+def _child_widgets(widget):
+	return [child for child in widget.children() if isinstance(child, QWidget)]
+
+
+def widget_path(widget):
+	"""Stable name for `widget`: top-level window class, then child indices down to it."""
+	indices = []
+	while not widget.isWindow() and widget.parentWidget() is not None:
+		parent = widget.parentWidget()
+		indices.append(str(_child_widgets(parent).index(widget)))
+		widget = parent
+	return "/".join([type(widget).__name__] + indices[::-1])
+
+
+def resolve_widget_path(path):
+	"""Inverse of widget_path() against the current widgets; None if the layout changed."""
+	window_name, *indices = path.split("/")
+	windows = [w for w in QApplication.topLevelWidgets() if type(w).__name__ == window_name]
+	windows.sort(key=lambda w: not w.isVisible())
+	for widget in windows:
+		try:
+			for index in indices:
+				widget = _child_widgets(widget)[int(index)]
+		except (IndexError, ValueError):
+			continue
+		return widget
+	return None
+
+
+class SessionRecorder(QObject):
+	"""Logs spontaneous key and mouse input plus player positions (main.py --record-session)."""
+
+	def __init__(self, main_window, path):
+		super().__init__(main_window)
+		self.main_window = main_window
+		self.writer = session_log.SessionWriter(path)
+		self._t0 = time.perf_counter()
+		self._last_input = None
+		self._last_position_ms = None
+
+		player = main_window.media_player.media_player
+		main_window.media_player.position_ticks.subscribe(self._position_changed)
+		player.stateChanged.connect(self._state_changed)
+		QApplication.instance().installEventFilter(self)
+
+	def _now_ms(self):
+		return (time.perf_counter() - self._t0) * 1000.0
+
+	def close(self):
+		QApplication.instance().removeEventFilter(self)
+		self.writer.close()
+
+	def video_loaded(self, video_path, labels_path):
+		snapshot = self.writer.snapshot_labels(labels_path)
+		self.writer.record(self._now_ms(), session_log.OPEN, video_path, snapshot)
+
+	def eventFilter(self, obj, event):
+		kind = event.type()
+		if (kind in _KEY_KINDS or kind in _MOUSE_KINDS) and event.spontaneous() and isinstance(obj, QWidget):
+			self._record_input(obj, event)
+		return False
+
+	def _record_input(self, obj, event):
+		kind = event.type()
+		# Unhandled input is re-sent to each parent in turn; only the first receiver is logged
+		if kind in _KEY_KINDS:
+			identity = (kind, event.key(), event.timestamp(), event.isAutoRepeat())
+		else:
+			identity = (kind, event.timestamp(), event.globalPos().x(), event.globalPos().y())
+		if identity == self._last_input:
+			return
+		self._last_input = identity
+
+		t_ms = self._now_ms()
+		modifiers = int(event.modifiers())
+		if kind in _KEY_KINDS:
+			self.writer.record(t_ms, _KEY_KINDS[kind], event.key(), modifiers, int(event.isAutoRepeat()), event.text())
+		else:
+			pos = event.pos()
+			self.writer.record(
+				t_ms, _MOUSE_KINDS[kind], widget_path(obj), pos.x(), pos.y(),
+				int(event.button()), int(event.buttons()), modifiers,
+			)
+
+	def _position_changed(self, position, frame):
+		t_ms = self._now_ms()
+		if self._last_position_ms is not None and t_ms - self._last_position_ms < _POSITION_INTERVAL_MS:
+			return
+		self._last_position_ms = t_ms
+		self.writer.record(t_ms, session_log.POSITION, position, int(self.main_window.media_player.media_player.state()))
+
+	def _state_changed(self, state):
+		self._last_position_ms = self._now_ms()
+		self.writer.record(self._last_position_ms, session_log.POSITION, self.main_window.media_player.media_player.position(), int(state))
@@ -0,0 +1,56 @@
+from PyQt5.QtCore import QObject, Qt, QTimer
+from PyQt5.QtMultimedia import QMediaPlayer
+
+
+class StopScheduler(QObject):
+	"""Fires playback stops (pause-at-event, clip end) on time instead of on the next position tick.
+
+	Sources are callables returning (target_ms, action) for their next stop, or
+	None. The earliest stop is armed on a precise single-shot timer from the
+	player position and rate, and re-armed on every position tick (the owner
+	subscribes reschedule to the tick dispatcher), state change and rate
+	change, so at 4x a stop is no longer up to 130 ms of video late. When the
+	timer fires the source is asked again and `action(target_ms)` runs only
+	if it still names the same stop (a tick may have handled it). Sources
+	keep their own position-tick check as a fallback.
+	"""
+
+	def __init__(self, player, parent=None):
+		super().__init__(parent)
+		self.player = player
+		self._sources = []
+		self._armed = None
+		self._timer = QTimer(self)
+		self._timer.setSingleShot(True)
+		self._timer.setTimerType(Qt.PreciseTimer)
+		self._timer.timeout.connect(self._fire)
+		player.stateChanged.connect(self.reschedule)
+		player.playbackRateChanged.connect(self.reschedule)
+
+	def add_source(self, source):
+		self._sources.append(source)
+
+	def reschedule(self, *_):
+		self._timer.stop()
+		self._armed = None
+		if self.player.state() != QMediaPlayer.PlayingState:
+			return
+
+		for source in self._sources:
+			stop = source()
+			if stop is not None and (self._armed is None or stop[0] < self._armed[1]):
+				self._armed = (source, stop[0])
+		if self._armed is None:
+			return
+
+		rate = self.player.playbackRate() or 1.0
+		self._timer.start(max(0, int((self._armed[1] - self.player.position()) / rate)))
+
+	def _fire(self):
+		armed, self._armed = self._armed, None
+		if armed is None or self.player.state() != QMediaPlayer.PlayingState:
+			return
+		source, target = armed
+		stop = source()
+		if stop is not None and stop[0] == target:
+			stop[1](target)
@@ -8,6 +8,10 @@ from PyQt5.QtWidgets import (
 	QLineEdit, QFrame,
 )
 
+from utils.clip_planner import plan_clip_spans
+from utils.event_badges import visible_badge_texts
+from utils.video_cache import read_metadata
+
 
 # Badge dimensions match the live overlay (300×26 px, rgba(255,0,0,204), black text)
 _BADGE_W = 300
@@ -18,29 +22,6 @@ _BADGE_COLOR_BGR = (0, 0, 255)
 _TEXT_COLOR_BGR = (0, 0, 0)
 
 
-def _get_visible_texts(pos_ms, sorted_events, visibility_ms=2000):
-	"""Return badge strings for events visible at pos_ms.
-
-	Uses event.position (milliseconds) to match the live overlay exactly,
-	avoiding frame-count drift on variable-frame-rate videos.
-	"""
-	texts = []
-	for event in sorted_events:
-		ep = getattr(event, "position", None)
-		if ep is None:
-			continue
-		if ep > pos_ms + visibility_ms:
-			break
-		if ep <= pos_ms < ep + visibility_ms:
-			label = event.label or "Event"
-			subtype = getattr(event, "subType", None)
-			if subtype and subtype != "None":
-				texts.append(f"{label} ({subtype})")
-			else:
-				texts.append(label)
-	return texts
-
-
 def _draw_badges(frame, texts, video_width):
 	if not texts:
 		return frame
@@ -67,18 +48,27 @@ def _draw_badges(frame, texts, video_width):
 	return frame
 
 
+def _open_writer(path, fps, size):
+	for fourcc_str in ("avc1", "mp4v"):
+		writer = cv2.VideoWriter(path, cv2.VideoWriter_fourcc(*fourcc_str), fps, size)
+		if writer.isOpened():
+			return writer
+	return None
+
+
 class ExportThread(QThread):
 	progress = pyqtSignal(int, int)
 	finished = pyqtSignal(bool, str)
 
 	def __init__(self, video_path, output_path, events,
-	             start_frame=None, end_frame=None):
+	             start_frame=None, end_frame=None, frame_timeline=None):
 		super().__init__()
 		self.video_path = video_path
 		self.output_path = output_path
 		self.events = events
 		self.start_frame = start_frame  # None = beginning
 		self.end_frame = end_frame      # None = end of video
+		self.frame_timeline = frame_timeline
 		self._cancelled = False
 
 	def cancel(self):
@@ -97,23 +87,23 @@ class ExportThread(QThread):
 
 		# Convert frame bounds to milliseconds for accurate seeking/stopping
 		ms_per_frame = 1000.0 / fps
+		if self.frame_timeline is not None:
+			total_frames = len(self.frame_timeline)
 		start_frame = self.start_frame if self.start_frame is not None else 0
 		end_frame = self.end_frame if self.end_frame is not None else total_frames
-		start_ms = start_frame * ms_per_frame
-		end_ms = end_frame * ms_per_frame
+		if self.frame_timeline is not None:
+			# Same frame <-> ms mapping as the player overlay
+			end_ms = self.frame_timeline.frame_to_position(end_frame)
+		else:
+			end_ms = end_frame * ms_per_frame
 		clip_frames = max(1, end_frame - start_frame)
 
 		if start_frame > 0:
-			cap.set(cv2.CAP_PROP_POS_MSEC, start_ms)
-
-		writer = None
-		for fourcc_str in ("avc1", "mp4v"):
-			fourcc = cv2.VideoWriter_fourcc(*fourcc_str)
-			writer = cv2.VideoWriter(self.output_path, fourcc, fps, (width, height))
-			if writer.isOpened():
-				break
+			# Frame seek: OpenCV decodes forward from the preceding keyframe to exactly this frame
+			cap.set(cv2.CAP_PROP_POS_FRAMES, start_frame)
 
-		if not writer or not writer.isOpened():
+		writer = _open_writer(self.output_path, fps, (width, height))
+		if writer is None:
 			cap.release()
 			self.finished.emit(False, "Could not create the output video file.")
 			return
@@ -145,7 +135,7 @@ class ExportThread(QThread):
 			if not ret:
 				break
 
-			texts = _get_visible_texts(pos_ms, sorted_events)
+			texts = visible_badge_texts(pos_ms, sorted_events)
 			if texts:
 				frame = _draw_badges(frame, texts, width)
 
@@ -160,6 +150,132 @@ class ExportThread(QThread):
 		self.finished.emit(True, self.output_path)
 
 
+class ReelExportThread(QThread):
+	"""Renders merged event-clip spans in one forward pass over a single capture.
+
+	Gaps between spans are crossed by grabbing frames, or by a forward seek when
+	the next span starts past another keyframe, so the capture never goes back.
+	Writes one file, or one file per span when `per_clip` is set.
+	"""
+	progress = pyqtSignal(int, int)
+	finished = pyqtSignal(bool, str)
+
+	def __init__(self, video_path, output_path, events, spans,
+	             per_clip=False, keyframe_index=None, frame_timeline=None):
+		super().__init__()
+		self.video_path = video_path
+		self.output_path = output_path
+		self.events = events
+		self.spans = spans
+		self.per_clip = per_clip
+		self.keyframe_index = keyframe_index
+		self.frame_timeline = frame_timeline
+		self._cancelled = False
+
+	def cancel(self):
+		self._cancelled = True
+
+	def clip_path(self, number):
+		base, ext = os.path.splitext(self.output_path)
+		return f"{base}_{number:03d}{ext or '.mp4'}"
+
+	def _to_frame(self, position_ms, ms_per_frame):
+		if self.frame_timeline is not None:
+			return self.frame_timeline.position_to_frame(position_ms)
+		return int(round(position_ms / ms_per_frame))
+
+	def _fail(self, cap, writer, outputs, message):
+		"""Stop with `message`, deleting the partial file; finished per-clip files are kept."""
+		if writer is not None:
+			writer.release()
+			try:
+				os.remove(outputs.pop())
+			except OSError:
+				pass
+		cap.release()
+		if self.per_clip:
+			message += f" {len(outputs)} of {len(self.spans)} clips were completed in {os.path.dirname(self.output_path)}."
+		self.finished.emit(False, message)
+
+	def run(self):
+		cap = cv2.VideoCapture(self.video_path)
+		if not cap.isOpened():
+			self.finished.emit(False, "Could not open the source video.")
+			return
+
+		fps = cap.get(cv2.CAP_PROP_FPS) or 25.0
+		width = int(cap.get(cv2.CAP_PROP_FRAME_WIDTH))
+		height = int(cap.get(cv2.CAP_PROP_FRAME_HEIGHT))
+		ms_per_frame = 1000.0 / fps
+
+		sorted_events = sorted(
+			[e for e in self.events if getattr(e, "position", None) is not None],
+			key=lambda e: e.position,
+		)
+		total = sum(
+			max(1, self._to_frame(s["end"], ms_per_frame) - self._to_frame(s["start"], ms_per_frame))
+			for s in self.spans
+		)
+
+		writer = None
+		outputs = []
+		next_frame = 0      # frame the capture returns on the next read()
+		frames_written = 0
+		for number, span in enumerate(self.spans, start=1):
+			start_frame = self._to_frame(span["start"], ms_per_frame)
+			if start_frame > next_frame:
+				keyframe = self.keyframe_index.keyframe_before(start_frame)[0] if self.keyframe_index is not None else None
+				if keyframe is not None and keyframe > next_frame:
+					cap.set(cv2.CAP_PROP_POS_FRAMES, start_frame)
+				elif keyframe is None and start_frame - next_frame > 2 * fps:
+					cap.set(cv2.CAP_PROP_POS_FRAMES, start_frame)
+				else:
+					for _ in range(start_frame - next_frame):
+						if not cap.grab():
+							break
+				next_frame = start_frame
+
+			if writer is None:
+				path = self.clip_path(number) if self.per_clip else self.output_path
+				writer = _open_writer(path, fps, (width, height))
+				if writer is None:
+					self._fail(cap, writer, outputs, "Could not create the output video file.")
+					return
+				outputs.append(path)
+
+			while True:
+				if self._cancelled:
+					self._fail(cap, writer, outputs, "Export cancelled.")
+					return
+				ret, frame = cap.read()
+				if not ret:
+					break
+				next_frame += 1
+				pos_ms = cap.get(cv2.CAP_PROP_POS_MSEC)
+				if pos_ms >= span["end"]:
+					break
+
+				texts = visible_badge_texts(pos_ms, sorted_events)
+				if texts:
+					frame = _draw_badges(frame, texts, width)
+				writer.write(frame)
+				frames_written += 1
+				if frames_written % 60 == 0:
+					self.progress.emit(frames_written, total)
+
+			if self.per_clip:
+				writer.release()
+				writer = None
+
+		if writer is not None:
+			writer.release()
+		cap.release()
+		if self.per_clip:
+			self.finished.emit(True, f"{len(outputs)} clips in {os.path.dirname(self.output_path)}")
+		else:
+			self.finished.emit(True, self.output_path)
+
+
 class ExportSetupDialog(QDialog):
 	"""Collects optional frame range before export starts."""
 
@@ -220,8 +336,9 @@ class ExportSetupDialog(QDialog):
 
 
 class ExportProgressDialog(QDialog):
-	def __init__(self, parent, video_path, output_path, events,
-	             start_frame, end_frame):
+	"""Runs an ExportThread or ReelExportThread and shows its progress."""
+
+	def __init__(self, parent, thread):
 		super().__init__(parent)
 		self.setWindowTitle("Exporting Video")
 		self.setModal(True)
@@ -245,10 +362,7 @@ class ExportProgressDialog(QDialog):
 		btn_row.addWidget(self._cancel_btn)
 		layout.addLayout(btn_row)
 
-		self._thread = ExportThread(
-			video_path, output_path, events,
-			start_frame=start_frame, end_frame=end_frame,
-		)
+		self._thread = thread
 		self._thread.progress.connect(self._on_progress)
 		self._thread.finished.connect(self._on_finished)
 		self._thread.start()
@@ -287,10 +401,12 @@ def start_export(media_player):
 		                        "There are no annotated events to render.")
 		return
 
-	# Read total frame count for the spinbox bounds
-	cap = cv2.VideoCapture(video_path)
-	total_frames = int(cap.get(cv2.CAP_PROP_FRAME_COUNT)) if cap.isOpened() else 0
-	cap.release()
+	# Read total frame count for the spinbox bounds (exact once the index has been built)
+	total_frames = read_metadata(video_path).get("frame_count")
+	if not total_frames:
+		cap = cv2.VideoCapture(video_path)
+		total_frames = int(cap.get(cv2.CAP_PROP_FRAME_COUNT)) if cap.isOpened() else 0
+		cap.release()
 
 	# Step 1: frame range dialog
 	setup = ExportSetupDialog(media_player, total_frames)
@@ -311,8 +427,62 @@ def start_export(media_player):
 		return
 
 	# Step 3: progress dialog
-	dlg = ExportProgressDialog(
-		media_player, video_path, out_path, events,
-		start_frame, end_frame,
+	thread = ExportThread(
+		video_path, out_path, events,
+		start_frame=start_frame, end_frame=end_frame,
+		frame_timeline=getattr(media_player.main_window, "frame_timeline", None),
+	)
+	dlg = ExportProgressDialog(media_player, thread)
+	dlg.exec_()
+
+
+def start_reel_export(media_player):
+	"""Export the clips of the events currently listed (label filter applied)."""
+	video_path = getattr(media_player, "_current_video_path", None)
+	if not video_path:
+		QMessageBox.warning(media_player, "No Video", "Open a video before exporting.")
+		return
+
+	events = list(getattr(media_player.main_window.list_display, "_visible_events", []))
+	spans = plan_clip_spans(
+		((idx, getattr(e, "position", None)) for idx, e in enumerate(events)),
+		duration=media_player.media_player.duration(),
+		max_span_ms=None,
+	)
+	if not spans:
+		QMessageBox.information(media_player, "No Events",
+		                        "There are no listed events to export clips for.")
+		return
+
+	# Step 1: single reel or one file per clip
+	msg = QMessageBox(media_player)
+	msg.setWindowTitle("Export Event Reel")
+	msg.setText(f"{len(events)} events in {len(spans)} clips. How should they be saved?")
+	reel_btn = msg.addButton("One Video", QMessageBox.ActionRole)
+	clips_btn = msg.addButton("One File per Clip", QMessageBox.ActionRole)
+	msg.addButton(QMessageBox.Cancel)
+	msg.exec_()
+	clicked = msg.clickedButton()
+	if clicked not in (reel_btn, clips_btn):
+		return
+	per_clip = clicked == clips_btn
+
+	# Step 2: choose output path (per-clip files get a _NNN suffix)
+	base, ext = os.path.splitext(video_path)
+	default_out = base + "_reel" + (ext or ".mp4")
+	out_path, _ = QFileDialog.getSaveFileName(
+		media_player, "Save Event Reel", default_out,
+		"Video Files (*.mp4 *.mov *.avi)",
+	)
+	if not out_path:
+		return
+
+	# Step 3: progress dialog
+	thread = ReelExportThread(
+		video_path, out_path, events, spans,
+		per_clip=per_clip,
+		keyframe_index=getattr(media_player, "keyframe_index", None),
+		frame_timeline=getattr(media_player.main_window, "frame_timeline", None),
 	)
+	dlg = ExportProgressDialog(media_player, thread)
 	dlg.exec_()
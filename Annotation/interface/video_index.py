@@ -0,0 +1,104 @@
+import threading
+
+from PyQt5.QtCore import QObject, pyqtSignal
+
+from utils.playback_proxy import build_proxy
+
+# The index modules (and numpy) are imported by the worker threads, not at startup
+
+
+class VideoIndexer(QObject):
+	"""Builds per-video seek indexes in the background the first time a video is opened.
+
+	One packet scan produces both the keyframe index and the frame timeline.
+	Work runs on daemon threads so a half-built index never blocks closing the
+	app; results come back to the GUI thread through `index_ready`.
+	"""
+	index_ready = pyqtSignal(str, object, object)
+
+	def start(self, video_path):
+		threading.Thread(target=self._run, args=(video_path,), daemon=True).start()
+
+	def _run(self, video_path):
+		from utils.frame_timeline import build_frame_timeline, load_frame_timeline
+		from utils.keyframe_index import build_keyframe_index, load_keyframe_index, scan_packets
+
+		keyframe_index = load_keyframe_index(video_path)
+		frame_timeline = load_frame_timeline(video_path)
+		if keyframe_index is None or frame_timeline is None:
+			try:
+				scanned = scan_packets(video_path)
+				if scanned is not None:
+					keyframe_index = build_keyframe_index(video_path, scanned)
+					frame_timeline = build_frame_timeline(video_path, scanned[0])
+			except Exception as e:
+				print(f"Video index build failed for {video_path}: {e}")
+		self.index_ready.emit(video_path, keyframe_index, frame_timeline)
+
+
+class ProxyBuilder(QObject):
+	"""Transcodes the low-res playback proxy in the background (see utils.playback_proxy)."""
+	proxy_ready = pyqtSignal(str, str)
+
+	def __init__(self, parent=None):
+		super().__init__(parent)
+		self._cancel_event = None
+		self._thread = None
+
+	def start(self, video_path):
+		self.cancel()
+		self._cancel_event = threading.Event()
+		self._thread = threading.Thread(target=self._run, args=(video_path, self._cancel_event), daemon=True)
+		self._thread.start()
+
+	def cancel(self):
+		if self._cancel_event is not None:
+			self._cancel_event.set()
+			self._cancel_event = None
+
+	def is_running(self):
+		return self._cancel_event is not None and self._thread.is_alive()
+
+	def _run(self, video_path, cancel_event):
+		try:
+			proxy_path = build_proxy(video_path, cancel_event)
+		except Exception as e:
+			print(f"Playback proxy build failed for {video_path}: {e}")
+			proxy_path = None
+		if proxy_path and not cancel_event.is_set():
+			self.proxy_ready.emit(video_path, proxy_path)
+
+
+class MotionIndexer(QObject):
+	"""Builds the motion / shot-cut index in the background (see utils.motion_index)."""
+	index_ready = pyqtSignal(str, object)
+
+	def __init__(self, parent=None):
+		super().__init__(parent)
+		self._cancel_event = None
+		self._thread = None
+
+	def start(self, video_path):
+		self.cancel()
+		self._cancel_event = threading.Event()
+		self._thread = threading.Thread(target=self._run, args=(video_path, self._cancel_event), daemon=True)
+		self._thread.start()
+
+	def cancel(self):
+		if self._cancel_event is not None:
+			self._cancel_event.set()
+			self._cancel_event = None
+
+	def is_running(self):
+		return self._cancel_event is not None and self._thread.is_alive()
+
+	def _run(self, video_path, cancel_event):
+		from utils.motion_index import build_motion_index
+
+		try:
+			index = build_motion_index(video_path, cancel_event)
+		except Exception as e:
+			print(f"Motion index build failed for {video_path}: {e}")
+			index = None
+		if index is not None and not cancel_event.is_set():
+			self.index_ready.emit(video_path, index)
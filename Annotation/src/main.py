@@ -1,11 +1,42 @@
 import sys
-from PyQt5.QtWidgets import QApplication
 
-from interface.main_window import MainWindow
+from utils import startup_profile
 
-if __name__ == "__main__":
 
-	application = QApplication(sys.argv)
-	window = MainWindow()
-	window.showMaximized()
-	sys.exit(application.exec_())
\ No newline at end of file
+def main():
+	if "--profile-startup" in sys.argv:
+		sys.argv.remove("--profile-startup")
+		startup_profile.enable()
+
+	# --record-session PATH logs input and player positions for benchmarks/replay_session.py
+	record_path = None
+	if "--record-session" in sys.argv:
+		i = sys.argv.index("--record-session")
+		record_path = sys.argv[i + 1] if i + 1 < len(sys.argv) else "session.jsonl.gz"
+		del sys.argv[i:i + 2]
+
+	with startup_profile.span("import PyQt5.QtWidgets"):
+		from PyQt5.QtWidgets import QApplication
+		from PyQt5.QtCore import QTimer
+
+	with startup_profile.span("import interface.main_window"):
+		from interface.main_window import MainWindow
+
+	with startup_profile.span("QApplication()"):
+		application = QApplication(sys.argv)
+	with startup_profile.span("MainWindow()"):
+		window = MainWindow()
+	with startup_profile.span("showMaximized()"):
+		window.showMaximized()
+	if record_path:
+		from interface.session_recorder import SessionRecorder
+		window.session_recorder = SessionRecorder(window, record_path)
+	if startup_profile.enabled():
+		QTimer.singleShot(0, startup_profile.report)
+	sys.exit(application.exec_())
+
+
+# Everything runs from main(): spawned worker processes (thumbnail atlas,
+# motion index pool) re-import this module as __mp_main__ and must not load Qt
+if __name__ == "__main__":
+	main()
@@ -0,0 +1,93 @@
+from bisect import bisect_right
+
+# Clip windows around events, merged into continuous spans so dense sequences
+# are reviewed (or exported) once instead of once per event.
+
+CLIP_BEFORE_MS = 2000
+CLIP_AFTER_MS = 4000
+
+# Longest span played as one clip; longer merged runs are cut into contiguous pieces
+MAX_SPAN_MS = 60000
+
+
+def plan_clip_spans(events, duration=None, before_ms=CLIP_BEFORE_MS, after_ms=CLIP_AFTER_MS, max_span_ms=MAX_SPAN_MS):
+	"""Merge per-event windows into spans.
+
+	`events` is an iterable of (row, position_ms). Returns spans sorted by time,
+	each a dict with:
+	  start, end  span bounds in ms
+	  marks       [(switch_ms, row), ...]: row to highlight from switch_ms on
+	              (an event takes over halfway between the previous event and itself,
+	              so each event's row is highlighted at its own timestamp)
+	  rows        rows in mark order
+	  row         first highlighted row
+	  row_starts  {row: ms}: where playback starts for that event (its own window, clipped to the span)
+	Overlapping or touching windows are merged; `max_span_ms=None` disables cutting.
+	"""
+	windows = []
+	for row, position in events:
+		if position is None:
+			continue
+		position = int(position)
+		start = max(0, position - before_ms)
+		end = position + after_ms
+		if duration and end > duration:
+			end = duration
+		if end <= start:
+			continue
+		windows.append((start, end, row, position))
+	# By position; window starts are then in order too
+	windows.sort(key=lambda w: w[3])
+
+	merged = []
+	for start, end, row, position in windows:
+		if merged and start <= merged[-1]["end"]:
+			span = merged[-1]
+			span["end"] = max(span["end"], end)
+			# Rounded up, so events 1 ms apart still each own their timestamp
+			span["marks"].append(((span["last"] + position + 1) // 2, row))
+			span["last"] = position
+			span["row_starts"][row] = start
+		else:
+			merged.append({"start": start, "end": end, "marks": [(start, row)], "last": position, "row_starts": {row: start}})
+
+	spans = []
+	for span in merged:
+		marks = span["marks"]
+		if not max_span_ms:
+			spans.append(_span(span["start"], span["end"], marks, span["row_starts"]))
+			continue
+		i = 0
+		active = marks[0][1]
+		start = span["start"]
+		while start < span["end"]:
+			end = min(span["end"], start + max_span_ms)
+			while i < len(marks) and marks[i][0] <= start:
+				active = marks[i][1]
+				i += 1
+			piece = [(start, active)]
+			while i < len(marks) and marks[i][0] < end:
+				piece.append(marks[i])
+				active = marks[i][1]
+				i += 1
+			spans.append(_span(start, end, piece, span["row_starts"]))
+			start = end
+	return spans
+
+
+def _span(start, end, marks, row_starts):
+	return {
+		"start": start,
+		"end": end,
+		"marks": marks,
+		"rows": [row for _, row in marks],
+		"row": marks[0][1],
+		"row_starts": {row: min(end, max(start, row_starts[row])) for _, row in marks},
+	}
+
+
+def row_at(span, position):
+	"""Row to highlight at `position` inside `span`."""
+	times = [t for t, _ in span["marks"]]
+	i = max(0, bisect_right(times, position) - 1)
+	return span["marks"][i][1]
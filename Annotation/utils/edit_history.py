@@ -0,0 +1,80 @@
+from collections import deque
+
+# Undo/redo for annotation edits. A step is a tuple of single-event operations,
+# so the history costs a few small tuples per step instead of list copies:
+#   ("add", event)       event was inserted
+#   ("delete", event)    event was removed (the object is kept for undo)
+#   ("move", event, old_position, old_frame, new_position, new_frame)
+# Steps are applied through ListManager's incremental add/delete/move.
+
+ADD = "add"
+DELETE = "delete"
+MOVE = "move"
+
+MAX_STEPS = 5000
+
+
+def move_op(event, old_position, old_frame):
+	"""Operation for `event` having moved from (old_position, old_frame) to where it is now."""
+	if event.position == old_position and event.frame == old_frame:
+		return None
+	return (MOVE, event, old_position, old_frame, event.position, event.frame)
+
+
+def _apply(list_manager, op, undo):
+	kind, event = op[0], op[1]
+	if kind == MOVE:
+		position, frame = (op[2], op[3]) if undo else (op[4], op[5])
+		list_manager.move_event(event, position, frame)
+	elif (kind == ADD) == undo:
+		list_manager.delete_event(event)
+	else:
+		list_manager.add_event(event)
+	return event
+
+
+class EditHistory:
+
+	def __init__(self, max_steps=MAX_STEPS):
+		self._undo = deque(maxlen=max_steps)
+		self._redo = list()
+
+	def record(self, *ops):
+		"""Push one undo step made of `ops` (None entries are ignored); clears the redo stack."""
+		ops = tuple(op for op in ops if op)
+		if not ops:
+			return
+		self._undo.append(ops)
+		self._redo.clear()
+
+	def clear(self):
+		self._undo.clear()
+		self._redo.clear()
+
+	def can_undo(self):
+		return bool(self._undo)
+
+	def can_redo(self):
+		return bool(self._redo)
+
+	def undo(self, list_manager):
+		"""Revert the last step; returns the event it touched last, or None if there was nothing to undo."""
+		if not self._undo:
+			return None
+		ops = self._undo.pop()
+		event = None
+		for op in reversed(ops):
+			event = _apply(list_manager, op, undo=True)
+		self._redo.append(ops)
+		return event
+
+	def redo(self, list_manager):
+		"""Re-apply the last undone step; returns the event it touched last, or None."""
+		if not self._redo:
+			return None
+		ops = self._redo.pop()
+		event = None
+		for op in ops:
+			event = _apply(list_manager, op, undo=False)
+		self._undo.append(ops)
+		return event
@@ -0,0 +1,45 @@
+# Badge text for events passing the playhead: shared by the live overlay and the
+# exporter, and kept free of Qt/OpenCV so it can be benchmarked on its own.
+
+
+def badge_text(event):
+	label = event.label or "Event"
+	subtype = getattr(event, "subType", None)
+	if subtype and subtype != "None":
+		return f"{label} ({subtype})"
+	return label
+
+
+def passing_event_entries(events, current_frame, frames_visible, accept=None):
+	"""(badge text, frame) for events whose badge window covers `current_frame`, in frame order.
+
+	An event is shown for `frames_visible` frames starting at its own frame;
+	`accept` optionally filters events (display filter).
+	"""
+	matching = [
+		event for event in events
+		if getattr(event, "frame", None) is not None
+		and event.frame <= current_frame < event.frame + frames_visible
+		and (accept is None or accept(event))
+	]
+	matching.sort(key=lambda e: e.frame)
+	return [(badge_text(event), event.frame) for event in matching]
+
+
+def visible_badge_texts(pos_ms, sorted_events, visibility_ms=2000):
+	"""Return badge strings for events visible at pos_ms.
+
+	Uses event.position (milliseconds) to match the live overlay exactly,
+	avoiding frame-count drift on variable-frame-rate videos. `sorted_events`
+	must be sorted by position.
+	"""
+	texts = []
+	for event in sorted_events:
+		ep = getattr(event, "position", None)
+		if ep is None:
+			continue
+		if ep > pos_ms + visibility_ms:
+			break
+		if ep <= pos_ms < ep + visibility_ms:
+			texts.append(badge_text(event))
+	return texts
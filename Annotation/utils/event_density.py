@@ -0,0 +1,108 @@
+import numpy as np
+
+# Event counts per label in fixed time bins, for the density strip under the
+# seek slider. Counts change by +/-1 per list edit; level-of-detail pyramids
+# (bins summed pairwise) are rebuilt lazily, so rendering any width or zoom
+# costs O(labels x bins) and never walks the events.
+
+BIN_MS = 250
+
+
+class EventDensity:
+
+	def __init__(self, bin_ms=BIN_MS):
+		self.bin_ms = bin_ms
+		self.labels = dict()    # label -> row in counts
+		self.counts = np.zeros((0, 0), dtype=np.int32)
+		self.version = 0
+		self._levels = None
+
+	def __len__(self):
+		"""Span covered, in bins."""
+		return self.counts.shape[1]
+
+	def _row(self, label):
+		row = self.labels.get(label)
+		if row is None:
+			row = self.labels[label] = len(self.labels)
+		return row
+
+	def _fit(self, rows, bins):
+		"""Grow the count table to at least `rows` x `bins` (doubling bins to keep growth amortised)."""
+		have_rows, have_bins = self.counts.shape
+		if rows <= have_rows and bins <= have_bins:
+			return
+		if bins > have_bins and have_bins:
+			bins = max(bins, have_bins * 2)
+		grown = np.zeros((max(rows, have_rows), max(bins, have_bins)), dtype=np.int32)
+		grown[:have_rows, :have_bins] = self.counts
+		self.counts = grown
+
+	def _changed(self):
+		self._levels = None
+		self.version += 1
+
+	def reset(self, events, duration_ms=0):
+		"""Recount from scratch (after a reload)."""
+		self.labels = dict()
+		self.counts = np.zeros((0, 0), dtype=np.int32)
+		events = [e for e in events if getattr(e, "position", None) is not None]
+		rows = np.fromiter((self._row(e.label) for e in events), dtype=np.int64, count=len(events))
+		bins = np.fromiter((max(0, int(e.position)) // self.bin_ms for e in events), dtype=np.int64, count=len(events))
+		n_bins = max(int(bins.max()) + 1 if len(bins) else 0, -(-int(duration_ms) // self.bin_ms))
+		self._fit(len(self.labels), n_bins)
+		np.add.at(self.counts, (rows, bins), 1)
+		self._changed()
+
+	def set_duration(self, duration_ms):
+		before = self.counts.shape
+		self._fit(self.counts.shape[0], -(-int(duration_ms) // self.bin_ms))
+		if self.counts.shape != before:
+			self._changed()
+
+	def update(self, event, delta):
+		"""Count `event` in (delta=1) or out (delta=-1)."""
+		if getattr(event, "position", None) is None:
+			return
+		row = self._row(event.label)
+		b = max(0, int(event.position)) // self.bin_ms
+		self._fit(row + 1, b + 1)
+		self.counts[row, b] = max(0, self.counts[row, b] + delta)
+		self._changed()
+
+	def level(self, k):
+		"""Counts with bins 2**k times wider than the base bins."""
+		if self._levels is None:
+			self._levels = [self.counts]
+		while len(self._levels) <= k:
+			prev = self._levels[-1]
+			if prev.shape[1] % 2:
+				prev = np.pad(prev, ((0, 0), (0, 1)))
+			self._levels.append(prev[:, 0::2] + prev[:, 1::2])
+		return self._levels[k]
+
+	def columns(self, start_ms, end_ms, width):
+		"""Event density of [start_ms, end_ms) in `width` columns: a (labels x width) float array.
+
+		Each column holds the mean count per bin of the coarsest level that still
+		has at least one bin per column, so columns covering one or two bins
+		compare fairly. Only relative values matter to the strip.
+		"""
+		width = max(1, int(width))
+		n_rows = self.counts.shape[0]
+		if not n_rows or end_ms <= start_ms:
+			return np.zeros((n_rows, width), dtype=np.float32)
+		bins_per_px = (end_ms - start_ms) / self.bin_ms / width
+		k = max(0, int(np.floor(np.log2(bins_per_px)))) if bins_per_px >= 2 else 0
+		counts = self.level(k)
+		level_ms = self.bin_ms << k
+		first = int(start_ms // level_ms)
+		n_bins = max(1, int(-(-end_ms // level_ms)) - first)
+		window = counts[:, first:first + n_bins]
+		if window.shape[1] < n_bins:
+			# The range runs past the counted span (duration not known yet)
+			window = np.pad(window, ((0, 0), (0, n_bins - window.shape[1])))
+		# Column c covers bins [edges[c], edges[c + 1]); zoomed in, one bin spans several columns
+		edges = (np.arange(width) * window.shape[1]) // width
+		spans = np.maximum(1, np.diff(np.append(edges, window.shape[1])))
+		return np.add.reduceat(window, edges, axis=1) / spans.astype(np.float32)
@@ -0,0 +1,63 @@
+import os
+
+import numpy as np
+
+from utils.video_cache import cache_path
+
+# Per-video presentation timestamps (int64 microseconds, one per frame, relative
+# to the first frame). Frame numbers and millisecond positions are converted
+# through this table so variable-frame-rate footage does not drift.
+
+FRAME_TIMELINE_FILE = "frame_pts.npy"
+
+
+class FrameTimeline:
+
+	def __init__(self, pts_us):
+		self.pts_us = pts_us
+
+	def __len__(self):
+		return len(self.pts_us)
+
+	def position_to_frame(self, position_ms):
+		"""Frame whose timestamp is nearest to `position_ms` (O(log n))."""
+		count = len(self.pts_us)
+		t = int(round(position_ms * 1000))
+		i = int(np.searchsorted(self.pts_us, t, side="left"))
+		if i >= count:
+			return count - 1
+		if i > 0 and t - int(self.pts_us[i - 1]) <= int(self.pts_us[i]) - t:
+			return i - 1
+		return i
+
+	def frame_to_position(self, frame):
+		"""Presentation time of `frame` in ms; extrapolated past the last frame."""
+		count = len(self.pts_us)
+		frame = max(0, int(frame))
+		if frame < count:
+			return int(round(int(self.pts_us[frame]) / 1000.0))
+		last = int(self.pts_us[-1])
+		step = last - int(self.pts_us[-2]) if count > 1 else 40000
+		return int(round((last + (frame - count + 1) * step) / 1000.0))
+
+
+def load_frame_timeline(video_path):
+	"""Return the persisted FrameTimeline for `video_path`, or None if not built yet."""
+	path = cache_path(video_path, FRAME_TIMELINE_FILE, create=False)
+	if not os.path.isfile(path):
+		return None
+	try:
+		pts_us = np.load(path, mmap_mode="r")
+	except (OSError, ValueError):
+		return None
+	return FrameTimeline(pts_us) if len(pts_us) else None
+
+
+def build_frame_timeline(video_path, pts_seconds):
+	"""Persist sorted per-frame timestamps (seconds) from a packet scan."""
+	pts_us = np.round(np.asarray(pts_seconds, dtype=np.float64) * 1_000_000).astype(np.int64)
+	path = cache_path(video_path, FRAME_TIMELINE_FILE)
+	tmp_path = path + ".tmp.npy"
+	np.save(tmp_path, pts_us)
+	os.replace(tmp_path, path)
+	return FrameTimeline(pts_us)
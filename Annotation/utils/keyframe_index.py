@@ -0,0 +1,127 @@
+import os
+import shutil
+import subprocess
+from bisect import bisect_right
+
+import numpy as np
+
+from utils.video_cache import cache_path, write_metadata
+
+# Keyframe (GOP) index per video: one row per keyframe with
+#   frame number (presentation order), PTS in microseconds, byte offset (-1 if unknown)
+# PTS are relative to the first frame, matching OpenCV's CAP_PROP_POS_MSEC.
+
+KEYFRAME_INDEX_FILE = "keyframes.npy"
+
+
+class KeyframeIndex:
+
+	def __init__(self, table):
+		self.table = table
+		# Frame column as a plain list for bisect (a few thousand keyframes per game)
+		self._frames = table[:, 0].tolist()
+
+	def __len__(self):
+		return len(self._frames)
+
+	def keyframe_before(self, frame):
+		"""Return (keyframe_number, pts_ms, byte_offset) of the last keyframe at or before `frame`."""
+		i = max(0, bisect_right(self._frames, frame) - 1)
+		kf_frame, pts_us, offset = self.table[i]
+		return int(kf_frame), pts_us / 1000.0, int(offset)
+
+	def keyframe_after(self, frame):
+		"""Return the first keyframe strictly after `frame`, or None past the last GOP."""
+		i = bisect_right(self._frames, frame)
+		if i >= len(self._frames):
+			return None
+		kf_frame, pts_us, offset = self.table[i]
+		return int(kf_frame), pts_us / 1000.0, int(offset)
+
+
+def load_keyframe_index(video_path):
+	"""Return the persisted KeyframeIndex for `video_path`, or None if not built yet."""
+	path = cache_path(video_path, KEYFRAME_INDEX_FILE, create=False)
+	if not os.path.isfile(path):
+		return None
+	try:
+		return KeyframeIndex(np.load(path, mmap_mode="r"))
+	except (OSError, ValueError):
+		return None
+
+
+def _probe_packets_ffprobe(video_path):
+	"""Yield (pts_seconds, byte_pos, is_key) for every video packet, in decode order."""
+	proc = subprocess.Popen(
+		[
+			"ffprobe", "-v", "error", "-select_streams", "v:0",
+			"-show_entries", "packet=pts_time,pos,flags", "-of", "csv=p=0", video_path,
+		],
+		stdout=subprocess.PIPE, stderr=subprocess.DEVNULL, text=True,
+	)
+	for line in proc.stdout:
+		parts = line.strip().split(",")
+		if len(parts) < 3 or parts[0] in ("", "N/A"):
+			continue
+		pos = int(parts[1]) if parts[1].isdigit() else -1
+		yield float(parts[0]), pos, "K" in parts[2]
+	proc.wait()
+
+
+def _probe_packets_opencv(video_path):
+	"""Packet scan through OpenCV's raw (undecoded) FFmpeg mode; byte offsets are unknown."""
+	import cv2
+
+	has_key = getattr(cv2, "CAP_PROP_LRF_HAS_KEY_FRAME", None)
+	if has_key is None:
+		return
+	cap = cv2.VideoCapture(video_path, cv2.CAP_FFMPEG, [cv2.CAP_PROP_FORMAT, -1])
+	if not cap.isOpened():
+		return
+	try:
+		while cap.grab():
+			yield cap.get(cv2.CAP_PROP_POS_MSEC) / 1000.0, -1, bool(cap.get(has_key))
+	finally:
+		cap.release()
+
+
+def scan_packets(video_path):
+	"""Return (pts_seconds, byte_pos, is_key) arrays in presentation order."""
+	source = _probe_packets_ffprobe if shutil.which("ffprobe") else _probe_packets_opencv
+	packets = list(source(video_path))
+	if not packets:
+		return None
+	pts = np.array([p[0] for p in packets], dtype=np.float64)
+	pos = np.array([p[1] for p in packets], dtype=np.int64)
+	key = np.array([p[2] for p in packets], dtype=bool)
+	order = np.argsort(pts, kind="stable")
+	return pts[order] - pts[order[0]], pos[order], key[order]
+
+
+def build_keyframe_index(video_path, scanned=None):
+	"""Persist the keyframe index of `video_path` (scanning it unless `scanned` is given).
+
+	Returns the index, or None if the video could not be scanned.
+	"""
+	if scanned is None:
+		scanned = scan_packets(video_path)
+	if scanned is None:
+		return None
+	pts, pos, key = scanned
+
+	frames = np.flatnonzero(key)
+	if not len(frames) or frames[0] != 0:
+		# Decoding always starts at the first frame; treat it as a seek point
+		frames = np.concatenate(([0], frames))
+	table = np.stack([
+		frames.astype(np.int64),
+		np.round(pts[frames] * 1_000_000).astype(np.int64),
+		pos[frames],
+	], axis=1)
+
+	path = cache_path(video_path, KEYFRAME_INDEX_FILE)
+	tmp_path = path + ".tmp.npy"
+	np.save(tmp_path, table)
+	os.replace(tmp_path, path)
+	write_metadata(video_path, frame_count=int(len(pts)), keyframe_count=int(len(frames)))
+	return KeyframeIndex(table)
@@ -1,19 +1,55 @@
+from utils import perf
+from utils.edit_history import EditHistory
 from utils.event_class import Event, ms_to_time
+from bisect import bisect_right
 import json
 import os
 
+
+def _sort_key(event):
+	if getattr(event, "frame", None) is not None:
+		return event.frame
+	return getattr(event, "position", 0)
+
+
 class ListManager:
 
 	def __init__(self):
 
 		self.event_list = list()
 
+		# Frame-occupancy index: half -> {frame: number of events on that frame}
+		self._occupied = dict()
+
+		# Optional ms -> frame converter for events saved without a frame number
+		# (the main window plugs in its timestamp-exact mapping)
+		self.frame_for_position = None
+
+		# Undo/redo of adds, deletes and moves (recorded by the UI, see utils/edit_history.py)
+		self.history = EditHistory()
+
+		# Mutation callbacks, see add_listener()
+		self._listeners = list()
+
+	def add_listener(self, callback):
+		"""Call `callback(kind, event)` after each change to event_list.
+
+		kind is "add" or "delete" for one event (a move is a delete followed by
+		an add), or "reset" with event None after a bulk reload or re-sort.
+		"""
+		self._listeners.append(callback)
+
+	def _notify(self, kind, event=None):
+		for callback in self._listeners:
+			callback(kind, event)
+
 	def create_list_from_json(self, path, half):
 
 		self.event_list.clear()
 		if os.path.isfile(path):
 			self.event_list = self.read_json(path, half)
-			self.sort_list()
+		self.sort_list()
+		self.history.clear()
 
 	def create_text_list(self):
 
@@ -25,27 +61,38 @@ class ListManager:
 
 	def delete_event(self, target):
 		if isinstance(target, Event):
-			self.event_list.remove(target)
+			try:
+				self.event_list.remove(target)
+			except ValueError:
+				return False
 		else:
 			if target is None:
 				return False
 			if target < 0 or target >= len(self.event_list):
 				return False
-			self.event_list.pop(target)
+			target = self.event_list.pop(target)
 
-		self.sort_list()
+		self._index_event(target, -1)
+		self._notify("delete", target)
 		return True
 
 
 	def add_event(self, event):
-
-		self.event_list.append(event)
-		self.sort_list()
+		"""Insert `event` at its sorted slot; returns its index."""
+		index = bisect_right(self.event_list, _sort_key(event), key=_sort_key)
+		self.event_list.insert(index, event)
+		self._index_event(event, 1)
+		self._notify("add", event)
+		return index
 
 	def find_event_by_frame(self, frame, half=None, exclude=None):
 		if frame is None:
 			return None
 
+		# Fast path: most lookups are for free frames
+		if half is not None and not self._occupied.get(half, {}).get(frame):
+			return None
+
 		for event in self.event_list:
 			if exclude is not None and event is exclude:
 				continue
@@ -80,13 +127,75 @@ class ListManager:
 		return True, new_index
 
 
-	def sort_list(self):
-		def sort_key(event):
-			if getattr(event, "frame", None) is not None:
-				return event.frame
-			return getattr(event, "position", 0)
+	def move_event(self, event, new_position_ms, new_frame):
+		"""Move one event in place, keeping the list sorted and the occupancy index current.
 
-		self.event_list = sorted(self.event_list, key=sort_key, reverse=False)
+		Returns the event's new index in event_list.
+		"""
+		self._index_event(event, -1)
+		try:
+			self.event_list.remove(event)
+			self._notify("delete", event)
+		except ValueError:
+			pass
+
+		event.position = max(0, int(new_position_ms))
+		event.time = ms_to_time(event.position)
+		event.frame = new_frame
+
+		index = bisect_right(self.event_list, _sort_key(event), key=_sort_key)
+		self.event_list.insert(index, event)
+		self._index_event(event, 1)
+		self._notify("add", event)
+		return index
+
+	def is_frame_free(self, frame, half, exclude=None):
+		count = self._occupied.get(half, {}).get(frame, 0)
+		if exclude is not None and exclude.half == half and exclude.frame == frame:
+			count -= 1
+		return count <= 0
+
+	def next_free_frame(self, frame, direction, half, exclude=None, stride=1, max_frame=None):
+		"""Return the first frame at or after `frame`, stepping `stride` frames in `direction`
+		(+1 / -1), that holds no event of `half` other than `exclude`.
+
+		The search stops at frame 0 and `max_frame`, which are returned even if occupied.
+		"""
+		stride = max(1, int(stride))
+		step = stride if direction >= 0 else -stride
+		frame = max(0, frame)
+		if max_frame is not None:
+			frame = min(frame, max_frame)
+
+		while not self.is_frame_free(frame, half, exclude):
+			frame += step
+			if frame <= 0:
+				return 0
+			if max_frame is not None and frame >= max_frame:
+				return max_frame
+		return frame
+
+	def _index_event(self, event, delta):
+		frame = getattr(event, "frame", None)
+		if frame is None:
+			return
+		frames = self._occupied.setdefault(event.half, dict())
+		count = frames.get(frame, 0) + delta
+		if count > 0:
+			frames[frame] = count
+		else:
+			frames.pop(frame, None)
+
+	def reindex(self):
+		self._occupied = dict()
+		for event in self.event_list:
+			self._index_event(event, 1)
+
+	def sort_list(self):
+		self.event_list = sorted(self.event_list, key=_sort_key, reverse=False)
+		# Events may have been edited in place before a sort; rebuild the occupancy index
+		self.reindex()
+		self._notify("reset")
 
 	def soccerNetToV2(self,label):
 
@@ -137,12 +246,18 @@ class ListManager:
 						except (TypeError, ValueError):
 							tmp_frame = None
 					if tmp_frame is None:
-						tmp_frame = int(tmp_position // 40) if tmp_position >= 0 else 0
+						if tmp_position < 0:
+							tmp_frame = 0
+						elif self.frame_for_position is not None:
+							tmp_frame = self.frame_for_position(tmp_position)
+						else:
+							tmp_frame = int(tmp_position // 40)
 					tmp_note_raw = event.get("note", None)
 					tmp_note = None if (tmp_note_raw is None or str(tmp_note_raw) == "None") else str(tmp_note_raw)
 					event_list.append(Event(tmp_label, tmp_half, tmp_time, tmp_subType, tmp_position, tmp_visibility, tmp_frame, note=tmp_note))
 		return event_list
 
+	@perf.timed("save_file")
 	def save_file(self, path, half):
 
 		final_list = list()
@@ -174,5 +289,10 @@ class ListManager:
 			data = {}
 		data["annotations"] = annotations_dictionary
 
-		with open(path, "w") as save_file:
+		# Write a sibling file and swap it in, so a crash mid-save never leaves a truncated file
+		tmp_path = path + ".tmp"
+		with open(tmp_path, "w") as save_file:
 			json.dump(data, save_file, indent=4, sort_keys=True)
+			save_file.flush()
+			os.fsync(save_file.fileno())
+		os.replace(tmp_path, path)
@@ -0,0 +1,223 @@
+import multiprocessing
+import os
+from concurrent.futures import FIRST_COMPLETED, ProcessPoolExecutor, wait
+
+import numpy as np
+
+from utils.playback_proxy import find_proxy
+from utils.video_cache import cache_path, read_metadata
+
+# Per-frame motion energy and shot-cut score for jump-to-action navigation,
+# one float16 row per frame: (motion, cut), both in 0..1.
+#   motion  mean absolute difference to the previous frame on a small grayscale copy
+#   cut     half the L1 distance between the two frames' grey-level histograms
+# The video (its proxy when there is one: same frame numbers, cheaper decode)
+# is analysed in chunks on a process pool and cached per game like the seek
+# indexes. Cuts, high-motion stretches and skippable still stretches are
+# derived when the index is loaded, so thresholds can change without a rebuild.
+
+MOTION_INDEX_FILE = "motion.npy"
+
+ANALYSIS_WIDTH = 96
+HIST_BINS = 32
+CHUNK_FRAMES = 1500
+
+CUT_THRESHOLD = 0.45
+MIN_SHOT_S = 1.0                # cuts closer together keep only the strongest
+SMOOTH_S = 1.0                  # motion is averaged over this window before thresholding
+HIGH_MOTION_PERCENTILE = 75
+HIGH_MOTION_MIN_RATIO = 1.5     # ...and at least this multiple of the median
+MIN_HIGH_S = 1.0
+LOW_MOTION_FRACTION = 0.4       # "still" = below this fraction of the game's median motion
+MIN_SKIP_S = 3.0                # shorter still stretches are played normally
+
+# Decoder processes for a build; it runs next to playback, so it never takes every core
+MAX_WORKERS = 2
+# How often a cancelled build is noticed: by the parent, and by workers (in frames)
+CANCEL_POLL_S = 0.25
+CANCEL_CHECK_FRAMES = 50
+
+
+def _runs(mask):
+	"""(starts, ends) of the True runs in `mask`, ends exclusive."""
+	padded = np.concatenate(([False], mask, [False]))
+	edges = np.flatnonzero(padded[1:] != padded[:-1])
+	return edges[0::2], edges[1::2]
+
+
+def _moving_average(values, window):
+	count = len(values)
+	if window <= 1 or not count:
+		return values
+	csum = np.concatenate(([0.0], np.cumsum(values, dtype=np.float64)))
+	low = np.clip(np.arange(count) - window // 2, 0, count)
+	high = np.clip(low + window, 0, count)
+	return ((csum[high] - csum[low]) / np.maximum(1, high - low)).astype(np.float32)
+
+
+def _cut_frames(score, threshold, min_gap):
+	"""Frames scoring above `threshold`, keeping the strongest of any closer than `min_gap`."""
+	frames = np.flatnonzero(score >= threshold)
+	if not len(frames):
+		return frames
+	groups = np.split(frames, np.flatnonzero(np.diff(frames) >= min_gap) + 1)
+	return np.array([group[np.argmax(score[group])] for group in groups], dtype=np.int64)
+
+
+class MotionIndex:
+
+	def __init__(self, table, fps=None):
+		self.table = table
+		fps = fps or 25.0
+		motion = np.asarray(table[:, 0], dtype=np.float32)
+		self.motion = _moving_average(motion, int(round(SMOOTH_S * fps)))
+		self.cuts = _cut_frames(np.asarray(table[:, 1], dtype=np.float32), CUT_THRESHOLD, max(1, int(round(MIN_SHOT_S * fps))))
+
+		median = float(np.median(self.motion)) if len(self.motion) else 0.0
+		if median > 0:
+			high = max(float(np.percentile(self.motion, HIGH_MOTION_PERCENTILE)), HIGH_MOTION_MIN_RATIO * median)
+			starts, ends = _runs(self.motion >= high)
+			self.high_starts = starts[ends - starts >= int(round(MIN_HIGH_S * fps))]
+		else:
+			self.high_starts = np.zeros(0, dtype=np.int64)
+		starts, ends = _runs(self.motion < LOW_MOTION_FRACTION * median)
+		keep = ends - starts >= int(round(MIN_SKIP_S * fps))
+		self.low_starts, self.low_ends = starts[keep], ends[keep]
+
+	def __len__(self):
+		return len(self.table)
+
+	def next_cut(self, frame):
+		i = int(np.searchsorted(self.cuts, frame, side="right"))
+		return int(self.cuts[i]) if i < len(self.cuts) else None
+
+	def previous_cut(self, frame):
+		i = int(np.searchsorted(self.cuts, frame, side="left")) - 1
+		return int(self.cuts[i]) if i >= 0 else None
+
+	def next_high_motion(self, frame):
+		"""Start of the next high-motion stretch after `frame`, or None."""
+		i = int(np.searchsorted(self.high_starts, frame, side="right"))
+		return int(self.high_starts[i]) if i < len(self.high_starts) else None
+
+	def low_motion_run(self, frame):
+		"""(start, end) frames of the first skippable still stretch ending after `frame`, or None."""
+		i = int(np.searchsorted(self.low_ends, frame, side="right"))
+		if i >= len(self.low_ends):
+			return None
+		return int(self.low_starts[i]), int(self.low_ends[i])
+
+
+def load_motion_index(video_path):
+	"""Return the persisted MotionIndex for `video_path`, or None if not built yet."""
+	path = cache_path(video_path, MOTION_INDEX_FILE, create=False)
+	if not os.path.isfile(path):
+		return None
+	try:
+		table = np.load(path, mmap_mode="r")
+	except (OSError, ValueError):
+		return None
+	return MotionIndex(table, read_metadata(video_path).get("fps")) if len(table) else None
+
+
+def _features(cv2, frame):
+	height, width = frame.shape[:2]
+	size = (ANALYSIS_WIDTH, max(1, int(round(height * ANALYSIS_WIDTH / width))))
+	gray = cv2.cvtColor(cv2.resize(frame, size, interpolation=cv2.INTER_AREA), cv2.COLOR_BGR2GRAY)
+	hist = cv2.calcHist([gray], [0], None, [HIST_BINS], [0, 256]).ravel()
+	return gray, hist / max(1.0, float(hist.sum()))
+
+
+# Set in each pool worker by _worker_init: the build's cross-process cancel flag
+_cancelled = None
+
+
+def _worker_init(cancelled):
+	global _cancelled
+	import cv2
+
+	# One decoder thread per worker; the pool provides the parallelism
+	cv2.setNumThreads(1)
+	os.nice(10)
+	_cancelled = cancelled
+
+
+def analyze_chunk(path, start, end):
+	"""Rows for frames [start, end) of `path`; frame `start` is compared with `start - 1`.
+
+	Runs in a pool worker. Frames past the end of the file stay zero, and so
+	does the rest of the chunk once the build is cancelled.
+	"""
+	import cv2
+
+	rows = np.zeros((end - start, 2), dtype=np.float32)
+	cap = cv2.VideoCapture(path)
+	if not cap.isOpened():
+		return start, rows.astype(np.float16)
+	frame_no = max(0, start - 1)
+	cap.set(cv2.CAP_PROP_POS_FRAMES, frame_no)
+	previous = None
+	while frame_no < end:
+		if _cancelled is not None and frame_no % CANCEL_CHECK_FRAMES == 0 and _cancelled.is_set():
+			break
+		ok, frame = cap.read()
+		if not ok:
+			break
+		gray, hist = _features(cv2, frame)
+		if previous is not None and frame_no >= start:
+			rows[frame_no - start] = (
+				float(cv2.absdiff(gray, previous[0]).mean()) / 255.0,
+				0.5 * float(np.abs(hist - previous[1]).sum()),
+			)
+		previous = (gray, hist)
+		frame_no += 1
+	cap.release()
+	return start, rows.astype(np.float16)
+
+
+def _frame_count(path):
+	import cv2
+
+	cap = cv2.VideoCapture(path)
+	count = int(cap.get(cv2.CAP_PROP_FRAME_COUNT)) if cap.isOpened() else 0
+	cap.release()
+	return count
+
+
+def build_motion_index(video_path, cancel_event=None, workers=None):
+	"""Analyse `video_path` on a process pool and persist its motion index.
+
+	Returns the index, or None if cancelled or the video could not be read.
+	"""
+	source = find_proxy(video_path) or video_path
+	frame_count = read_metadata(video_path).get("frame_count") or _frame_count(source)
+	if not frame_count:
+		return None
+	table = np.zeros((frame_count, 2), dtype=np.float16)
+	chunks = [(s, min(frame_count, s + CHUNK_FRAMES)) for s in range(0, frame_count, CHUNK_FRAMES)]
+	workers = workers or max(1, min(MAX_WORKERS, (os.cpu_count() or 2) - 1))
+
+	# spawn: forking a process that runs Qt and decoder threads is not safe
+	context = multiprocessing.get_context("spawn")
+	cancelled = context.Event()
+	pool = ProcessPoolExecutor(workers, mp_context=context, initializer=_worker_init, initargs=(cancelled,))
+	try:
+		pending = {pool.submit(analyze_chunk, source, s, e) for s, e in chunks}
+		while pending:
+			# Poll rather than block on a chunk, so a cancel is seen within CANCEL_POLL_S
+			done, pending = wait(pending, timeout=CANCEL_POLL_S, return_when=FIRST_COMPLETED)
+			if cancel_event is not None and cancel_event.is_set():
+				# Running chunks stop at their next check; nothing waits for them
+				cancelled.set()
+				return None
+			for future in done:
+				start, rows = future.result()
+				table[start:start + len(rows)] = rows
+	finally:
+		pool.shutdown(wait=not cancelled.is_set(), cancel_futures=True)
+
+	path = cache_path(video_path, MOTION_INDEX_FILE)
+	tmp_path = path + ".tmp.npy"
+	np.save(tmp_path, table)
+	os.replace(tmp_path, path)
+	return MotionIndex(table, read_metadata(video_path).get("fps"))
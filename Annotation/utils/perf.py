@@ -0,0 +1,181 @@
+import functools
+import json
+import logging
+import logging.handlers
+import math
+import os
+import time
+from bisect import bisect_left
+from contextlib import contextmanager
+
+from utils.video_cache import CACHE_ROOT
+
+# Hot-path latency histograms and counters.
+#
+# Recording costs two perf_counter() calls and one bisect, so instrumentation
+# stays on in normal use; set ANNOTATOR_PERF=0 to turn it off entirely.
+# Summaries are shown in the debug HUD and appended as JSON lines to a
+# rotating log (perf.log in the cache root).
+
+_enabled = os.environ.get("ANNOTATOR_PERF", "1").strip().lower() not in ("0", "false", "no", "off")
+
+# Log-spaced bucket upper bounds: 10 us .. ~30 s, ~12% apart
+_BOUNDS = [1e-5 * (1.12 ** i) for i in range(int(math.log(3e6) / math.log(1.12)) + 1)]
+
+_histograms = {}
+_counters = {}
+_pending = {}
+_logger = None
+
+LOG_PATH = os.path.join(CACHE_ROOT, "perf.log")
+
+
+def enabled():
+	return _enabled
+
+
+class LatencyHistogram:
+	"""Fixed log-bucket histogram; percentiles are accurate to one bucket (~12%)."""
+
+	def __init__(self):
+		self.buckets = [0] * (len(_BOUNDS) + 1)
+		self.count = 0
+		self.total = 0.0
+		self.max = 0.0
+
+	def record(self, seconds):
+		self.buckets[bisect_left(_BOUNDS, seconds)] += 1
+		self.count += 1
+		self.total += seconds
+		if seconds > self.max:
+			self.max = seconds
+
+	def percentile(self, p):
+		if not self.count:
+			return 0.0
+		rank = p / 100.0 * self.count
+		seen = 0
+		for i, n in enumerate(self.buckets):
+			seen += n
+			if seen >= rank:
+				return min(_BOUNDS[i] if i < len(_BOUNDS) else self.max, self.max)
+		return self.max
+
+	def summary(self):
+		"""Milliseconds: count, mean, p50, p95, p99, max."""
+		ms = 1000.0
+		return {
+			"count": self.count,
+			"mean": round(self.total / self.count * ms, 3) if self.count else 0.0,
+			"p50": round(self.percentile(50) * ms, 3),
+			"p95": round(self.percentile(95) * ms, 3),
+			"p99": round(self.percentile(99) * ms, 3),
+			"max": round(self.max * ms, 3),
+		}
+
+
+def record(name, seconds):
+	if not _enabled:
+		return
+	hist = _histograms.get(name)
+	if hist is None:
+		hist = _histograms[name] = LatencyHistogram()
+	hist.record(seconds)
+
+
+def count(name, n=1):
+	if _enabled:
+		_counters[name] = _counters.get(name, 0) + n
+
+
+@contextmanager
+def measure(name):
+	if not _enabled:
+		yield
+		return
+	start = time.perf_counter()
+	try:
+		yield
+	finally:
+		record(name, time.perf_counter() - start)
+
+
+def timed(name):
+	"""Decorator recording each call's duration under `name`."""
+	def decorator(fn):
+		@functools.wraps(fn)
+		def wrapper(*args, **kwargs):
+			if not _enabled:
+				return fn(*args, **kwargs)
+			start = time.perf_counter()
+			try:
+				return fn(*args, **kwargs)
+			finally:
+				record(name, time.perf_counter() - start)
+		return wrapper
+	return decorator
+
+
+def begin(name):
+	"""Start (or restart) a latency that ends in a different callback (e.g. key press -> repaint)."""
+	if _enabled:
+		_pending[name] = time.perf_counter()
+
+
+def finish(name, max_seconds=None):
+	start = _pending.pop(name, None)
+	if start is None:
+		return
+	elapsed = time.perf_counter() - start
+	if max_seconds is None or elapsed <= max_seconds:
+		record(name, elapsed)
+
+
+def pending(name):
+	return name in _pending
+
+
+def snapshot():
+	return {
+		"histograms": {name: hist.summary() for name, hist in sorted(_histograms.items())},
+		"counters": dict(sorted(_counters.items())),
+	}
+
+
+def reset():
+	_histograms.clear()
+	_counters.clear()
+	_pending.clear()
+
+
+def format_table(snap=None):
+	snap = snap or snapshot()
+	lines = [f"{'path':<24}{'n':>7}{'p50':>8}{'p95':>8}{'p99':>8}{'max':>8}  ms"]
+	for name, s in snap["histograms"].items():
+		lines.append(f"{name:<24}{s['count']:>7}{s['p50']:>8.2f}{s['p95']:>8.2f}{s['p99']:>8.2f}{s['max']:>8.2f}")
+	for name, n in snap["counters"].items():
+		lines.append(f"{name:<24}{n:>7}")
+	return "\n".join(lines)
+
+
+def _get_logger():
+	global _logger
+	if _logger is None:
+		os.makedirs(CACHE_ROOT, exist_ok=True)
+		_logger = logging.getLogger("annotator.perf")
+		_logger.propagate = False
+		handler = logging.handlers.RotatingFileHandler(LOG_PATH, maxBytes=1024 * 1024, backupCount=3)
+		handler.setFormatter(logging.Formatter("%(asctime)s %(message)s"))
+		_logger.addHandler(handler)
+		_logger.setLevel(logging.INFO)
+	return _logger
+
+
+def dump_to_log():
+	"""Append the current summary to the rotating perf log (no-op when nothing was recorded)."""
+	if not _enabled or not (_histograms or _counters):
+		return
+	try:
+		_get_logger().info(json.dumps(snapshot(), sort_keys=True))
+	except OSError:
+		pass
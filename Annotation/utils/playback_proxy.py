@@ -0,0 +1,85 @@
+import os
+import shutil
+import subprocess
+
+from utils.video_cache import cache_path
+
+# Low-resolution playback proxy, cached per game next to the other derived data:
+# 540p H.264 with a short GOP (cheap seeks and steps) and the original
+# timestamps passed through, so ms positions and frame numbers are the same as
+# in the source. Needs ffmpeg; without it the original is played. Export,
+# indexes and annotations always use the original file.
+
+PROXY_HEIGHT = 540
+PROXY_GOP = 12
+PROXY_NAME = "proxy_540p.mp4"
+
+
+def proxy_enabled_by_default():
+	return os.environ.get("ANNOTATOR_PROXY", "").strip().lower() in ("1", "true", "yes", "on")
+
+
+def find_proxy(video_path):
+	"""Return the finished proxy for `video_path`, or None."""
+	path = cache_path(video_path, PROXY_NAME, create=False)
+	return path if os.path.isfile(path) else None
+
+
+def _source_height(video_path):
+	import cv2
+	cap = cv2.VideoCapture(video_path)
+	height = int(cap.get(cv2.CAP_PROP_FRAME_HEIGHT)) if cap.isOpened() else 0
+	cap.release()
+	return height
+
+
+def _build_with_ffmpeg(video_path, out_path, cancel_event):
+	tmp_path = out_path + ".partial.mp4"
+	# Below the player and the UI; `nice` rather than a preexec_fn, which is unsafe in a threaded process
+	nice = ["nice", "-n", "10"] if shutil.which("nice") else []
+	proc = subprocess.Popen(
+		nice + [
+			"ffmpeg", "-v", "error", "-y", "-i", video_path,
+			"-map", "0:v:0", "-map", "0:a:0?",
+			"-vf", f"scale=-2:{PROXY_HEIGHT}",
+			"-c:v", "libx264", "-preset", "veryfast", "-tune", "fastdecode", "-crf", "26",
+			"-g", str(PROXY_GOP), "-keyint_min", str(PROXY_GOP), "-sc_threshold", "0",
+			"-fps_mode", "passthrough",
+			"-c:a", "aac", "-b:a", "96k",
+			"-movflags", "+faststart",
+			tmp_path,
+		],
+		stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL,
+	)
+	while True:
+		try:
+			proc.wait(timeout=0.5)
+			break
+		except subprocess.TimeoutExpired:
+			if cancel_event is not None and cancel_event.is_set():
+				proc.terminate()
+				proc.wait()
+				break
+	if proc.returncode != 0:
+		if os.path.exists(tmp_path):
+			os.remove(tmp_path)
+		return None
+	os.replace(tmp_path, out_path)
+	return out_path
+
+
+def build_proxy(video_path, cancel_event=None):
+	"""Transcode the playback proxy for `video_path` unless it exists or is not needed.
+
+	Returns the proxy path, or None when ffmpeg is missing, the source is
+	already small enough, the build failed, or `cancel_event` was set.
+	"""
+	existing = find_proxy(video_path)
+	if existing:
+		return existing
+	if not shutil.which("ffmpeg"):
+		print("ffmpeg not found; playing the original video without a proxy")
+		return None
+	if _source_height(video_path) <= PROXY_HEIGHT:
+		return None
+	return _build_with_ffmpeg(video_path, cache_path(video_path, PROXY_NAME), cancel_event)
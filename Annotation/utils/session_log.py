@@ -0,0 +1,72 @@
+import gzip
+import json
+import os
+import shutil
+from datetime import datetime, timezone
+
+# Recorded tagging sessions (main.py --record-session PATH), replayed by
+# benchmarks/replay_session.py to reproduce latency complaints on new builds.
+#
+# Gzipped JSON lines: a header dict, then one compact list per input:
+#   [t_ms, "kp"|"kr", key, modifiers, auto_repeat, text]          key press / release
+#   [t_ms, "mp"|"mr"|"md", widget, x, y, button, buttons, modifiers]  mouse press / release / double click
+#   [t_ms, "pos", position_ms, player_state]                       player position (throttled)
+#   [t_ms, "open", video_path, labels_snapshot]                    a video was opened
+# t_ms counts from the start of the recording; `widget` is a path such as
+# "MainWindow/0/3/1" (child-widget indices below a top-level window class).
+
+FORMAT = "annotator-session"
+VERSION = 1
+
+KEY_PRESS = "kp"
+KEY_RELEASE = "kr"
+MOUSE_PRESS = "mp"
+MOUSE_RELEASE = "mr"
+MOUSE_DOUBLE_CLICK = "md"
+POSITION = "pos"
+OPEN = "open"
+
+
+class SessionWriter:
+	"""Appends session records; labels snapshots go next to the log as <name>.labels-N.json."""
+
+	def __init__(self, path):
+		self.path = path
+		self._file = gzip.open(path, "wt", encoding="utf-8")
+		self._snapshots = 0
+		self._write({
+			"format": FORMAT,
+			"version": VERSION,
+			"created": datetime.now(timezone.utc).isoformat(timespec="seconds"),
+		})
+
+	def _write(self, record):
+		self._file.write(json.dumps(record, separators=(",", ":")) + "\n")
+
+	def record(self, t_ms, kind, *values):
+		if self._file is not None:
+			self._write([int(t_ms), kind, *values])
+
+	def snapshot_labels(self, labels_path):
+		"""Copy the annotation file as loaded; returns the snapshot's file name (or None)."""
+		if not labels_path or not os.path.isfile(labels_path):
+			return None
+		self._snapshots += 1
+		name = f"{os.path.basename(self.path)}.labels-{self._snapshots}.json"
+		shutil.copy2(labels_path, os.path.join(os.path.dirname(os.path.abspath(self.path)), name))
+		return name
+
+	def close(self):
+		if self._file is not None:
+			self._file.close()
+			self._file = None
+
+
+def read_session(path):
+	"""Return (header, records) from a recorded session."""
+	with gzip.open(path, "rt", encoding="utf-8") as f:
+		header = json.loads(f.readline())
+		if header.get("format") != FORMAT:
+			raise ValueError(f"{path} is not a recorded annotator session")
+		records = [json.loads(line) for line in f if line.strip()]
+	return header, records
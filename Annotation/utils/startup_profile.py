@@ -0,0 +1,80 @@
+import builtins
+import sys
+import time
+from contextlib import contextmanager
+
+# Startup timing for `main.py --profile-startup`. Everything here is a no-op
+# until enable() is called, so the spans left in the startup path cost nothing.
+
+_enabled = False
+_t0 = time.perf_counter()
+_spans = []    # (start_offset_s, duration_s, depth, label)
+_depth = 0
+_original_import = None
+
+
+def enabled():
+	return _enabled
+
+
+def enable():
+	"""Start recording spans and first-time top-level imports."""
+	global _enabled, _original_import
+	if _enabled:
+		return
+	_enabled = True
+	_original_import = builtins.__import__
+	builtins.__import__ = _timed_import
+
+
+def _record(start, label):
+	_spans.append((start - _t0, time.perf_counter() - start, _depth, label))
+
+
+@contextmanager
+def span(label):
+	global _depth
+	if not _enabled:
+		yield
+		return
+	start = time.perf_counter()
+	_depth += 1
+	try:
+		yield
+	finally:
+		_depth -= 1
+		_record(start, label)
+
+
+def _timed_import(name, globals=None, locals=None, fromlist=(), level=0):
+	global _depth
+	top = name.partition(".")[0]
+	if level or not top or top in sys.modules:
+		return _original_import(name, globals, locals, fromlist, level)
+
+	start = time.perf_counter()
+	_depth += 1
+	try:
+		return _original_import(name, globals, locals, fromlist, level)
+	finally:
+		_depth -= 1
+		_record(start, f"import {top}")
+
+
+def report(stream=None, min_ms=1.0):
+	"""Print the recorded timeline; spans under `min_ms` are folded into a count."""
+	stream = stream or sys.stderr
+	builtins.__import__ = _original_import or builtins.__import__
+
+	print("\nStartup profile (ms; nested rows are included in their parent)", file=stream)
+	print(f"  {'start':>8}  {'took':>8}  step", file=stream)
+	hidden = 0
+	for start, duration, depth, label in sorted(_spans, key=lambda s: (s[0], -s[1])):
+		duration_ms = duration * 1000.0
+		if duration_ms < min_ms:
+			hidden += 1
+			continue
+		print(f"  {start * 1000.0:8.1f}  {duration_ms:8.1f}  {'  ' * depth}{label}", file=stream)
+	if hidden:
+		print(f"  ({hidden} steps under {min_ms:g} ms not shown)", file=stream)
+	print(f"  total to first event loop tick: {(time.perf_counter() - _t0) * 1000.0:.1f} ms", file=stream)
@@ -0,0 +1,127 @@
+import json
+import os
+
+from utils.video_cache import cache_path
+
+# Thumbnail filmstrip for seek-bar previews: one thumbnail every THUMB_INTERVAL_S
+# seconds, packed row-major into JPEG sprite sheets of SHEET_COLS x SHEET_ROWS
+# tiles, with an index.json describing the layout and how many tiles exist.
+# The index is rewritten after every flush, so a half-built atlas is usable and
+# an interrupted run resumes where it stopped.
+
+THUMB_INTERVAL_S = 5
+THUMB_WIDTH = 160
+THUMB_HEIGHT = 90
+SHEET_COLS = 10
+SHEET_ROWS = 10
+FLUSH_EVERY = 10    # tiles between sheet/index writes
+JPEG_QUALITY = 70
+
+ATLAS_DIR = "thumbnails"
+
+
+def atlas_dir_for(video_path, create=True):
+	path = cache_path(video_path, ATLAS_DIR, create=create)
+	if create:
+		os.makedirs(path, exist_ok=True)
+	return path
+
+
+def sheet_name(sheet):
+	return f"sheet_{sheet:04d}.jpg"
+
+
+def read_atlas_index(atlas_dir):
+	try:
+		with open(os.path.join(atlas_dir, "index.json")) as f:
+			return json.load(f)
+	except (OSError, ValueError):
+		return None
+
+
+def _write_atomic(path, data, mode="wb"):
+	tmp_path = path + ".tmp"
+	with open(tmp_path, mode) as f:
+		f.write(data)
+	os.replace(tmp_path, path)
+
+
+def tile_for_position(index, position_ms):
+	"""Return (sheet, x, y) of the thumbnail covering `position_ms`, or None if not generated yet."""
+	if not index:
+		return None
+	tile = int(position_ms // (index["interval_s"] * 1000))
+	if tile < 0 or tile >= index["count"]:
+		return None
+	per_sheet = index["cols"] * index["rows"]
+	sheet, slot = divmod(tile, per_sheet)
+	row, col = divmod(slot, index["cols"])
+	return sheet, col * index["width"], row * index["height"]
+
+
+def generate_thumbnails(video_path, atlas_dir, interval_s=THUMB_INTERVAL_S):
+	"""Fill (or resume) the thumbnail atlas for `video_path`. Meant to run in a worker process."""
+	import cv2
+	import numpy as np
+
+	cap = cv2.VideoCapture(video_path)
+	if not cap.isOpened():
+		return
+	fps = cap.get(cv2.CAP_PROP_FPS) or 25.0
+	frame_count = int(cap.get(cv2.CAP_PROP_FRAME_COUNT))
+	total = max(1, int((frame_count / fps) // interval_s) + 1) if frame_count > 0 else 0
+
+	index = read_atlas_index(atlas_dir)
+	layout = {
+		"interval_s": interval_s, "width": THUMB_WIDTH, "height": THUMB_HEIGHT,
+		"cols": SHEET_COLS, "rows": SHEET_ROWS,
+	}
+	if not index or any(index.get(k) != v for k, v in layout.items()):
+		index = dict(layout, count=0, total=total, complete=False)
+	if index.get("complete"):
+		cap.release()
+		return
+
+	per_sheet = SHEET_COLS * SHEET_ROWS
+	sheet_shape = (SHEET_ROWS * THUMB_HEIGHT, SHEET_COLS * THUMB_WIDTH, 3)
+	sheet_no = index["count"] // per_sheet
+	sheet = np.zeros(sheet_shape, dtype=np.uint8)
+	if index["count"] % per_sheet:
+		# Resume a partly filled sheet
+		existing = cv2.imread(os.path.join(atlas_dir, sheet_name(sheet_no)))
+		if existing is not None and existing.shape == sheet_shape:
+			sheet = existing
+		else:
+			index["count"] = sheet_no * per_sheet
+
+	def flush(write_sheet=True):
+		if write_sheet:
+			ok, data = cv2.imencode(".jpg", sheet, [cv2.IMWRITE_JPEG_QUALITY, JPEG_QUALITY])
+			if ok:
+				_write_atomic(os.path.join(atlas_dir, sheet_name(sheet_no)), data.tobytes())
+		_write_atomic(os.path.join(atlas_dir, "index.json"), json.dumps(index), mode="w")
+
+	tile = index["count"]
+	while True:
+		cap.set(cv2.CAP_PROP_POS_MSEC, tile * interval_s * 1000.0)
+		ok, frame = cap.read()
+		if not ok:
+			break
+		row, col = divmod(tile % per_sheet, SHEET_COLS)
+		y, x = row * THUMB_HEIGHT, col * THUMB_WIDTH
+		sheet[y:y + THUMB_HEIGHT, x:x + THUMB_WIDTH] = cv2.resize(
+			frame, (THUMB_WIDTH, THUMB_HEIGHT), interpolation=cv2.INTER_AREA
+		)
+		tile += 1
+		index["count"] = tile
+
+		if tile % per_sheet == 0:
+			flush()
+			sheet_no += 1
+			sheet = np.zeros(sheet_shape, dtype=np.uint8)
+		elif tile % FLUSH_EVERY == 0:
+			flush()
+
+	index["complete"] = True
+	flush(write_sheet=tile % per_sheet != 0)
+	cap.release()
@@ -0,0 +1,51 @@
+import hashlib
+import json
+import os
+
+# Per-video metadata cache on local disk. Videos usually live on a gcsfuse
+# mount, so anything derived from them (frame rate, seek indexes, ...) is
+# computed once and kept here, keyed by path, size and modification time.
+
+CACHE_ROOT = os.environ.get(
+	"ANNOTATOR_CACHE_DIR",
+	os.path.join(os.path.expanduser("~"), ".cache", "cbb-video-annotator"),
+)
+
+
+def cache_dir_for(video_path, create=True):
+	"""Return the cache directory for `video_path` (a new one if the file changed)."""
+	try:
+		stat = os.stat(video_path)
+		fingerprint = f"{os.path.abspath(video_path)}|{stat.st_size}|{int(stat.st_mtime)}"
+	except OSError:
+		fingerprint = os.path.abspath(video_path)
+	key = hashlib.sha1(fingerprint.encode("utf-8")).hexdigest()[:16]
+	stem = os.path.splitext(os.path.basename(video_path))[0]
+	path = os.path.join(CACHE_ROOT, f"{stem}-{key}")
+	if create:
+		os.makedirs(path, exist_ok=True)
+	return path
+
+
+def cache_path(video_path, name, create=True):
+	return os.path.join(cache_dir_for(video_path, create=create), name)
+
+
+def read_metadata(video_path):
+	try:
+		with open(cache_path(video_path, "metadata.json", create=False)) as f:
+			return json.load(f)
+	except (OSError, ValueError):
+		return {}
+
+
+def write_metadata(video_path, **values):
+	"""Merge `values` into the video's metadata.json."""
+	metadata = read_metadata(video_path)
+	metadata.update(values)
+	path = cache_path(video_path, "metadata.json")
+	tmp_path = path + ".tmp"
+	with open(tmp_path, "w") as f:
+		json.dump(metadata, f, indent=4, sort_keys=True)
+	os.replace(tmp_path, path)
+	return metadata
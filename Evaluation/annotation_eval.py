@@ -7,12 +7,34 @@ overall and per class at multiple frame-tolerance thresholds (label-only matchin
 For true positive pairs, subtype confusion matrices are reported per event label,
 showing how accurately the company predicted the subtype given a correct label match.
 
+Batch mode walks a directory tree for the ``annotations/`` folders written by the
+annotator (``{video_stem}_{tagger}.json`` next to a ``{video_stem}_gt.json``),
+evaluates every game/tagger pair in a process pool, and reports micro- and
+macro-averaged metrics plus summed subtype confusion matrices per tagger.
+
+Results can also be written as JSON, CSV or Parquet (``--output``), and batch
+runs can keep a content-hash cache (``--cache``) so only games whose annotation
+files changed are re-evaluated.
+
+Agreement mode (``--agreement``) compares every pair of taggers that annotated
+the same game: pairwise F1 (label matching) and a Cohen's-kappa-style score over
+label-agnostic matches, where an event seen by only one tagger counts as a
+disagreement against "no event".
+
 Usage (from the evaluation/ directory):
     python annotation/annotation_eval.py
+    python annotation/annotation_eval.py --batch /videos --tagger company1 --workers 8
+    python annotation/annotation_eval.py --batch /videos --cache eval_cache.json --output season.csv
+    python annotation/annotation_eval.py --agreement /videos --output agreement.csv
 """
 
+import csv
+import hashlib
 import json
+import os
+from bisect import bisect_left, bisect_right
 from collections import defaultdict
+from concurrent.futures import ProcessPoolExecutor
 from pathlib import Path
 
 # ---------------------------------------------------------------------------
@@ -27,24 +49,37 @@ THRESHOLDS = [10, 20, 30]  # frame-tolerance thresholds to evaluate
 # Max FN/FP entries to print per section (None = print all)
 MAX_DETAIL_ROWS = None
 
+# Batch mode: suffix identifying the ground-truth file of each game
+GT_SUFFIX = "_gt.json"
+
+# Bump when the per-game result layout changes so stale cache entries are ignored
+CACHE_VERSION = 1
+
+# Agreement mode: category standing for "this tagger has no matching event"
+NO_EVENT = "<none>"
+
 # ---------------------------------------------------------------------------
 # Data loading
 # ---------------------------------------------------------------------------
 
+def read_annotations(path):
+    with open(path) as f:
+        data = json.load(f)
+    annotations = data["annotations"]
+    for ann in annotations:
+        ann["frame"] = int(ann["frame"])
+    return annotations
+
+
 def load_annotations(path):
     try:
-        with open(path) as f:
-            data = json.load(f)
+        return read_annotations(path)
     except FileNotFoundError:
         print(
             f"Error: file not found: {path}\n"
             "Set GT_PATH and COMPANY_PATH at the top of the script to the correct paths."
         )
         raise SystemExit(1)
-    annotations = data["annotations"]
-    for ann in annotations:
-        ann["frame"] = int(ann["frame"])
-    return annotations
 
 
 # ---------------------------------------------------------------------------
@@ -54,54 +89,69 @@ def load_annotations(path):
 def _match_key(ann, mode):
     if mode == "label+subType":
         return f"{ann['label']}|{ann['subType']}"
+    if mode == "any":
+        return ""
     return ann["label"]
 
 
-def match_annotations(gt, pred, threshold, mode):
+class FrameIndex:
     """
-    Greedily match GT annotations to predicted annotations within `threshold` frames.
+    Annotations of one file grouped by match key, each group with a frame-sorted
+    view so candidates within a threshold are found by bisection.
 
-    Returns
-    -------
-    tp_pairs : list of (gt_ann, pred_ann) matched pairs
-    fn_list  : unmatched GT annotations (missed by company)
-    fp_list  : unmatched pred annotations (added by company, not in GT)
+    Build once per file and reuse it for every comparison and threshold; the
+    per-mode grouping is computed on first use.
     """
-    gt_by_key = defaultdict(list)
-    pred_by_key = defaultdict(list)
 
-    for ann in gt:
-        gt_by_key[_match_key(ann, mode)].append(ann)
-    for ann in pred:
-        pred_by_key[_match_key(ann, mode)].append(ann)
+    def __init__(self, annotations):
+        self.annotations = annotations
+        self._groups = {}
+
+    def groups(self, mode):
+        """Return ``{key: (anns, sorted_frames, order)}``; ``order[j]`` indexes `anns`."""
+        groups = self._groups.get(mode)
+        if groups is None:
+            by_key = defaultdict(list)
+            for ann in self.annotations:
+                by_key[_match_key(ann, mode)].append(ann)
+            groups = {}
+            for key, anns in by_key.items():
+                order = sorted(range(len(anns)), key=lambda i: anns[i]["frame"])
+                groups[key] = (anns, [anns[i]["frame"] for i in order], order)
+            self._groups[mode] = groups
+        return groups
+
+
+def match_indexed(gt_index, pred_index, threshold, mode):
+    """`match_annotations` over prebuilt `FrameIndex` objects."""
+    gt_groups = gt_index.groups(mode)
+    pred_groups = pred_index.groups(mode)
 
     tp_pairs = []
     fn_list = []
     fp_list = []
 
-    all_keys = set(gt_by_key) | set(pred_by_key)
-
-    for key in all_keys:
-        gt_anns = gt_by_key.get(key, [])
-        pred_anns = pred_by_key.get(key, [])
-
+    for key in sorted(set(gt_groups) | set(pred_groups)):
+        gt_anns = gt_groups[key][0] if key in gt_groups else []
+        if key not in pred_groups:
+            fn_list.extend(gt_anns)
+            continue
+        pred_anns, pred_frames, pred_order = pred_groups[key]
         if not gt_anns:
             fp_list.extend(pred_anns)
             continue
 
-        if not pred_anns:
-            fn_list.extend(gt_anns)
-            continue
-
-        # Build all candidate pairs within threshold, sorted by frame distance
+        # Candidate pairs within threshold, found by bisecting the sorted pred frames.
+        # Sorting on (distance, gt_idx, pred_idx) reproduces the exhaustive scan's order.
         candidates = []  # (distance, gt_idx, pred_idx)
         for gi, g in enumerate(gt_anns):
-            for pi, p in enumerate(pred_anns):
-                dist = abs(g["frame"] - p["frame"])
-                if dist <= threshold:
-                    candidates.append((dist, gi, pi))
+            frame = g["frame"]
+            lo = bisect_left(pred_frames, frame - threshold)
+            hi = bisect_right(pred_frames, frame + threshold)
+            for j in range(lo, hi):
+                candidates.append((abs(frame - pred_frames[j]), gi, pred_order[j]))
 
-        candidates.sort(key=lambda x: x[0])
+        candidates.sort()
 
         matched_gt = set()
         matched_pred = set()
@@ -123,6 +173,19 @@ def match_annotations(gt, pred, threshold, mode):
     return tp_pairs, fn_list, fp_list
 
 
+def match_annotations(gt, pred, threshold, mode):
+    """
+    Greedily match GT annotations to predicted annotations within `threshold` frames.
+
+    Returns
+    -------
+    tp_pairs : list of (gt_ann, pred_ann) matched pairs
+    fn_list  : unmatched GT annotations (missed by company)
+    fp_list  : unmatched pred annotations (added by company, not in GT)
+    """
+    return match_indexed(FrameIndex(gt), FrameIndex(pred), threshold, mode)
+
+
 # ---------------------------------------------------------------------------
 # Metrics
 # ---------------------------------------------------------------------------
@@ -178,6 +241,431 @@ def compute_per_class_metrics(tp_pairs, fn_list, fp_list):
     }
 
 
+def evaluate_pair(gt, pred, thresholds, mode="label"):
+    """
+    Evaluate one GT/prediction pair at every threshold.
+
+    Returns a list with one plain-dict entry per threshold (picklable and
+    JSON-serialisable, so it can cross process boundaries):
+    ``{"threshold", "overall", "per_class", "confusion", "fn", "fp"}``.
+    """
+    results = []
+    for threshold in thresholds:
+        tp_pairs, fn_list, fp_list = match_annotations(gt, pred, threshold, mode)
+        confusion = compute_subtype_confusion(tp_pairs)
+        results.append({
+            "threshold": threshold,
+            "overall": compute_metrics(len(tp_pairs), len(fp_list), len(fn_list)),
+            "per_class": compute_per_class_metrics(tp_pairs, fn_list, fp_list),
+            "confusion": {
+                label: {gt_sub: dict(row) for gt_sub, row in matrix.items()}
+                for label, matrix in confusion.items()
+            },
+            "fn": fn_list,
+            "fp": fp_list,
+        })
+    return results
+
+
+# ---------------------------------------------------------------------------
+# Batch evaluation
+# ---------------------------------------------------------------------------
+
+def discover_games(root):
+    """
+    Find every ``{stem}_gt.json`` under `root` with the tagger files
+    ``{stem}_{tagger}.json`` sitting in the same directory.
+
+    The video stem may itself contain underscores, so taggers are identified by
+    stripping the known ``{stem}_`` prefix rather than splitting on ``_``. A file
+    that also starts with a longer game stem of the same directory belongs to
+    that game (``game_2_nick.json`` is game_2's, not tagger "2_nick" of game).
+
+    Returns ``[(game, gt_path, [(tagger, pred_path), ...]), ...]`` sorted by game.
+    """
+    root = Path(root)
+    stems_by_dir = defaultdict(set)
+    gt_paths = sorted(root.rglob(f"*{GT_SUFFIX}"))
+    for gt_path in gt_paths:
+        stems_by_dir[gt_path.parent].add(gt_path.name[: -len(GT_SUFFIX)])
+
+    games = []
+    for gt_path in gt_paths:
+        stem = gt_path.name[: -len(GT_SUFFIX)]
+        longer = [other for other in stems_by_dir[gt_path.parent] if len(other) > len(stem)]
+        taggers = []
+        for pred_path in sorted(gt_path.parent.glob(f"{stem}_*.json")):
+            if pred_path.name.endswith(GT_SUFFIX):
+                continue
+            if any(pred_path.name.startswith(other + "_") for other in longer):
+                continue
+            name = pred_path.name[len(stem) + 1 : -len(".json")]
+            if name:
+                taggers.append((name, pred_path))
+        games.append((str(gt_path.parent.relative_to(root) / stem), gt_path, taggers))
+    return sorted(games, key=lambda g: g[0])
+
+
+def discover_game_pairs(root, tagger=None):
+    """
+    Pair every ground-truth file under `root` with its tagger files (see `discover_games`).
+
+    Returns a list of job dicts: ``{"game", "tagger", "gt_path", "pred_path"}``.
+    """
+    jobs = []
+    for game, gt_path, taggers in discover_games(root):
+        for name, pred_path in taggers:
+            if tagger is not None and name != tagger:
+                continue
+            jobs.append({
+                "game": game,
+                "tagger": name,
+                "gt_path": str(gt_path),
+                "pred_path": str(pred_path),
+            })
+    return jobs
+
+
+def evaluate_game(job, thresholds=THRESHOLDS):
+    """Evaluate one discovered job. Runs inside pool workers, so errors are returned, not raised."""
+    result = {"game": job["game"], "tagger": job["tagger"]}
+    try:
+        gt = read_annotations(job["gt_path"])
+        pred = read_annotations(job["pred_path"])
+    except (OSError, ValueError, KeyError, TypeError) as e:
+        result["error"] = f"{type(e).__name__}: {e}"
+        return result
+    result["n_gt"] = len(gt)
+    result["n_pred"] = len(pred)
+    result["thresholds"] = evaluate_pair(gt, pred, thresholds)
+    return result
+
+
+def run_batch(jobs, thresholds=THRESHOLDS, workers=None, cache=None):
+    """
+    Evaluate `jobs` in a process pool (``workers=1`` evaluates in-process).
+
+    If a `ResultCache` is given, jobs whose GT/prediction contents and thresholds
+    are unchanged since the last run are served from it and only the rest are
+    sent to the pool. Results keep the order of `jobs`.
+    """
+    if not jobs:
+        return []
+
+    results = [None] * len(jobs)
+    pending = []
+    for i, job in enumerate(jobs):
+        cached = cache.get(job, thresholds) if cache is not None else None
+        if cached is not None:
+            results[i] = cached
+        else:
+            pending.append(i)
+
+    if pending:
+        todo = [jobs[i] for i in pending]
+        workers = workers or min(len(todo), os.cpu_count() or 1)
+        if workers <= 1:
+            fresh = [evaluate_game(job, thresholds) for job in todo]
+        else:
+            with ProcessPoolExecutor(max_workers=workers) as pool:
+                fresh = list(pool.map(evaluate_game, todo, [thresholds] * len(todo), chunksize=1))
+        for i, result in zip(pending, fresh):
+            results[i] = result
+            if cache is not None and "error" not in result:
+                cache.put(jobs[i], thresholds, result)
+
+    return results
+
+
+# ---------------------------------------------------------------------------
+# Result cache
+# ---------------------------------------------------------------------------
+
+def _file_digest(path):
+    digest = hashlib.sha256()
+    with open(path, "rb") as f:
+        for chunk in iter(lambda: f.read(1 << 20), b""):
+            digest.update(chunk)
+    return digest.hexdigest()
+
+
+class ResultCache:
+    """
+    JSON file mapping ``game|tagger`` to the last per-game result, keyed by a
+    SHA-256 over both annotation files and the thresholds evaluated.
+    """
+
+    def __init__(self, path):
+        self.path = Path(path)
+        self.hits = 0
+        self.misses = 0
+        self._entries = {}
+        try:
+            with open(self.path) as f:
+                data = json.load(f)
+            if data.get("version") == CACHE_VERSION:
+                self._entries = data.get("entries", {})
+        except (OSError, ValueError):
+            pass
+
+    @staticmethod
+    def _slot(job):
+        return f"{job['game']}|{job['tagger']}"
+
+    @staticmethod
+    def _key(job, thresholds):
+        try:
+            gt_digest = _file_digest(job["gt_path"])
+            pred_digest = _file_digest(job["pred_path"])
+        except OSError:
+            return None
+        return f"{gt_digest}:{pred_digest}:{','.join(str(t) for t in thresholds)}"
+
+    def get(self, job, thresholds):
+        key = self._key(job, thresholds)
+        job["cache_key"] = key
+        entry = self._entries.get(self._slot(job))
+        if key is not None and entry and entry.get("key") == key:
+            self.hits += 1
+            return entry["result"]
+        self.misses += 1
+        return None
+
+    def put(self, job, thresholds, result):
+        key = job.get("cache_key") or self._key(job, thresholds)
+        if key is not None:
+            self._entries[self._slot(job)] = {"key": key, "result": result}
+
+    def save(self):
+        tmp_path = self.path.with_name(self.path.name + ".tmp")
+        with open(tmp_path, "w") as f:
+            json.dump({"version": CACHE_VERSION, "entries": self._entries}, f)
+        os.replace(tmp_path, self.path)
+
+
+# ---------------------------------------------------------------------------
+# Inter-annotator agreement
+# ---------------------------------------------------------------------------
+
+def discover_tagger_files(root):
+    """
+    Group the annotation files under `root` by game.
+
+    Games are the ``{stem}_gt.json`` files, as in `discover_games`; the ground
+    truth is included as tagger "gt".
+
+    Returns ``{game: {tagger: path}}`` for games with at least two taggers.
+    """
+    games = {}
+    for game, gt_path, taggers in discover_games(root):
+        files = {"gt": str(gt_path)}
+        files.update((name, str(path)) for name, path in taggers)
+        if len(files) >= 2:
+            games[game] = files
+    return games
+
+
+def cohen_kappa(confusion):
+    """Cohen's kappa from ``{category_a: {category_b: count}}``."""
+    total = sum(count for row in confusion.values() for count in row.values())
+    if not total:
+        return 0.0
+    row_totals = defaultdict(int)
+    col_totals = defaultdict(int)
+    observed = 0
+    for a, row in confusion.items():
+        for b, count in row.items():
+            row_totals[a] += count
+            col_totals[b] += count
+            if a == b:
+                observed += count
+    p_observed = observed / total
+    p_expected = sum(row_totals[k] * col_totals.get(k, 0) for k in row_totals) / (total * total)
+    if p_expected >= 1.0:
+        return 1.0
+    return (p_observed - p_expected) / (1.0 - p_expected)
+
+
+def label_agreement_confusion(index_a, index_b, threshold):
+    """
+    Match events regardless of label, then tabulate label pairs. Unmatched events
+    are paired with `NO_EVENT`, so extra or missing events lower agreement.
+    """
+    matched, only_a, only_b = match_indexed(index_a, index_b, threshold, "any")
+    confusion = defaultdict(lambda: defaultdict(int))
+    for ann_a, ann_b in matched:
+        confusion[ann_a["label"]][ann_b["label"]] += 1
+    for ann in only_a:
+        confusion[ann["label"]][NO_EVENT] += 1
+    for ann in only_b:
+        confusion[NO_EVENT][ann["label"]] += 1
+    return confusion
+
+
+# Per-worker FrameIndex table, set once by the pool initializer. Each file is
+# parsed and its "label" and "any" groups built once in the parent (see
+# run_agreement), then shipped once per worker with the groups included.
+_AGREEMENT_INDEXES = {}
+
+
+def _init_agreement_worker(indexes):
+    global _AGREEMENT_INDEXES
+    _AGREEMENT_INDEXES = indexes
+
+
+def compare_taggers(task):
+    """Pairwise agreement for one ``(game, tagger_a, tagger_b, thresholds)`` task."""
+    game, tagger_a, tagger_b, thresholds = task
+    index_a = _AGREEMENT_INDEXES[(game, tagger_a)]
+    index_b = _AGREEMENT_INDEXES[(game, tagger_b)]
+    rows = []
+    for threshold in thresholds:
+        tp_pairs, only_a, only_b = match_indexed(index_a, index_b, threshold, "label")
+        confusion = label_agreement_confusion(index_a, index_b, threshold)
+        rows.append({
+            "game": game,
+            "tagger_a": tagger_a,
+            "tagger_b": tagger_b,
+            "threshold": threshold,
+            # F1 is symmetric in which tagger is treated as reference
+            "metrics": compute_metrics(len(tp_pairs), len(only_b), len(only_a)),
+            "kappa": cohen_kappa(confusion),
+            "confusion": {a: dict(row) for a, row in confusion.items()},
+        })
+    return rows
+
+
+def run_agreement(games, thresholds=THRESHOLDS, workers=None):
+    """
+    Compute agreement for every tagger pair of every game in `games`
+    (``{game: {tagger: path}}``). Unreadable files are reported and skipped.
+    """
+    indexes = {}
+    errors = []
+    for game, taggers in games.items():
+        for tagger, path in taggers.items():
+            try:
+                index = FrameIndex(read_annotations(path))
+            except (OSError, ValueError, KeyError, TypeError) as e:
+                errors.append({"game": game, "tagger": tagger, "error": f"{type(e).__name__}: {e}"})
+                continue
+            # Built here rather than lazily in every worker
+            index.groups("label")
+            index.groups("any")
+            indexes[(game, tagger)] = index
+
+    tasks = []
+    for game, taggers in games.items():
+        names = sorted(t for t in taggers if (game, t) in indexes)
+        for i, tagger_a in enumerate(names):
+            for tagger_b in names[i + 1:]:
+                tasks.append((game, tagger_a, tagger_b, thresholds))
+
+    if not tasks:
+        return [], errors
+
+    workers = workers or min(len(tasks), os.cpu_count() or 1)
+    if workers <= 1:
+        _init_agreement_worker(indexes)
+        batches = [compare_taggers(task) for task in tasks]
+    else:
+        with ProcessPoolExecutor(
+            max_workers=workers, initializer=_init_agreement_worker, initargs=(indexes,)
+        ) as pool:
+            batches = list(pool.map(compare_taggers, tasks, chunksize=max(1, len(tasks) // (4 * workers))))
+    return [row for batch in batches for row in batch], errors
+
+
+def aggregate_agreement(rows):
+    """Pool each tagger pair across games: summed match counts and summed label confusion."""
+    grouped = defaultdict(list)
+    for row in rows:
+        grouped[(row["tagger_a"], row["tagger_b"], row["threshold"])].append(row)
+
+    pooled = []
+    for (tagger_a, tagger_b, threshold), entries in sorted(grouped.items()):
+        confusion = defaultdict(lambda: defaultdict(int))
+        for e in entries:
+            for a, row in e["confusion"].items():
+                for b, count in row.items():
+                    confusion[a][b] += count
+        pooled.append({
+            "game": "",
+            "tagger_a": tagger_a,
+            "tagger_b": tagger_b,
+            "threshold": threshold,
+            "games": len(entries),
+            "metrics": compute_metrics(
+                sum(e["metrics"]["tp"] for e in entries),
+                sum(e["metrics"]["fp"] for e in entries),
+                sum(e["metrics"]["fn"] for e in entries),
+            ),
+            "kappa": cohen_kappa(confusion),
+        })
+    return pooled
+
+
+def _merge_confusion(into, confusion):
+    for label, matrix in confusion.items():
+        for gt_sub, row in matrix.items():
+            for pred_sub, count in row.items():
+                into[label][gt_sub][pred_sub] += count
+
+
+def aggregate_results(results):
+    """
+    Aggregate per-game results per tagger and threshold.
+
+    micro : metrics over the summed TP/FP/FN of every game
+    macro : unweighted mean of each game's precision/recall/F1
+
+    Returns ``{tagger: {threshold: {"games", "micro", "macro", "per_class", "confusion"}}}``.
+    """
+    grouped = defaultdict(lambda: defaultdict(list))
+    for result in results:
+        if "error" in result:
+            continue
+        for entry in result["thresholds"]:
+            grouped[result["tagger"]][entry["threshold"]].append(entry)
+
+    aggregates = {}
+    for tagger in sorted(grouped):
+        aggregates[tagger] = {}
+        for threshold in sorted(grouped[tagger]):
+            entries = grouped[tagger][threshold]
+            n = len(entries)
+
+            micro = compute_metrics(
+                sum(e["overall"]["tp"] for e in entries),
+                sum(e["overall"]["fp"] for e in entries),
+                sum(e["overall"]["fn"] for e in entries),
+            )
+            macro = {
+                key: sum(e["overall"][key] for e in entries) / n
+                for key in ("precision", "recall", "f1")
+            }
+
+            class_counts = defaultdict(lambda: {"tp": 0, "fp": 0, "fn": 0})
+            confusion = defaultdict(lambda: defaultdict(lambda: defaultdict(int)))
+            for e in entries:
+                for label, m in e["per_class"].items():
+                    for key in ("tp", "fp", "fn"):
+                        class_counts[label][key] += m[key]
+                _merge_confusion(confusion, e["confusion"])
+
+            aggregates[tagger][threshold] = {
+                "games": n,
+                "micro": micro,
+                "macro": macro,
+                "per_class": {
+                    label: compute_metrics(c["tp"], c["fp"], c["fn"])
+                    for label, c in sorted(class_counts.items())
+                },
+                "confusion": confusion,
+            }
+    return aggregates
+
+
 # ---------------------------------------------------------------------------
 # Reporting
 # ---------------------------------------------------------------------------
@@ -232,7 +720,7 @@ def print_subtype_confusion(confusion):
         gt_subs = sorted(matrix.keys())
         pred_subs = sorted({p for row in matrix.values() for p in row})
         col_w = max(len(s) for s in pred_subs + gt_subs + ["GT \\ Pred"])
-        total = sum(matrix[g][p] for g in gt_subs for p in pred_subs)
+        total = sum(matrix[g].get(p, 0) for g in gt_subs for p in pred_subs)
         correct = sum(matrix[s].get(s, 0) for s in gt_subs)
 
         print(f"\n  {label}  —  subtype accuracy: {correct}/{total} ({correct/total:.1%})")
@@ -266,6 +754,190 @@ def print_report(threshold, overall, per_class, fn_list, fp_list, confusion, sho
     print_subtype_confusion(confusion)
 
 
+def print_batch_report(results, aggregates):
+    errors = [r for r in results if "error" in r]
+    games = {r["game"] for r in results}
+    print(f"\nGames discovered         : {len(games)}")
+    print(f"Game/tagger pairs        : {len(results)}")
+    if errors:
+        print(f"Pairs skipped (errors)   : {len(errors)}")
+        for r in errors:
+            print(f"    {r['game']} [{r['tagger']}]: {r['error']}")
+
+    for tagger, by_threshold in aggregates.items():
+        for threshold, agg in by_threshold.items():
+            _print_section(f"Tagger: {tagger}  |  Threshold: ±{threshold} frames  |  Games: {agg['games']}")
+
+            header = f"  {'Average':<{_COL_LABEL}}  {'Prec':>8}  {'Rec':>8}  {'F1':>8}  {'TP':>6}  {'FP':>6}  {'FN':>6}"
+            class_header = f"  {'Label':<{_COL_LABEL}}  {'Prec':>8}  {'Rec':>8}  {'F1':>8}  {'TP':>6}  {'FP':>6}  {'FN':>6}"
+            print()
+            print(header)
+            print("  " + "-" * (len(header) - 2))
+            _print_metrics_row("MICRO (summed counts)", agg["micro"], indent=2)
+            macro = agg["macro"]
+            print(
+                f"  {'MACRO (mean over games)':<{_COL_LABEL - 2}}"
+                f"  {_fmt(macro['precision']):>8}  {_fmt(macro['recall']):>8}  {_fmt(macro['f1']):>8}"
+            )
+
+            print(f"\n  PER-CLASS BREAKDOWN (micro):")
+            print(class_header)
+            print("  " + "-" * (len(header) - 2))
+            for label, m in agg["per_class"].items():
+                _print_metrics_row(label, m, indent=2)
+
+            print_subtype_confusion(agg["confusion"])
+
+
+def print_agreement_report(rows, pooled, errors):
+    if errors:
+        print(f"\nFiles skipped (errors)   : {len(errors)}")
+        for e in errors:
+            print(f"    {e['game']} [{e['tagger']}]: {e['error']}")
+
+    header = f"  {'Tagger A':<16}  {'Tagger B':<16}  {'F1':>8}  {'Kappa':>8}  {'Match':>6}  {'A only':>6}  {'B only':>6}"
+
+    def _print_rows(entries):
+        print(header)
+        print("  " + "-" * (len(header) - 2))
+        for e in entries:
+            m = e["metrics"]
+            print(
+                f"  {e['tagger_a']:<16}  {e['tagger_b']:<16}"
+                f"  {_fmt(m['f1']):>8}  {_fmt(e['kappa']):>8}"
+                f"  {m['tp']:>6}  {m['fn']:>6}  {m['fp']:>6}"
+            )
+
+    by_game = defaultdict(lambda: defaultdict(list))
+    for row in rows:
+        by_game[row["game"]][row["threshold"]].append(row)
+    for game in sorted(by_game):
+        for threshold in sorted(by_game[game]):
+            _print_section(f"Game: {game}  |  Threshold: ±{threshold} frames")
+            print()
+            _print_rows(by_game[game][threshold])
+
+    by_threshold = defaultdict(list)
+    for entry in pooled:
+        by_threshold[entry["threshold"]].append(entry)
+    for threshold in sorted(by_threshold):
+        _print_section(f"All games pooled  |  Threshold: ±{threshold} frames")
+        print()
+        _print_rows(by_threshold[threshold])
+
+
+# ---------------------------------------------------------------------------
+# Machine-readable output
+# ---------------------------------------------------------------------------
+
+_METRIC_COLUMNS = ["precision", "recall", "f1", "tp", "fp", "fn"]
+_METRIC_HEADER = ["scope", "game", "tagger", "threshold", "label"] + _METRIC_COLUMNS
+_ERROR_HEADER = ["game", "tagger", "threshold", "kind", "frame", "label", "subType", "gameTime"]
+
+
+def _metric_rows(results, aggregates):
+    """Flatten per-game and aggregate metrics into one long table."""
+    for result in results:
+        if "error" in result:
+            continue
+        for entry in result["thresholds"]:
+            base = ["game", result["game"], result["tagger"], entry["threshold"]]
+            yield base + ["OVERALL"] + [entry["overall"][c] for c in _METRIC_COLUMNS]
+            for label, m in entry["per_class"].items():
+                yield base + [label] + [m[c] for c in _METRIC_COLUMNS]
+
+    for tagger, by_threshold in aggregates.items():
+        for threshold, agg in by_threshold.items():
+            yield ["micro", "", tagger, threshold, "OVERALL"] + [agg["micro"][c] for c in _METRIC_COLUMNS]
+            yield ["macro", "", tagger, threshold, "OVERALL"] + [agg["macro"].get(c, "") for c in _METRIC_COLUMNS]
+            for label, m in agg["per_class"].items():
+                yield ["micro", "", tagger, threshold, label] + [m[c] for c in _METRIC_COLUMNS]
+
+
+def _error_rows(results):
+    """One row per missed (FN) or extra (FP) annotation."""
+    for result in results:
+        if "error" in result:
+            continue
+        for entry in result["thresholds"]:
+            for kind, anns in (("FN", entry["fn"]), ("FP", entry["fp"])):
+                for ann in sorted(anns, key=lambda a: a["frame"]):
+                    yield [
+                        result["game"], result["tagger"], entry["threshold"], kind,
+                        ann["frame"], ann.get("label"), ann.get("subType"), ann.get("gameTime"),
+                    ]
+
+
+def _errors_path(path):
+    return path.with_name(f"{path.stem}_errors{path.suffix}")
+
+
+def _write_tables(path, tables):
+    """
+    Write ``[(path, header, rows), ...]`` as CSV or Parquet, following the suffix
+    of `path`. Parquet goes through pandas (with pyarrow or fastparquet).
+    """
+    suffix = path.suffix.lower()
+    if suffix == ".csv":
+        for out_path, header, rows in tables:
+            with open(out_path, "w", newline="") as f:
+                writer = csv.writer(f)
+                writer.writerow(header)
+                writer.writerows(rows)
+    elif suffix == ".parquet":
+        try:
+            import pandas as pd
+        except ImportError:
+            print("Error: Parquet output requires pandas (and pyarrow or fastparquet).")
+            raise SystemExit(1)
+        for out_path, header, rows in tables:
+            pd.DataFrame(rows, columns=header).to_parquet(out_path, index=False)
+    else:
+        print(f"Error: unsupported output format '{path.suffix}' (use .json, .csv or .parquet)")
+        raise SystemExit(1)
+    return [out_path for out_path, _, _ in tables]
+
+
+def write_results(path, results, aggregates):
+    """
+    Write results to `path`; the format follows the file extension.
+
+    .json    : everything (per-game results incl. FN/FP lists, aggregates)
+    .csv     : long metrics table, plus ``{stem}_errors.csv`` with the FN/FP lists
+    .parquet : same two tables as CSV (requires pandas with pyarrow or fastparquet)
+    """
+    path = Path(path)
+    if path.suffix.lower() == ".json":
+        with open(path, "w") as f:
+            json.dump({"games": results, "aggregates": aggregates}, f, indent=2)
+        return [path]
+
+    return _write_tables(path, [
+        (path, _METRIC_HEADER, list(_metric_rows(results, aggregates))),
+        (_errors_path(path), _ERROR_HEADER, list(_error_rows(results))),
+    ])
+
+
+_AGREEMENT_HEADER = ["scope", "game", "tagger_a", "tagger_b", "threshold", "f1", "kappa", "matched", "a_only", "b_only"]
+
+
+def write_agreement(path, rows, pooled):
+    """Write pairwise agreement (per game and pooled) to .json, .csv or .parquet."""
+    path = Path(path)
+    if path.suffix.lower() == ".json":
+        with open(path, "w") as f:
+            json.dump({"pairs": rows, "pooled": pooled}, f, indent=2)
+        return [path]
+
+    table = [
+        [scope, e["game"], e["tagger_a"], e["tagger_b"], e["threshold"], e["metrics"]["f1"], e["kappa"],
+         e["metrics"]["tp"], e["metrics"]["fn"], e["metrics"]["fp"]]
+        for scope, entries in (("game", rows), ("pooled", pooled))
+        for e in entries
+    ]
+    return _write_tables(path, [(path, _AGREEMENT_HEADER, table)])
+
+
 # ---------------------------------------------------------------------------
 # Main
 # ---------------------------------------------------------------------------
@@ -279,20 +951,92 @@ def main():
         action="store_true",
         help="Print the full list of missing (FN) and extra (FP) annotations for each threshold/mode.",
     )
+    parser.add_argument(
+        "--batch",
+        metavar="DIR",
+        help="Evaluate every *_gt.json / *_{tagger}.json pair found under DIR instead of GT_PATH/COMPANY_PATH.",
+    )
+    parser.add_argument(
+        "--tagger",
+        help="Batch mode: only evaluate files from this tagger (default: every tagger found).",
+    )
+    parser.add_argument(
+        "--workers",
+        type=int,
+        default=None,
+        help="Batch/agreement mode: number of worker processes (default: one per CPU, 1 = no pool).",
+    )
+    parser.add_argument(
+        "--output",
+        action="append",
+        default=[],
+        metavar="PATH",
+        help="Also write results to PATH (.json, .csv or .parquet). May be given more than once.",
+    )
+    parser.add_argument(
+        "--cache",
+        metavar="PATH",
+        help="Batch mode: reuse per-game results from this cache file when neither annotation file changed.",
+    )
+    parser.add_argument(
+        "--agreement",
+        metavar="DIR",
+        help="Compute pairwise agreement between every tagger (including _gt) of each game found under DIR.",
+    )
     args = parser.parse_args()
 
-    gt = load_annotations(Path(GT_PATH))
-    pred = load_annotations(Path(COMPANY_PATH))
-
-    print(f"\nGround truth annotations : {len(gt)}")
-    print(f"Company annotations      : {len(pred)}")
+    if args.agreement:
+        games = discover_tagger_files(args.agreement)
+        if not games:
+            print(f"No games with two or more tagger files found under {args.agreement}")
+            raise SystemExit(1)
+        rows, errors = run_agreement(games, THRESHOLDS, workers=args.workers)
+        pooled = aggregate_agreement(rows)
+        print_agreement_report(rows, pooled, errors)
+        for output in args.output:
+            for written in write_agreement(output, rows, pooled):
+                print(f"\nWrote {written}")
+        print()
+        return
 
-    for threshold in THRESHOLDS:
-        tp_pairs, fn_list, fp_list = match_annotations(gt, pred, threshold, "label")
-        overall = compute_metrics(len(tp_pairs), len(fp_list), len(fn_list))
-        per_class = compute_per_class_metrics(tp_pairs, fn_list, fp_list)
-        confusion = compute_subtype_confusion(tp_pairs)
-        print_report(threshold, overall, per_class, fn_list, fp_list, confusion, show_details=args.details)
+    if args.batch:
+        jobs = discover_game_pairs(args.batch, tagger=args.tagger)
+        if not jobs:
+            print(f"No *{GT_SUFFIX} files with matching tagger files found under {args.batch}")
+            raise SystemExit(1)
+        cache = ResultCache(args.cache) if args.cache else None
+        results = run_batch(jobs, THRESHOLDS, workers=args.workers, cache=cache)
+        aggregates = aggregate_results(results)
+        print_batch_report(results, aggregates)
+        if cache is not None:
+            cache.save()
+            print(f"\nCache: {cache.hits} reused, {cache.misses} evaluated ({cache.path})")
+    else:
+        gt = load_annotations(Path(GT_PATH))
+        pred = load_annotations(Path(COMPANY_PATH))
+
+        print(f"\nGround truth annotations : {len(gt)}")
+        print(f"Company annotations      : {len(pred)}")
+
+        entries = evaluate_pair(gt, pred, THRESHOLDS)
+        for entry in entries:
+            print_report(
+                entry["threshold"], entry["overall"], entry["per_class"],
+                entry["fn"], entry["fp"], entry["confusion"], show_details=args.details,
+            )
+
+        results = [{
+            "game": Path(GT_PATH).stem,
+            "tagger": Path(COMPANY_PATH).stem,
+            "n_gt": len(gt),
+            "n_pred": len(pred),
+            "thresholds": entries,
+        }]
+        aggregates = aggregate_results(results)
+
+    for output in args.output:
+        for written in write_results(output, results, aggregates):
+            print(f"\nWrote {written}")
 
     print()
 
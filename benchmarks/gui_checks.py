@@ -0,0 +1,78 @@
+"""Behaviour checks on the real MainWindow, run headless like gui_harness.py.
+
+Each check drives the window through the same key handlers a tagger uses and
+verifies the resulting annotation list. Exits 1 if any check fails.
+
+    python benchmarks/gui_checks.py
+
+Needs the same environment as gui_harness.py (PyQt5 with QtMultimedia,
+OpenCV, numpy, and ffmpeg or OpenCV for the synthetic video); no display.
+"""
+
+import shutil
+import sys
+import tempfile
+
+from PyQt5.QtCore import Qt
+
+from gui_harness import boot, key_event, prepare_game, setup_environment
+
+CHECK_EVENTS = 50
+CHECK_VIDEO_SECONDS = 60
+
+
+def check_delete_while_editing(app, window):
+    """Delete another event while one is being nudged; two undos restore both."""
+    list_display = window.list_display
+    events = list_display._visible_events
+    if len(events) < 2:
+        return "the synthetic game has fewer than two events"
+    edited, deleted = events[0], events[-1]
+    original = (edited.position, edited.frame)
+
+    list_display._activate_row(0)
+    window.keyPressEvent(key_event(Qt.Key_Right))
+    window.keyPressEvent(key_event(Qt.Key_Right, press=False))
+    app.processEvents()
+    if (edited.position, edited.frame) == original:
+        return "Right in edit mode did not move the edited event"
+
+    list_display.list_widget.setCurrentRow(list_display._visible_events.index(deleted))
+    if not window.editing_event:
+        return "selecting another row ended the edit"
+    window.keyPressEvent(key_event(Qt.Key_Delete))
+    app.processEvents()
+    if deleted in window.list_manager.event_list:
+        return "Delete did not remove the selected event"
+
+    window._undo_edit()
+    if deleted not in window.list_manager.event_list:
+        return "the first undo did not restore the deleted event"
+    window._undo_edit()
+    if (edited.position, edited.frame) != original:
+        return f"the second undo left the edited event at {edited.position} ms instead of {original[0]} ms"
+    return None
+
+
+CHECKS = [check_delete_while_editing]
+
+
+def main():
+    workdir = tempfile.mkdtemp(prefix="annotator-gui-checks-")
+    setup_environment(workdir)
+    failed = 0
+    try:
+        for check in CHECKS:
+            # A fresh window and annotation file per check
+            app, window = boot(prepare_game(workdir, CHECK_EVENTS, CHECK_VIDEO_SECONDS))
+            problem = check(app, window)
+            window.close()
+            print(f"{'FAIL' if problem else 'ok':<5}{check.__name__}" + (f": {problem}" if problem else ""))
+            failed += bool(problem)
+    finally:
+        shutil.rmtree(workdir, ignore_errors=True)
+    return 1 if failed else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
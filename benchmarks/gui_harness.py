@@ -0,0 +1,296 @@
+"""Headless GUI performance harness.
+
+Boots the annotator's MainWindow on Qt's offscreen platform with a synthetic
+video and a large annotation file, then drives it the way a tagger does:
+player position ticks during playback, held arrow keys, slider scrubbing.
+Each phase reports the per-slot latency histograms recorded by utils.perf
+(position_changed, update_passing_events, keyPressEvent, ...) and the
+event-loop lag measured by a high-frequency probe timer.
+
+    python benchmarks/gui_harness.py --events 10000
+    python benchmarks/gui_harness.py --events 100000 --phase-seconds 5 --output gui.json
+
+Needs the annotator's runtime dependencies (PyQt5 with QtMultimedia, OpenCV,
+numpy) plus ffmpeg or OpenCV to write the synthetic video; no display.
+"""
+
+import argparse
+import json
+import os
+import platform
+import random
+import shutil
+import subprocess
+import sys
+import tempfile
+import time
+from datetime import datetime, timezone
+from pathlib import Path
+
+from PyQt5.QtCore import QEvent, QObject, Qt, QTimer
+from PyQt5.QtGui import QKeyEvent
+from PyQt5.QtWidgets import QApplication
+
+BENCH_DIR = Path(__file__).resolve().parent
+ANNOTATION_DIR = BENCH_DIR.parent / "Annotation"
+
+# Rates a real session runs at
+PLAYER_NOTIFY_MS = 33      # fastest QMediaPlayer notify interval (see interface/position_ticks.py)
+KEY_REPEAT_MS = 33         # typical X11/macOS key auto-repeat (~30 Hz)
+SCRUB_MS = 16              # slider drag events at 60 Hz
+LAG_PROBE_MS = 5
+
+VIDEO_FPS = 25
+VIDEO_SIZE = (640, 360)
+
+
+def setup_environment(workdir):
+    """Offscreen Qt and a throwaway cache; must run before the annotator modules are imported."""
+    os.environ.setdefault("QT_QPA_PLATFORM", "offscreen")
+    os.environ.setdefault("ANNOTATOR_CACHE_DIR", os.path.join(workdir, "cache"))
+    os.environ["ANNOTATOR_PERF"] = "1"
+    for path in (str(ANNOTATION_DIR), str(BENCH_DIR)):
+        if path not in sys.path:
+            sys.path.insert(0, path)
+
+
+def make_video(path, seconds):
+    """Write a synthetic test-pattern video (H.264 via ffmpeg, else MJPEG AVI via OpenCV)."""
+    width, height = VIDEO_SIZE
+    if shutil.which("ffmpeg"):
+        subprocess.run(
+            [
+                "ffmpeg", "-v", "error", "-y",
+                "-f", "lavfi", "-i", f"testsrc=size={width}x{height}:rate={VIDEO_FPS}",
+                "-t", str(seconds), "-c:v", "libx264", "-preset", "ultrafast",
+                "-g", str(VIDEO_FPS * 2), "-pix_fmt", "yuv420p", path,
+            ],
+            check=True,
+        )
+        return path
+
+    import cv2
+    import numpy as np
+
+    path = os.path.splitext(path)[0] + ".avi"
+    writer = cv2.VideoWriter(path, cv2.VideoWriter_fourcc(*"MJPG"), VIDEO_FPS, VIDEO_SIZE)
+    frame = np.zeros((height, width, 3), dtype=np.uint8)
+    for i in range(int(seconds * VIDEO_FPS)):
+        frame[:] = (i * 3 % 256, i * 5 % 256, i * 7 % 256)
+        cv2.putText(frame, str(i), (20, height // 2), cv2.FONT_HERSHEY_SIMPLEX, 2, (255, 255, 255), 3)
+        writer.write(frame)
+    writer.release()
+    return path
+
+
+def prepare_game(workdir, n_events, video_seconds, seed=0):
+    """Synthetic video plus a Labels-v2.json next to it (picked up by MediaPlayer.load_video)."""
+    import synthetic
+
+    game_dir = os.path.join(workdir, "game")
+    os.makedirs(game_dir, exist_ok=True)
+    # The leading "1" makes the annotator treat it as the first half
+    video_path = make_video(os.path.join(game_dir, "1_synthetic.mp4"), video_seconds)
+    synthetic.write_game(os.path.join(game_dir, "Labels-v2.json"), synthetic.generate_events(n_events, seed=seed))
+    return video_path
+
+
+def wait_until(app, predicate, timeout_s):
+    """Run the event loop until predicate() holds; False on timeout."""
+    deadline = time.monotonic() + timeout_s
+    while not predicate():
+        if time.monotonic() > deadline:
+            return False
+        app.processEvents()
+        time.sleep(0.001)
+    return True
+
+
+def pump(app, seconds):
+    wait_until(app, lambda: False, seconds)
+
+
+def boot(video_path=None):
+    """Create the QApplication and MainWindow, optionally opening `video_path`; returns (app, window)."""
+    from interface.main_window import MainWindow
+
+    app = QApplication.instance() or QApplication([sys.argv[0]])
+    window = MainWindow()
+    window.resize(1920, 1080)
+    window.show()
+    if video_path:
+        open_video(app, window, video_path)
+    return app, window
+
+
+def open_video(app, window, video_path, index_timeout_s=120.0):
+    """Load `video_path` and wait until it is playable and indexed."""
+    mp = window.media_player
+    mp.load_video(video_path)
+    if not wait_until(app, lambda: mp.media_player.duration() > 0, 15.0):
+        print("warning: the media backend did not report a duration; arrow steps will be no-ops", file=sys.stderr)
+    if not wait_until(app, lambda: mp.keyframe_index is not None and window.frame_timeline is not None, index_timeout_s):
+        print("warning: video indexing did not finish; measuring without seek indexes", file=sys.stderr)
+    window.setFocus()
+    app.processEvents()
+
+
+class LoopLagProbe(QObject):
+    """A precise timer recording how late each of its ticks fires as `event_loop_lag`."""
+
+    def __init__(self, interval_ms=LAG_PROBE_MS):
+        super().__init__()
+        self.interval_s = interval_ms / 1000.0
+        self._expected = None
+        self._timer = QTimer(self)
+        self._timer.setTimerType(Qt.PreciseTimer)
+        self._timer.setInterval(interval_ms)
+        self._timer.timeout.connect(self._tick)
+
+    def start(self):
+        self._expected = None
+        self._timer.start()
+
+    def stop(self):
+        self._timer.stop()
+
+    def _tick(self):
+        from utils import perf
+
+        now = time.perf_counter()
+        if self._expected is not None:
+            perf.record("event_loop_lag", max(0.0, now - self._expected))
+        self._expected = now + self.interval_s
+
+
+def key_event(key, press=True, auto_repeat=False, modifiers=None):
+    kind = QEvent.KeyPress if press else QEvent.KeyRelease
+    return QKeyEvent(kind, key, modifiers if modifiers is not None else Qt.NoModifier, "", auto_repeat, 1)
+
+
+def post_key(window, key, press=True, auto_repeat=False, modifiers=None):
+    """Queue a key event on the window like the windowing system would."""
+    QApplication.postEvent(window, key_event(key, press, auto_repeat, modifiers))
+
+
+def build_phases(window, seed=0):
+    """[(name, interval_ms, action(step)), ...] run in order for the same duration each."""
+    mp = window.media_player
+    player = mp.media_player
+    rng = random.Random(seed)
+    duration = max(1, player.duration())
+    half_ms = 20 * 60 * 1000
+
+    def playback(rate):
+        # Ticks go through the same dispatcher as QMediaPlayer.positionChanged and
+        # sweep the whole half so every event passes under the overlay.
+        def action(step):
+            mp.position_ticks.dispatch(int(step * PLAYER_NOTIFY_MS * rate) % half_ms)
+        return action
+
+    def hold(key):
+        def action(step):
+            post_key(window, key, auto_repeat=step > 0)
+        return action
+
+    def scrub(step):
+        scrub.position = max(0, min(duration, scrub.position + rng.randint(-2000, 2000)))
+        mp.slider.setValue(scrub.position)
+        mp._slider_moved(scrub.position)
+    scrub.position = duration // 2
+
+    return [
+        ("idle", 100, lambda step: None),
+        ("playback_1x", PLAYER_NOTIFY_MS, playback(1.0)),
+        ("playback_4x", PLAYER_NOTIFY_MS, playback(4.0)),
+        ("hold_right", KEY_REPEAT_MS, hold(Qt.Key_Right)),
+        ("hold_left", KEY_REPEAT_MS, hold(Qt.Key_Left)),
+        ("scrub", SCRUB_MS, scrub),
+    ]
+
+
+def run_phases(app, window, phases, phase_seconds):
+    """Drive each phase from a timer inside the event loop; returns per-phase perf snapshots."""
+    from utils import perf
+
+    probe = LoopLagProbe()
+    results = []
+    for name, interval_ms, action in phases:
+        # Start each phase paused at the middle of the video with a clean slate
+        window.media_player.media_player.pause()
+        window.media_player.set_position(max(0, window.media_player.media_player.duration() // 2))
+        pump(app, 0.3)
+        perf.reset()
+
+        driver = QTimer()
+        driver.setTimerType(Qt.PreciseTimer)
+        driver.setInterval(interval_ms)
+        steps = {"n": 0}
+
+        def tick(action=action):
+            action(steps["n"])
+            steps["n"] += 1
+
+        driver.timeout.connect(tick)
+        probe.start()
+        driver.start()
+        started = time.perf_counter()
+        wait_until(app, lambda: time.perf_counter() - started >= phase_seconds, phase_seconds + 1)
+        driver.stop()
+        probe.stop()
+        # Let queued events drain so their latencies are counted in this phase
+        pump(app, 0.2)
+
+        snap = perf.snapshot()
+        results.append({
+            "phase": name,
+            "seconds": round(time.perf_counter() - started, 3),
+            "actions": steps["n"],
+            "histograms": snap["histograms"],
+            "counters": snap["counters"],
+        })
+    return results
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Measure annotator UI responsiveness without a display.")
+    parser.add_argument("--events", type=int, default=10000, help="Annotations in the synthetic game")
+    parser.add_argument("--video-seconds", type=int, default=300, help="Length of the synthetic video")
+    parser.add_argument("--phase-seconds", type=float, default=3.0, help="How long each phase runs")
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--output", default=None, help="Write results JSON here")
+    args = parser.parse_args()
+
+    workdir = tempfile.mkdtemp(prefix="annotator-gui-bench-")
+    setup_environment(workdir)
+    try:
+        from utils import perf
+
+        video_path = prepare_game(workdir, args.events, args.video_seconds, seed=args.seed)
+        app, window = boot(video_path)
+        results = run_phases(app, window, build_phases(window, seed=args.seed), args.phase_seconds)
+        window.close()
+
+        for phase in results:
+            print(f"\n== {phase['phase']} ({phase['actions']} actions in {phase['seconds']:.1f} s)")
+            print(perf.format_table({"histograms": phase["histograms"], "counters": phase["counters"]}))
+
+        if args.output:
+            report = {
+                "meta": {
+                    "created": datetime.now(timezone.utc).isoformat(timespec="seconds"),
+                    "python": platform.python_version(),
+                    "platform": platform.platform(),
+                    "events": args.events,
+                    "phase_seconds": args.phase_seconds,
+                },
+                "phases": results,
+            }
+            with open(args.output, "w") as f:
+                json.dump(report, f, indent=2, sort_keys=True)
+    finally:
+        shutil.rmtree(workdir, ignore_errors=True)
+
+
+if __name__ == "__main__":
+    main()
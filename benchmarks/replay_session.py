@@ -0,0 +1,226 @@
+"""Replay a recorded tagging session against the current build and report per-action latency.
+
+Record a session with
+
+    python Annotation/src/main.py --record-session slow.jsonl.gz
+
+then replay it headlessly (offscreen Qt):
+
+    python benchmarks/replay_session.py slow.jsonl.gz
+    python benchmarks/replay_session.py slow.jsonl.gz --speed 0 --output replay.json
+
+Key and mouse input is re-sent at the recorded times (scaled by --speed; 0
+replays back-to-back). Each action is timed from the moment it was due until
+its handler returned. The time spent in the handler and the lateness (the
+event loop was still busy when the action came due) are reported per key or
+widget, with the slowest actions listed individually. Videos load from their
+recorded path, from --video, or as a synthetic stand-in; annotations load from
+the snapshot taken when the session opened them, so edits never reach the
+original files.
+"""
+
+import argparse
+import json
+import os
+import platform
+import shutil
+import sys
+import tempfile
+import time
+from datetime import datetime, timezone
+
+from PyQt5.QtCore import QEvent, QObject, QPointF, Qt, QTimer
+from PyQt5.QtGui import QKeyEvent, QKeySequence, QMouseEvent
+from PyQt5.QtWidgets import QApplication
+
+import gui_harness
+
+_KEY_TYPES = {"kp": QEvent.KeyPress, "kr": QEvent.KeyRelease}
+_MOUSE_TYPES = {"mp": QEvent.MouseButtonPress, "mr": QEvent.MouseButtonRelease, "md": QEvent.MouseButtonDblClick}
+
+# Re-seek a paused replay when it drifts this far from the recorded position
+_RESYNC_MS = 500
+
+
+def key_label(key, modifiers):
+    name = QKeySequence(int(modifiers) | key).toString() or f"0x{key:x}"
+    return f"key {name}"
+
+
+class SessionReplayer(QObject):
+    """Dispatches recorded input from a timer inside the event loop.
+
+    Driving from a timer (rather than a blocking loop) keeps modal dialogs
+    opened by a replayed key working: their nested event loops keep the
+    replay going.
+    """
+
+    def __init__(self, app, window, session_path, records, workdir, speed=1.0, video_override=None):
+        super().__init__()
+        self.app = app
+        self.window = window
+        self.session_dir = os.path.dirname(os.path.abspath(session_path))
+        self.records = records
+        self.workdir = workdir
+        self.speed = speed
+        self.video_override = video_override
+        self.index = 0
+        self.actions = []
+        self.skipped = 0
+        self.resyncs = 0
+        self._offset = 0.0
+        self._start = None
+        self._timer = QTimer(self)
+        self._timer.setSingleShot(True)
+        self._timer.setTimerType(Qt.PreciseTimer)
+        self._timer.timeout.connect(self._dispatch_due)
+
+    def start(self):
+        self._start = time.perf_counter()
+        self._timer.start(0)
+
+    def _due(self, t_ms):
+        if not self.speed:
+            return time.perf_counter()
+        return self._start + self._offset + t_ms / 1000.0 / self.speed
+
+    def _dispatch_due(self):
+        while self.index < len(self.records):
+            record = self.records[self.index]
+            due = self._due(record[0])
+            now = time.perf_counter()
+            if due > now:
+                self._timer.start(max(0, int((due - now) * 1000)))
+                return
+            # Advance first: a modal dialog opened by this action re-enters here
+            self.index += 1
+            self._dispatch(record, due)
+        self.app.quit()
+
+    def _dispatch(self, record, due):
+        from utils import perf
+
+        t_ms, kind = record[0], record[1]
+        if kind == "open":
+            started = time.perf_counter()
+            self._open(record[2], record[3])
+            # Loading and indexing are not part of the recorded timeline
+            self._offset += time.perf_counter() - started
+            return
+        if kind == "pos":
+            self._resync(record[2], record[3])
+            return
+
+        if kind in _KEY_TYPES:
+            _, _, key, modifiers, auto_repeat, text = record
+            target = QApplication.focusWidget() or QApplication.activeWindow() or self.window
+            event = QKeyEvent(_KEY_TYPES[kind], key, Qt.KeyboardModifiers(modifiers), text, bool(auto_repeat), 1)
+            label = key_label(key, modifiers) if kind == "kp" else "key release"
+        elif kind in _MOUSE_TYPES:
+            _, _, path, x, y, button, buttons, modifiers = record
+            from interface.session_recorder import resolve_widget_path
+
+            target = resolve_widget_path(path)
+            if target is None:
+                self.skipped += 1
+                return
+            event = QMouseEvent(
+                _MOUSE_TYPES[kind], QPointF(x, y), Qt.MouseButton(button),
+                Qt.MouseButtons(buttons), Qt.KeyboardModifiers(modifiers),
+            )
+            label = f"click {type(target).__name__}" if kind != "mr" else "mouse release"
+        else:
+            self.skipped += 1
+            return
+
+        started = time.perf_counter()
+        QApplication.sendEvent(target, event)
+        handler = time.perf_counter() - started
+        lateness = max(0.0, started - due)
+        perf.record(f"replay {label}", handler)
+        perf.record("replay lateness", lateness)
+        self.actions.append({"t_ms": t_ms, "action": label, "handler_ms": handler * 1000.0, "lateness_ms": lateness * 1000.0})
+
+    def _open(self, video_path, labels_snapshot):
+        """Open the recorded video in a scratch directory with the recorded annotations."""
+        game_dir = os.path.join(self.workdir, f"open-{self.index}")
+        os.makedirs(game_dir, exist_ok=True)
+        source = self.video_override or video_path
+        if not os.path.isfile(source):
+            last_ms = max((r[2] for r in self.records if r[1] == "pos"), default=0)
+            print(f"warning: {source} not found; replaying on a synthetic video", file=sys.stderr)
+            source = gui_harness.make_video(os.path.join(self.workdir, f"synthetic-{self.index}.mp4"), last_ms // 1000 + 60)
+        # Keep the recorded file name: the half is parsed from it
+        name = os.path.splitext(os.path.basename(video_path))[0] + os.path.splitext(source)[1]
+        os.symlink(os.path.abspath(source), os.path.join(game_dir, name))
+        if labels_snapshot:
+            shutil.copy(os.path.join(self.session_dir, labels_snapshot), os.path.join(game_dir, "Labels-v2.json"))
+        gui_harness.open_video(self.app, self.window, os.path.join(game_dir, name))
+
+    def _resync(self, position, state):
+        from PyQt5.QtMultimedia import QMediaPlayer
+
+        mp = self.window.media_player
+        if state == QMediaPlayer.PlayingState or mp.media_player.state() == QMediaPlayer.PlayingState:
+            return
+        if abs(mp.current_position() - position) > _RESYNC_MS:
+            self.resyncs += 1
+            mp.set_position(position)
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Replay a recorded annotator session and report latency.")
+    parser.add_argument("session", help="File written by main.py --record-session")
+    parser.add_argument("--video", default=None, help="Use this video instead of the recorded path")
+    parser.add_argument("--speed", type=float, default=1.0, help="Replay speed factor (0 = no waiting)")
+    parser.add_argument("--top", type=int, default=10, help="How many of the slowest actions to list")
+    parser.add_argument("--output", default=None, help="Write results JSON here")
+    args = parser.parse_args()
+
+    workdir = tempfile.mkdtemp(prefix="annotator-replay-")
+    gui_harness.setup_environment(workdir)
+    os.environ.setdefault("TAGGER_NAME", "replay")
+    try:
+        from utils import perf
+        from utils.session_log import read_session
+
+        header, records = read_session(args.session)
+        app, window = gui_harness.boot()
+        perf.reset()
+        replayer = SessionReplayer(app, window, args.session, records, workdir, args.speed, args.video)
+        replayer.start()
+        app.exec_()
+        window.close()
+
+        slowest = sorted(replayer.actions, key=lambda a: a["handler_ms"] + a["lateness_ms"], reverse=True)[:args.top]
+        print(perf.format_table())
+        print(f"\n{len(replayer.actions)} actions replayed, {replayer.skipped} skipped, {replayer.resyncs} position resyncs")
+        if slowest:
+            print(f"\nSlowest {len(slowest)} actions (handler + lateness):")
+            for action in slowest:
+                print(f"  {action['t_ms'] / 1000.0:9.2f} s  {action['action']:<28}"
+                      f"{action['handler_ms']:9.1f} ms  (+{action['lateness_ms']:.1f} ms late)")
+
+        if args.output:
+            report = {
+                "meta": {
+                    "created": datetime.now(timezone.utc).isoformat(timespec="seconds"),
+                    "python": platform.python_version(),
+                    "platform": platform.platform(),
+                    "session": os.path.abspath(args.session),
+                    "recorded": header.get("created"),
+                    "speed": args.speed,
+                },
+                "summary": perf.snapshot(),
+                "skipped": replayer.skipped,
+                "resyncs": replayer.resyncs,
+                "actions": replayer.actions,
+            }
+            with open(args.output, "w") as f:
+                json.dump(report, f, indent=2, sort_keys=True)
+    finally:
+        shutil.rmtree(workdir, ignore_errors=True)
+
+
+if __name__ == "__main__":
+    main()
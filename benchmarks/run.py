@@ -0,0 +1,255 @@
+"""Micro-benchmarks for the annotator's data paths and the evaluation matcher.
+
+Each case runs on synthetic games (see synthetic.py) at several sizes and
+reports the median and best time per operation. Results are written as JSON;
+--compare checks them against a stored baseline and exits 1 on regressions.
+
+    python benchmarks/run.py                              # 1k / 10k / 100k events
+    python benchmarks/run.py --sizes 1000 10000 --output results.json
+    python benchmarks/run.py --save-baseline              # refresh baselines/default.json
+    python benchmarks/run.py --compare --tolerance 1.5    # fail if any case got >1.5x slower
+
+Baselines are machine-specific: refresh them on the machine that runs --compare.
+"""
+
+import argparse
+import json
+import os
+import platform
+import random
+import shutil
+import statistics
+import sys
+import tempfile
+import time
+from bisect import bisect_right
+from collections import Counter
+from datetime import datetime, timezone
+from pathlib import Path
+
+ROOT = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(ROOT / "Annotation"))
+sys.path.insert(0, str(ROOT / "Evaluation"))
+sys.path.insert(0, str(Path(__file__).resolve().parent))
+
+import annotation_eval  # noqa: E402
+import synthetic  # noqa: E402
+from utils.clip_planner import plan_clip_spans, row_at  # noqa: E402
+from utils.event_badges import passing_event_entries, visible_badge_texts  # noqa: E402
+from utils.event_class import Event  # noqa: E402
+from utils.list_management import ListManager  # noqa: E402
+
+DEFAULT_SIZES = (1000, 10000, 100000)
+DEFAULT_BASELINE = Path(__file__).resolve().parent / "baselines" / "default.json"
+
+# Ignore slowdowns smaller than this per operation (timer noise on tiny cases)
+MIN_DELTA_S = 20e-6
+
+
+def bench(fn, repeat=5, number=1, setup=None):
+    """Time `number` calls of fn() per sample; returns per-call median/min over `repeat` samples."""
+    samples = []
+    for _ in range(repeat):
+        if setup is not None:
+            setup()
+        start = time.perf_counter()
+        for _ in range(number):
+            fn()
+        samples.append((time.perf_counter() - start) / number)
+    return {
+        "median_s": statistics.median(samples),
+        "min_s": min(samples),
+        "repeat": repeat,
+        "number": number,
+    }
+
+
+def check_clip_highlights(spans, events):
+    """Rows of events (row, position) that are not the highlighted row at their own timestamp.
+
+    Events sharing a timestamp are skipped: only one of them can be highlighted.
+    """
+    counts = Counter(position for _, position in events)
+    starts = [span["start"] for span in spans]
+    wrong = []
+    for row, position in events:
+        if counts[position] > 1:
+            continue
+        i = bisect_right(starts, position) - 1
+        if i < 0 or not spans[i]["start"] <= position < spans[i]["end"] or row_at(spans[i], position) != row:
+            wrong.append(row)
+    return wrong
+
+
+def _loaded_manager(path, half=1):
+    manager = ListManager()
+    manager.create_list_from_json(path, half)
+    return manager
+
+
+def run_size(n_events, workdir, seed=0):
+    """All cases for one game size; returns {case_name: timing}."""
+    events = synthetic.generate_events(n_events, seed=seed)
+    path = os.path.join(workdir, f"game_{n_events}.json")
+    synthetic.write_game(path, events)
+    rng = random.Random(seed)
+    results = {}
+
+    manager = ListManager()
+    results["list_manager.read_json"] = bench(lambda: manager.read_json(path, 1), repeat=5)
+
+    save_path = os.path.join(workdir, f"save_{n_events}.json")
+    shutil.copy(path, save_path)
+    loaded = _loaded_manager(path)
+    results["list_manager.save_file"] = bench(lambda: loaded.save_file(save_path, 1), repeat=3)
+
+    adder = {}
+
+    def reset_adder():
+        adder["manager"] = _loaded_manager(path)
+
+    def add_one():
+        position = rng.randrange(0, synthetic.HALF_MS)
+        adder["manager"].add_event(Event("Drive", 1, "00:00", "Left", position, "visible", position // synthetic.FRAME_MS))
+
+    results["list_manager.add_event"] = bench(add_one, repeat=3, number=50, setup=reset_adder)
+
+    # Half the lookups hit an occupied frame, half a free one
+    occupied = [event.frame for event in loaded.event_list]
+    max_frame = synthetic.HALF_MS // synthetic.FRAME_MS
+    lookups = [rng.choice(occupied) if i % 2 else rng.randrange(max_frame) for i in range(1000)]
+    lookup_iter = iter(lookups * 1000)
+    results["list_manager.find_event_by_frame"] = bench(
+        lambda: loaded.find_event_by_frame(next(lookup_iter), 1), repeat=5, number=1000,
+    )
+
+    frames = iter([rng.randrange(max_frame) for _ in range(200)] * 100)
+    results["passing_event_entries"] = bench(
+        lambda: passing_event_entries(loaded.event_list, next(frames), 50), repeat=5, number=200,
+    )
+
+    by_position = sorted(loaded.event_list, key=lambda e: e.position)
+    positions = iter([rng.randrange(synthetic.HALF_MS) for _ in range(200)] * 100)
+    results["visible_badge_texts"] = bench(
+        lambda: visible_badge_texts(next(positions), by_position), repeat=5, number=200,
+    )
+
+    clip_events = [(row, event.position) for row, event in enumerate(by_position)]
+    spans = plan_clip_spans(clip_events)
+    wrong = check_clip_highlights(spans, clip_events)
+    if wrong:
+        raise RuntimeError(f"plan_clip_spans: {len(wrong)} events are not highlighted at their own timestamp")
+    results["plan_clip_spans"] = bench(lambda: plan_clip_spans(clip_events), repeat=3)
+
+    gt = [dict(ann, frame=int(ann["frame"])) for ann in events]
+    pred = [dict(ann, frame=int(ann["frame"])) for ann in synthetic.perturb(events, seed=seed + 1)]
+    results["annotation_eval.match_annotations"] = bench(
+        lambda: annotation_eval.match_annotations(gt, pred, 25, "label"), repeat=3,
+    )
+
+    return {f"{name}[n={n_events}]": timing for name, timing in results.items()}
+
+
+def run(sizes, seed=0):
+    workdir = tempfile.mkdtemp(prefix="annotator-bench-")
+    try:
+        results = {}
+        for n_events in sizes:
+            results.update(run_size(n_events, workdir, seed=seed))
+    finally:
+        shutil.rmtree(workdir, ignore_errors=True)
+    return {
+        "meta": {
+            "created": datetime.now(timezone.utc).isoformat(timespec="seconds"),
+            "python": platform.python_version(),
+            "platform": platform.platform(),
+            "sizes": list(sizes),
+            "seed": seed,
+        },
+        "results": results,
+    }
+
+
+def compare(current, baseline, tolerance):
+    """Return (rows, regressions) comparing per-op medians against the baseline."""
+    rows = []
+    regressions = []
+    for name, timing in current["results"].items():
+        base = baseline["results"].get(name)
+        if base is None:
+            rows.append((name, timing["median_s"], None, None))
+            continue
+        ratio = timing["median_s"] / base["median_s"] if base["median_s"] else float("inf")
+        rows.append((name, timing["median_s"], base["median_s"], ratio))
+        if ratio > tolerance and timing["median_s"] - base["median_s"] > MIN_DELTA_S:
+            regressions.append(name)
+    return rows, regressions
+
+
+def _fmt_time(seconds):
+    if seconds is None:
+        return "-"
+    if seconds >= 1:
+        return f"{seconds:.2f} s"
+    if seconds >= 1e-3:
+        return f"{seconds * 1e3:.2f} ms"
+    return f"{seconds * 1e6:.1f} us"
+
+
+def print_results(current, rows=None):
+    if rows is None:
+        rows = [(name, t["median_s"], None, None) for name, t in current["results"].items()]
+    width = max(len(row[0]) for row in rows) + 2
+    print(f"{'case':<{width}}{'median':>12}{'baseline':>12}{'ratio':>8}")
+    for name, median, base, ratio in rows:
+        ratio_str = f"{ratio:.2f}x" if ratio is not None else "-"
+        print(f"{name:<{width}}{_fmt_time(median):>12}{_fmt_time(base):>12}{ratio_str:>8}")
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Run annotator micro-benchmarks.")
+    parser.add_argument("--sizes", type=int, nargs="+", default=list(DEFAULT_SIZES),
+                        help="Events per synthetic game (default: 1000 10000 100000)")
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--output", default=None, help="Write results JSON here")
+    parser.add_argument("--baseline", default=str(DEFAULT_BASELINE), help="Baseline JSON to compare against / save to")
+    parser.add_argument("--save-baseline", action="store_true", help="Store these results as the baseline")
+    parser.add_argument("--compare", action="store_true", help="Exit 1 if any case regressed past --tolerance")
+    parser.add_argument("--tolerance", type=float, default=1.5, help="Allowed slowdown ratio (default 1.5)")
+    args = parser.parse_args()
+
+    current = run(args.sizes, seed=args.seed)
+
+    if args.output:
+        with open(args.output, "w") as f:
+            json.dump(current, f, indent=2, sort_keys=True)
+
+    if args.save_baseline:
+        os.makedirs(os.path.dirname(args.baseline), exist_ok=True)
+        with open(args.baseline, "w") as f:
+            json.dump(current, f, indent=2, sort_keys=True)
+        print(f"Baseline saved to {args.baseline}")
+
+    if not args.compare:
+        print_results(current)
+        return
+
+    try:
+        with open(args.baseline) as f:
+            baseline = json.load(f)
+    except FileNotFoundError:
+        print(f"No baseline at {args.baseline}; run with --save-baseline first.")
+        raise SystemExit(2)
+
+    rows, regressions = compare(current, baseline, args.tolerance)
+    print_results(current, rows)
+    if regressions:
+        print(f"\n{len(regressions)} regression(s) beyond {args.tolerance:.2f}x:")
+        for name in regressions:
+            print(f"  {name}")
+        raise SystemExit(1)
+    print("\nNo regressions.")
+
+
+if __name__ == "__main__":
+    main()
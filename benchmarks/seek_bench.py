@@ -0,0 +1,151 @@
+"""Random-access seek benchmark for the OpenCV decoders (frame stepper, clip review, export, scan, motion index).
+
+Writes a synthetic long-GOP H.264 video with ffmpeg, decodes it once from
+start to end to get a checksum per frame, then seeks to random frames with
+each strategy and reports the time of seek + read() and how many reads
+returned the requested frame.
+
+    python benchmarks/seek_bench.py
+    python benchmarks/seek_bench.py --seconds 120 --gop 250 --seeks 50 --output seek.json
+
+Strategies:
+    pos_frames           cap.set(CAP_PROP_POS_FRAMES, target)
+    pos_frames_keyframe  CAP_PROP_POS_FRAMES to the keyframe at or before target, then grab() up to it
+    msec_keyframe        CAP_PROP_POS_MSEC to that keyframe's time, then grab() up to the target
+
+Needs OpenCV and ffmpeg.
+"""
+
+import argparse
+import hashlib
+import json
+import os
+import random
+import shutil
+import statistics
+import subprocess
+import sys
+import tempfile
+import time
+
+VIDEO_FPS = 25
+VIDEO_SIZE = (640, 360)
+
+
+def make_video(path, seconds, gop):
+    """Synthetic test pattern with a keyframe exactly every `gop` frames."""
+    width, height = VIDEO_SIZE
+    subprocess.run(
+        [
+            "ffmpeg", "-v", "error", "-y",
+            "-f", "lavfi", "-i", f"testsrc=size={width}x{height}:rate={VIDEO_FPS}",
+            "-t", str(seconds), "-c:v", "libx264", "-preset", "ultrafast",
+            "-g", str(gop), "-keyint_min", str(gop), "-sc_threshold", "0",
+            "-pix_fmt", "yuv420p", path,
+        ],
+        check=True,
+    )
+    return path
+
+
+def frame_checksums(cv2, path):
+    cap = cv2.VideoCapture(path)
+    checksums = []
+    while True:
+        ok, frame = cap.read()
+        if not ok:
+            break
+        checksums.append(hashlib.md5(frame.tobytes()).digest())
+    cap.release()
+    return checksums
+
+
+def _grab(cap, count):
+    for _ in range(count):
+        if not cap.grab():
+            break
+
+
+def seek_pos_frames(cv2, cap, target, gop):
+    cap.set(cv2.CAP_PROP_POS_FRAMES, target)
+
+
+def seek_pos_frames_keyframe(cv2, cap, target, gop):
+    keyframe = target - target % gop
+    cap.set(cv2.CAP_PROP_POS_FRAMES, keyframe)
+    _grab(cap, target - keyframe)
+
+
+def seek_msec_keyframe(cv2, cap, target, gop):
+    keyframe = target - target % gop
+    cap.set(cv2.CAP_PROP_POS_MSEC, keyframe * 1000.0 / VIDEO_FPS)
+    _grab(cap, target - keyframe)
+
+
+STRATEGIES = {
+    "pos_frames": seek_pos_frames,
+    "pos_frames_keyframe": seek_pos_frames_keyframe,
+    "msec_keyframe": seek_msec_keyframe,
+}
+
+
+def run_strategy(cv2, path, seek, targets, checksums, gop):
+    cap = cv2.VideoCapture(path)
+    samples = []
+    exact = 0
+    for target in targets:
+        start = time.perf_counter()
+        seek(cv2, cap, target, gop)
+        ok, frame = cap.read()
+        samples.append(time.perf_counter() - start)
+        if ok and hashlib.md5(frame.tobytes()).digest() == checksums[target]:
+            exact += 1
+    cap.release()
+    return {
+        "median_ms": statistics.median(samples) * 1000.0,
+        "max_ms": max(samples) * 1000.0,
+        "exact": exact,
+        "seeks": len(targets),
+    }
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--seconds", type=int, default=60, help="length of the synthetic video")
+    parser.add_argument("--gop", type=int, default=250, help="frames between keyframes")
+    parser.add_argument("--seeks", type=int, default=30, help="random targets per strategy")
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--output", help="also write the results as JSON")
+    args = parser.parse_args(argv)
+
+    if not shutil.which("ffmpeg"):
+        print("ffmpeg is required to write the long-GOP test video")
+        return 1
+    import cv2
+
+    workdir = tempfile.mkdtemp(prefix="seek_bench_")
+    try:
+        path = make_video(os.path.join(workdir, "seek.mp4"), args.seconds, args.gop)
+        checksums = frame_checksums(cv2, path)
+        rng = random.Random(args.seed)
+        targets = [rng.randrange(len(checksums)) for _ in range(args.seeks)]
+
+        results = {}
+        print(f"{len(checksums)} frames, keyframe every {args.gop}, {len(targets)} seeks")
+        print(f"{'strategy':<22}{'median ms':>11}{'max ms':>10}{'exact':>10}")
+        for name, seek in STRATEGIES.items():
+            result = run_strategy(cv2, path, seek, targets, checksums, args.gop)
+            results[name] = result
+            print(f"{name:<22}{result['median_ms']:>11.1f}{result['max_ms']:>10.1f}"
+                  f"{result['exact']:>6}/{result['seeks']}")
+    finally:
+        shutil.rmtree(workdir, ignore_errors=True)
+
+    if args.output:
+        with open(args.output, "w") as f:
+            json.dump({"frames": len(checksums), "gop": args.gop, "fps": VIDEO_FPS, "results": results}, f, indent=2)
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,110 @@
+"""Synthetic game annotation files for benchmarks.
+
+Writes files in the annotator's own save format (see ListManager.save_file):
+events spread over two 20-minute halves at 25 fps, labels drawn from
+Annotation/config/classes.json with a skewed (Zipf-like) mix so common
+actions such as passes and shots dominate, subtypes where the config has them.
+
+    python benchmarks/synthetic.py 10000 /tmp/game_10k.json
+"""
+
+import argparse
+import json
+import random
+from pathlib import Path
+
+CLASSES_PATH = Path(__file__).resolve().parent.parent / "Annotation" / "config" / "classes.json"
+
+HALF_MS = 20 * 60 * 1000
+FRAME_MS = 40
+
+# Labels that dominate real games, weighted up on top of the Zipf mix
+_COMMON = {"Pass Attempt": 8, "Pass Received": 8, "Drive": 4, "On Ball Screen": 4,
+           "2PT Attempt": 3, "3PT Attempt": 3, "Made Shot": 3, "Missed Shot": 3,
+           "Defensive Rebound": 2, "Offensive Rebound": 1.5}
+
+
+def load_classes(path=CLASSES_PATH):
+    with open(path) as f:
+        return json.load(f)
+
+
+def label_weights(labels):
+    return [_COMMON.get(label, 1.0) / (rank + 1) ** 0.3 for rank, label in enumerate(labels)]
+
+
+def _game_time(half, position):
+    seconds = position // 1000
+    return f"{half} - {seconds // 60:02d}:{seconds % 60:02d}"
+
+
+def generate_events(n_events, seed=0, classes=None):
+    """Return `n_events` annotation dicts, half 1 then half 2, each sorted by position."""
+    rng = random.Random(seed)
+    classes = classes or load_classes()
+    labels = classes["labels"]
+    weights = label_weights(labels)
+    subtypes = classes.get("subtypes", {})
+    visibility = classes.get("visibility", ["visible"])
+
+    events = []
+    for half, count in ((1, n_events - n_events // 2), (2, n_events // 2)):
+        positions = sorted(rng.randrange(0, HALF_MS) for _ in range(count))
+        for position in positions:
+            label = rng.choices(labels, weights)[0]
+            options = subtypes.get(label) or ["None"]
+            events.append({
+                "gameTime": _game_time(half, position),
+                "label": label,
+                "subType": rng.choice(options),
+                "visibility": rng.choice(visibility),
+                "position": str(position),
+                "frame": str(position // FRAME_MS),
+                "note": "None",
+            })
+    return events
+
+
+def perturb(events, seed=1, jitter_frames=12, drop_rate=0.1, extra_rate=0.1, relabel_rate=0.05, classes=None):
+    """A second tagger's take on `events`: jittered frames, misses, extras and relabels."""
+    rng = random.Random(seed)
+    classes = classes or load_classes()
+    labels = classes["labels"]
+    out = []
+    for ann in events:
+        if rng.random() < drop_rate:
+            continue
+        ann = dict(ann)
+        frame = max(0, int(ann["frame"]) + rng.randint(-jitter_frames, jitter_frames))
+        ann["frame"] = str(frame)
+        ann["position"] = str(frame * FRAME_MS)
+        if rng.random() < relabel_rate:
+            ann["label"] = rng.choice(labels)
+        out.append(ann)
+    for _ in range(int(len(events) * extra_rate)):
+        half = rng.choice((1, 2))
+        position = rng.randrange(0, HALF_MS)
+        out.append({
+            "gameTime": _game_time(half, position), "label": rng.choice(labels), "subType": "None",
+            "visibility": "visible", "position": str(position), "frame": str(position // FRAME_MS),
+            "note": "None",
+        })
+    return out
+
+
+def write_game(path, events):
+    with open(path, "w") as f:
+        json.dump({"annotations": events}, f, indent=4, sort_keys=True)
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Write a synthetic game annotation file.")
+    parser.add_argument("n_events", type=int)
+    parser.add_argument("output")
+    parser.add_argument("--seed", type=int, default=0)
+    args = parser.parse_args()
+    write_game(args.output, generate_events(args.n_events, seed=args.seed))
+
+
+if __name__ == "__main__":
+    main()